@@ -0,0 +1,83 @@
+"""Benchmark the payload decoders and the raw byte pre-filter.
+
+Replays a capture expanded from the recorded samples, where most devices are on
+the ignore list and some lines are malformed, as on a busy band.
+
+    python -m pytest benchmarks/bench_decode.py -s -o asyncio_mode=auto
+"""
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import orjson
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_IGNORE_DEVICES, CONF_PREFILTER
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+
+from corpus import generate_events
+
+MESSAGES = 100_000
+DEVICES = 1_000
+IGNORED_SHARE = 0.7
+
+
+def _decode_all(loads, payloads) -> float:
+    start = time.perf_counter()
+    for raw in payloads:
+        try:
+            loads(raw)
+        except ValueError:
+            pass
+    return time.perf_counter() - start
+
+
+async def _replay(manager, messages) -> float:
+    start = time.perf_counter()
+    for msg in messages:
+        await manager.async_process_message(msg)
+    return time.perf_counter() - start
+
+
+async def test_decode_and_prefilter(hass: HomeAssistant) -> None:
+    """Report decoder and pre-filter throughput."""
+    payloads, unique_ids = generate_events(MESSAGES, DEVICES)
+    ignored = int(DEVICES * IGNORED_SHARE)
+    for unique_id in unique_ids[ignored:]:
+        MockConfigEntry(
+            domain=DOMAIN, unique_id=unique_id, data={"unique_id": unique_id, "model": "bench"}
+        ).add_to_hass(hass)
+
+    stdlib = _decode_all(json.loads, payloads)
+    fast = _decode_all(orjson.loads, payloads)
+
+    messages = [SimpleNamespace(topic="rtl_433/bench/events", payload=raw) for raw in payloads]
+    lines = [
+        f"\n{MESSAGES} messages, {DEVICES} devices, {IGNORED_SHARE:.0%} ignored",
+        f"  json.loads:   {MESSAGES / stdlib:10.0f} msg/s",
+        f"  orjson.loads: {MESSAGES / fast:10.0f} msg/s ({stdlib / fast:.2f}x)",
+    ]
+    for name, loads in (("orjson", orjson.loads), ("json", json.loads)):
+        results = {}
+        for prefilter in (False, True):
+            bridge = MagicMock()
+            bridge.entry_id = "bench_bridge"
+            bridge.options = {
+                CONF_IGNORE_DEVICES: ", ".join(unique_ids[:ignored]),
+                CONF_PREFILTER: prefilter,
+            }
+            manager = Rtl433DiscoveryManager(hass, bridge)
+            with patch("custom_components.rtl_433_discover.discovery_manager.json_loads", loads), \
+                 patch("custom_components.rtl_433_discover.discovery_manager.JSONDecodeError", ValueError):
+                # Warm the route table so both runs measure the steady state
+                await _replay(manager, messages[:10_000])
+                results[prefilter] = await _replay(manager, messages)
+            manager.async_shutdown()
+        lines.append(
+            f"  manager ({name}): {MESSAGES / results[False]:10.0f} msg/s, "
+            f"with prefilter {MESSAGES / results[True]:10.0f} msg/s "
+            f"({results[False] / results[True]:.2f}x)"
+        )
+    print("\n".join(lines))
@@ -0,0 +1,163 @@
+"""Replay rtl_433 traffic through the whole ingest path of a running bridge.
+
+Messages go through the bridge's ingest queue, exactly like the MQTT callback
+queues them, and are processed by its worker into real sensor entities of an
+in-process Home Assistant. Every run reports
+
+  - messages/s
+  - event loop lag, seen by a task that asks to wake up every LAG_INTERVAL
+  - state writes per message
+  - peak memory of the replay (tracemalloc, on a separate cold run)
+
+The capture is generated from the recorded samples unless BENCH_CAPTURE points
+to a real `rtl_433 -F json` capture. Configuration is read from the environment:
+
+    BENCH_SIZES=1000,100000,1000000 BENCH_DEVICES=1000 BENCH_IGNORED=300 \\
+        python -m pytest benchmarks/bench_ingest.py -s -o asyncio_mode=auto
+"""
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant, StateMachine
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import (
+    DOMAIN,
+    CONF_TOPIC_PREFIX,
+    CONF_IGNORE_DEVICES,
+    CONF_HOST_DEVICES,
+    CONF_QUEUE_SIZE,
+    CONF_OVERFLOW,
+)
+from custom_components.rtl_433_discover.fields import FIELDS
+from custom_components.rtl_433_discover.pipeline import OVERFLOW_DROP_OLDEST
+
+from corpus import generate_events, load_capture
+
+SIZES = [int(size) for size in os.environ.get("BENCH_SIZES", "1000,100000,1000000").split(",")]
+DEVICES = int(os.environ.get("BENCH_DEVICES", "1000"))
+IGNORED = int(os.environ.get("BENCH_IGNORED", "300"))
+CAPTURE = os.environ.get("BENCH_CAPTURE")
+
+QUEUE_SIZE = 10_000
+# The producer waits for the worker above this depth, nothing is ever dropped
+MAX_DEPTH = QUEUE_SIZE // 2
+LAG_INTERVAL = 0.005
+BRIDGE_ID = "bench_bridge"
+
+
+def _capture(size: int) -> tuple[list[bytes], list[str], dict[str, dict]]:
+    """Return payloads, unique ids and the hosted membership of the configured devices."""
+    if CAPTURE:
+        payloads, unique_ids = load_capture(CAPTURE, size)
+    else:
+        payloads, unique_ids = generate_events(size, DEVICES)
+    members = {}
+    for raw in payloads[:100_000]:
+        try:
+            event = json.loads(raw)
+        except ValueError:
+            continue
+        unique_id = f"{event['model']}-{event['id']}"
+        if unique_id not in members:
+            members[unique_id] = {"model": event["model"], "keys": sorted(event.keys() & FIELDS.keys())}
+    for unique_id in unique_ids[:IGNORED]:
+        members.pop(unique_id, None)
+    return payloads, unique_ids, members
+
+
+async def _setup_bridge(hass: HomeAssistant, hass_storage, unique_ids, members):
+    """Set up a bridge hosting all devices that are not ignored."""
+    hass_storage[f"{DOMAIN}.{BRIDGE_ID}.devices"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{BRIDGE_ID}.devices",
+        "data": {"enabled": True, "devices": members},
+    }
+    bridge = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id=BRIDGE_ID,
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={
+            CONF_IGNORE_DEVICES: ", ".join(unique_ids[:IGNORED]),
+            CONF_HOST_DEVICES: True,
+            CONF_QUEUE_SIZE: QUEUE_SIZE,
+            CONF_OVERFLOW: OVERFLOW_DROP_OLDEST,
+        },
+    )
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][bridge.entry_id]
+
+
+async def _replay(manager, messages) -> float:
+    """Queue all messages and wait until the worker processed them."""
+    queue = manager.queue
+    done = manager.counters["messages"] + len(messages)
+    start = time.perf_counter()
+    for index, msg in enumerate(messages):
+        queue.async_put(msg)
+        if index % 100 == 0:
+            while queue.depth > MAX_DEPTH:
+                await asyncio.sleep(0)
+    while manager.counters["messages"] < done:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    assert queue.dropped == 0
+    return elapsed
+
+
+@pytest.mark.parametrize("size", SIZES)
+async def test_ingest(hass: HomeAssistant, hass_storage, mqtt_mock, size: int) -> None:
+    """Report throughput, loop lag, state writes and peak memory for one capture size."""
+    payloads, unique_ids, members = _capture(size)
+    manager = await _setup_bridge(hass, hass_storage, unique_ids, members)
+    messages = [SimpleNamespace(topic="rtl_433/bench/events", payload=raw) for raw in payloads]
+
+    # Cold run: routes and first states are built, memory is what the replay allocates
+    tracemalloc.start()
+    await _replay(manager, messages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    lags = []
+    running = True
+
+    async def _probe():
+        loop = asyncio.get_running_loop()
+        while running:
+            start = loop.time()
+            await asyncio.sleep(LAG_INTERVAL)
+            lags.append(loop.time() - start - LAG_INTERVAL)
+
+    writes = 0
+    async_set = StateMachine.async_set
+
+    def _counting_async_set(self, *args, **kwargs):
+        nonlocal writes
+        writes += 1
+        return async_set(self, *args, **kwargs)
+
+    # Warm run: steady state throughput
+    probe = hass.async_create_task(_probe())
+    with patch.object(StateMachine, "async_set", _counting_async_set):
+        elapsed = await _replay(manager, messages)
+    running = False
+    await probe
+
+    lags.sort()
+    p99 = lags[min(int(len(lags) * 0.99), len(lags) - 1)] if lags else 0.0
+    print(
+        f"\n{size} messages, {len(unique_ids)} devices ({len(members)} configured, {IGNORED} ignored)"
+        f"{f', capture {CAPTURE}' if CAPTURE else ''}\n"
+        f"  throughput:   {size / elapsed:10.0f} msg/s\n"
+        f"  loop lag:     p99 {p99 * 1000:.1f} ms, max {(lags[-1] if lags else 0) * 1000:.1f} ms\n"
+        f"  state writes: {writes / size:10.2f} per message\n"
+        f"  peak memory:  {peak / 1024 / 1024:10.1f} MiB"
+    )
@@ -0,0 +1,89 @@
+"""Memory used by the devices and entities of a bridge hosting many devices.
+
+Every device gets the keys of one of the recorded samples, so a fleet is a mix
+of thermometers, weather stations, TPMS and meters. The bridge is set up
+hosting all of them and each device sends one packet. Reported per fleet size:
+
+  - traced memory after the setup, and after the first packet of every device
+  - the same divided by devices and by entities
+
+Fleet sizes are read from the environment:
+
+    BENCH_FLEETS=1000,5000 python -m pytest benchmarks/bench_memory.py -s -o asyncio_mode=auto
+"""
+import json
+import os
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX, CONF_HOST_DEVICES, DATA_DEVICES
+from custom_components.rtl_433_discover.fields import FIELDS
+
+from corpus import load_samples
+
+FLEETS = [int(size) for size in os.environ.get("BENCH_FLEETS", "1000,5000").split(",")]
+BRIDGE_ID = "bench_bridge"
+
+
+def _fleet(devices: int) -> tuple[dict[str, dict], list[bytes]]:
+    """Return the hosted membership and one packet per device."""
+    samples = load_samples()
+    members = {}
+    payloads = []
+    for number in range(devices):
+        template = samples[number % len(samples)]
+        device_id = f"{number:08x}" if isinstance(template["id"], str) else 1000 + number
+        members[f"{template['model']}-{device_id}"] = {
+            "model": template["model"],
+            "keys": sorted(template.keys() & FIELDS.keys()),
+        }
+        payloads.append(json.dumps(dict(template, id=device_id)).encode())
+    return members, payloads
+
+
+@pytest.mark.parametrize("devices", FLEETS)
+async def test_memory(hass: HomeAssistant, hass_storage, mqtt_mock, devices: int) -> None:
+    """Report the memory of the devices and their entities."""
+    members, payloads = _fleet(devices)
+    entities = sum(len(member["keys"]) for member in members.values())
+    hass_storage[f"{DOMAIN}.{BRIDGE_ID}.devices"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{BRIDGE_ID}.devices",
+        "data": {"enabled": True, "devices": members},
+    }
+    bridge = MockConfigEntry(
+        domain=DOMAIN,
+        entry_id=BRIDGE_ID,
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={CONF_HOST_DEVICES: True},
+    )
+    bridge.add_to_hass(hass)
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    setup, _ = tracemalloc.get_traced_memory()
+
+    manager = hass.data[DOMAIN][bridge.entry_id]
+    for raw in payloads:
+        await manager.async_process_message(SimpleNamespace(topic="rtl_433/bench/events", payload=raw))
+    await hass.async_block_till_done()
+    running, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(hass.data[DATA_DEVICES]) == devices
+    assert sum(len(device.sensors) for device in hass.data[DATA_DEVICES].values()) == entities
+
+    for label, current in (("after setup", setup), ("after packets", running)):
+        used = current - baseline
+        print(
+            f"\n{devices} devices, {entities} entities, {label}\n"
+            f"  total:        {used / 1024 / 1024:10.1f} MiB\n"
+            f"  per device:   {used / devices / 1024:10.1f} KiB\n"
+            f"  per entity:   {used / entities / 1024:10.1f} KiB"
+        )
@@ -0,0 +1,114 @@
+"""Microbenchmark for the known-device routing path.
+
+Compares the original per-message path (ignore list re-parse, config entry lookup,
+signal string formatting and one dispatcher signal per key for every packet) against
+the cached route table feeding the device object, with 10k configured devices.
+
+    python -m pytest benchmarks/bench_routing.py -s -o asyncio_mode=auto
+"""
+import json
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_IGNORE_DEVICES
+from custom_components.rtl_433_discover.device import async_get_device
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+
+DEVICES = 10_000
+MESSAGES = 50_000
+IGNORE_LIST = ", ".join(str(i) for i in range(900_000, 900_300))
+SIGNAL_UPDATE_SENSOR = "rtl_433_discover_update_sensor"
+# The hand-maintained key list the original path filtered on
+TRACKED_KEYS = [
+    "temperature_C", "humidity", "wind_max_m_s", "wind_avg_m_s", "wind_dir_deg",
+    "rain_mm", "light_klx", "light_lux", "uv", "battery_ok",
+]
+
+
+class _CountingSensor:
+    """Stands in for Rtl433Sensor, so both paths end in a no-op update."""
+
+    def __init__(self, counter):
+        self.async_set_value = counter
+
+
+def _payload(device_id: int) -> str:
+    return json.dumps({
+        "time": "2025-12-14 13:28:51", "model": "Bresser-7in1", "id": device_id,
+        "temperature_C": 14.3, "humidity": 76, "wind_max_m_s": 3.9, "wind_avg_m_s": 3.8,
+        "wind_dir_deg": 54, "rain_mm": 0, "light_klx": 14.135, "light_lux": 14135.0,
+        "uv": 0.6, "battery_ok": 1, "mic": "CRC",
+    })
+
+
+async def _legacy_process_message(hass, entry, msg):
+    """The original hot path, kept here as the baseline."""
+    payload = json.loads(msg.payload)
+    model = payload.get("model")
+    device_id = payload.get("id")
+    unique_device_id = f"{model}-{device_id}"
+    ignore_str = entry.options.get(CONF_IGNORE_DEVICES, "")
+    ignored = [x.strip() for x in ignore_str.split(",") if x.strip()] if ignore_str else []
+    if unique_device_id in ignored or str(device_id) in ignored:
+        return
+    if hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_device_id):
+        for key, value in payload.items():
+            if key in TRACKED_KEYS:
+                unique_sensor_id = f"{unique_device_id}_{key}"
+                async_dispatcher_send(hass, f"{SIGNAL_UPDATE_SENSOR}_{unique_sensor_id}", value)
+
+
+async def test_route_cache_throughput(hass: HomeAssistant) -> None:
+    """Report messages/second before and after the route cache."""
+    updates = 0
+
+    @callback
+    def _update(value, throttle=None):
+        nonlocal updates
+        updates += 1
+
+    for device_id in range(DEVICES):
+        unique_id = f"Bresser-7in1-{device_id}"
+        MockConfigEntry(
+            domain=DOMAIN, unique_id=unique_id, data={"unique_id": unique_id, "model": "Bresser-7in1"}
+        ).add_to_hass(hass)
+        device = async_get_device(hass, unique_id, "Bresser-7in1")
+        for key in TRACKED_KEYS:
+            async_dispatcher_connect(hass, f"{SIGNAL_UPDATE_SENSOR}_{unique_id}_{key}", _update)
+            device.sensors[key] = _CountingSensor(_update)
+
+    bridge = MagicMock()
+    bridge.entry_id = "bench_bridge"
+    bridge.options = {CONF_IGNORE_DEVICES: IGNORE_LIST}
+    manager = Rtl433DiscoveryManager(hass, bridge)
+
+    rnd = random.Random(433)
+    payloads = [_payload(i) for i in range(DEVICES)]
+    messages = [
+        SimpleNamespace(topic="rtl_433/bench/events", payload=payloads[rnd.randrange(DEVICES)])
+        for _ in range(MESSAGES)
+    ]
+
+    start = time.perf_counter()
+    for msg in messages:
+        await _legacy_process_message(hass, bridge, msg)
+    legacy = time.perf_counter() - start
+    legacy_updates, updates = updates, 0
+
+    start = time.perf_counter()
+    for msg in messages:
+        await manager.async_process_message(msg)
+    cached = time.perf_counter() - start
+
+    assert updates == legacy_updates == MESSAGES * len(TRACKED_KEYS)
+    print(
+        f"\n{DEVICES} devices, {MESSAGES} messages\n"
+        f"  legacy: {MESSAGES / legacy:10.0f} msg/s\n"
+        f"  routed: {MESSAGES / cached:10.0f} msg/s ({legacy / cached:.2f}x)"
+    )
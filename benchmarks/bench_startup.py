@@ -0,0 +1,143 @@
+"""Startup cost of the integration with many device entries.
+
+Reported per number of device entries:
+
+  - import time of the integration package, in a fresh interpreter with
+    Home Assistant's core already imported (what a boot pays on top)
+  - time from loading the integration to the first device state, and to the
+    states of all entities, with every entry set up the way a boot does it,
+    once with one config entry per device and once with the devices hosted by
+    the bridge
+  - the slowest calls of the setup, with BENCH_PROFILE=1
+
+Numbers of entries are read from the environment:
+
+    BENCH_ENTRIES=100,500,1000 python -m pytest benchmarks/bench_startup.py -s -o asyncio_mode=auto
+"""
+import cProfile
+import os
+import pstats
+import subprocess
+import sys
+import time
+
+import pytest
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX, CONF_KEYS, CONF_HOST_DEVICES
+from custom_components.rtl_433_discover.fields import FIELDS
+
+from corpus import load_samples
+
+ENTRIES = [int(size) for size in os.environ.get("BENCH_ENTRIES", "100,500,1000").split(",")]
+PROFILE = os.environ.get("BENCH_PROFILE") == "1"
+IMPORT_RUNS = 5
+BRIDGE_ID = "bench_bridge"
+
+IMPORT_SCRIPT = """
+import time
+import homeassistant.config_entries, homeassistant.helpers.entity_platform
+start = time.perf_counter()
+import custom_components.rtl_433_discover
+print(time.perf_counter() - start)
+"""
+
+
+@pytest.fixture(autouse=True)
+def enable_event_loop_debug(event_loop):
+    """Run without asyncio debug mode, its stack captures would dwarf the setup."""
+    event_loop.set_debug(False)
+
+
+def _import_time() -> float:
+    """Return the best import time of the package over a few fresh interpreters."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [
+        float(subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT], cwd=root, capture_output=True, text=True, check=True
+        ).stdout)
+        for _ in range(IMPORT_RUNS)
+    ]
+    return min(runs)
+
+
+def test_import_time() -> None:
+    """Report the import time of the package."""
+    print(f"\nimport: {_import_time() * 1000:8.1f} ms")
+
+
+def _add_devices(hass: HomeAssistant, hass_storage, count: int, hosted: bool) -> int:
+    """Add a bridge and count devices, return the number of entities they have."""
+    samples = load_samples()
+    entities = 0
+    members = {}
+    for number in range(count):
+        template = samples[number % len(samples)]
+        unique_id = f"{template['model']}-{1000 + number}"
+        keys = sorted(template.keys() & FIELDS.keys())
+        entities += len(keys)
+        if hosted:
+            members[unique_id] = {"model": template["model"], "keys": keys}
+            continue
+        MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=unique_id,
+            data={"unique_id": unique_id, "model": template["model"], CONF_KEYS: keys},
+        ).add_to_hass(hass)
+    if hosted:
+        hass_storage[f"{DOMAIN}.{BRIDGE_ID}.devices"] = {
+            "version": 1,
+            "key": f"{DOMAIN}.{BRIDGE_ID}.devices",
+            "data": {"enabled": True, "devices": members},
+        }
+    MockConfigEntry(
+        domain=DOMAIN,
+        entry_id=BRIDGE_ID,
+        title="rtl_433 Bridge",
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={CONF_HOST_DEVICES: hosted},
+    ).add_to_hass(hass)
+    return entities
+
+
+@pytest.mark.parametrize("hosted", [False, True], ids=["entries", "hosted"])
+@pytest.mark.parametrize("count", ENTRIES)
+async def test_startup(hass: HomeAssistant, hass_storage, mqtt_mock, count: int, hosted: bool) -> None:
+    """Report the time from loading the integration to the states of its devices."""
+    entities = _add_devices(hass, hass_storage, count, hosted)
+    first = last = None
+    written = set()
+
+    @callback
+    def _state_changed(event) -> None:
+        nonlocal first, last
+        entity_id = event.data["entity_id"]
+        if entity_id.startswith("sensor.") and "rtl_433_bridge" not in entity_id and entity_id not in written:
+            last = time.perf_counter()
+            first = first or last
+            written.add(entity_id)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    profiler = cProfile.Profile() if PROFILE else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    if profiler:
+        profiler.disable()
+    done = time.perf_counter()
+
+    assert len(written) == entities
+    print(
+        f"\n{count} devices {'hosted by the bridge' if hosted else 'with their own entry'}, {entities} entities\n"
+        f"  first state:  {(first - start) * 1000:8.0f} ms\n"
+        f"  all states:   {(last - start) * 1000:8.0f} ms\n"
+        f"  setup done:   {(done - start) * 1000:8.0f} ms"
+    )
+    if profiler:
+        stats = pstats.Stats(profiler).sort_stats(os.environ.get("BENCH_SORT", "cumulative"))
+        stats.print_stats(os.environ.get("BENCH_FILTER", ""), 25)
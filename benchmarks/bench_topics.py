@@ -0,0 +1,111 @@
+"""Benchmark events routing against per-field topic routing on the same traffic.
+
+The capture is expanded from the recorded samples and replayed twice: once as
+`rtl_433/<host>/events` JSON, once as the per-field topics rtl_433 publishes
+for the same packets. All devices are configured, so both paths end in the
+same sensor updates. The MQTT client's own cost per message is not included,
+and the topic mode receives one message per field instead of one per packet.
+
+    python -m pytest benchmarks/bench_topics.py -s -o asyncio_mode=auto
+"""
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_DEVICE_TOPIC, DATA_DEVICES
+from custom_components.rtl_433_discover.device import async_get_device
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+from custom_components.rtl_433_discover.fields import FIELDS
+
+from corpus import generate_events
+
+PACKETS = 50_000
+DEVICES = 1_000
+DEVICE_TOPIC = "rtl_433/bench/devices"
+# Levels rtl_433 puts between the devices prefix and the field, the ones a packet has
+TOPIC_LEVELS = ("type", "model", "subtype", "channel", "id")
+
+
+class _CountingSensor:
+    """Stands in for Rtl433Sensor, so both paths end in a no-op update."""
+
+    def __init__(self, counter):
+        self.async_set_value = counter
+
+
+def _field_messages(payload: bytes) -> list[SimpleNamespace]:
+    """Return the per-field messages rtl_433 publishes for one event."""
+    event = json.loads(payload)
+    path = "/".join(str(event[level]) for level in TOPIC_LEVELS if level in event)
+    return [
+        SimpleNamespace(topic=f"{DEVICE_TOPIC}/{path}/{key}", payload=str(value).encode())
+        for key, value in event.items()
+        if key != "time"
+    ]
+
+
+def _manager(hass: HomeAssistant, options: dict) -> Rtl433DiscoveryManager:
+    bridge = MagicMock()
+    bridge.entry_id = "bench_bridge"
+    bridge.options = options
+    manager = Rtl433DiscoveryManager(hass, bridge)
+    manager.device_topic = options.get(CONF_DEVICE_TOPIC)
+    return manager
+
+
+async def test_events_vs_device_topics(hass: HomeAssistant) -> None:
+    """Report packets/second for both subscription modes."""
+    updates = 0
+
+    def _update(value, throttle=None):
+        nonlocal updates
+        updates += 1
+
+    payloads, unique_ids = generate_events(PACKETS, DEVICES, malformed_ratio=0)
+    keys = {}
+    for payload in payloads:
+        event = json.loads(payload)
+        keys.setdefault(f"{event['model']}-{event['id']}", event.keys() & FIELDS.keys())
+    for unique_id in unique_ids:
+        model = unique_id.rsplit("-", 1)[0]
+        MockConfigEntry(
+            domain=DOMAIN, unique_id=unique_id, data={"unique_id": unique_id, "model": model}
+        ).add_to_hass(hass)
+        device = async_get_device(hass, unique_id, model)
+        for key in keys.get(unique_id, ()):
+            device.sensors[key] = _CountingSensor(_update)
+
+    events = [SimpleNamespace(topic="rtl_433/bench/events", payload=payload) for payload in payloads]
+    fields = [msg for payload in payloads for msg in _field_messages(payload)]
+
+    manager = _manager(hass, {})
+    start = time.perf_counter()
+    for msg in events:
+        await manager.async_process_message(msg)
+    events_time = time.perf_counter() - start
+    events_updates, updates = updates, 0
+    # The second pass starts from the same plausibility check state as the first
+    for device in hass.data[DATA_DEVICES].values():
+        device.last_seen = None
+        device.readings.clear()
+        device.strikes.clear()
+
+    manager = _manager(hass, {CONF_DEVICE_TOPIC: DEVICE_TOPIC})
+    start = time.perf_counter()
+    for msg in fields:
+        manager.async_field_received(msg)
+    fields_time = time.perf_counter() - start
+
+    assert updates == events_updates
+    # Field messages are counted before the plausibility checks
+    assert manager.counters["field_updates"] == updates + manager.counters["rejected"]
+    print(
+        f"\n{DEVICES} devices, {PACKETS} packets, {len(fields)} field messages, {updates} sensor updates\n"
+        f"  events:        {PACKETS / events_time:10.0f} packets/s\n"
+        f"  device topics: {PACKETS / fields_time:10.0f} packets/s ({events_time / fields_time:.2f}x),"
+        f" {len(fields) / fields_time:.0f} messages/s"
+    )
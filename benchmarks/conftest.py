@@ -0,0 +1,12 @@
+"""Fixtures for the rtl_433_discover benchmarks.
+
+Benchmarks are not collected by a plain `pytest` run, call them explicitly:
+
+    python -m pytest benchmarks/bench_routing.py -s -o asyncio_mode=auto
+"""
+import pytest
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations defined in the test dir."""
+    yield
@@ -0,0 +1,68 @@
+"""Replayable rtl_433 traffic for the benchmarks.
+
+`data/sample_events.jsonl` holds real `rtl_433 -F json` lines from a range of
+device types. `generate_events` expands them into a capture of any size by
+spreading the samples over a number of device ids and jittering the readings,
+with a share of malformed lines like the ones seen after a receiver restart.
+`load_capture` replays a capture recorded with `rtl_433 -F json > capture.jsonl`.
+"""
+from __future__ import annotations
+
+import json
+import random
+from itertools import cycle, islice
+from pathlib import Path
+
+SAMPLE_FILE = Path(__file__).parent / "data" / "sample_events.jsonl"
+
+
+def load_samples() -> list[dict]:
+    """Return the recorded sample events."""
+    with SAMPLE_FILE.open(encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def generate_events(
+    count: int, devices: int, malformed_ratio: float = 0.02, seed: int = 433
+) -> tuple[list[bytes], list[str]]:
+    """Return (payloads, unique ids of the simulated devices)."""
+    rnd = random.Random(seed)
+    samples = load_samples()
+    fleet = []
+    for number in range(devices):
+        template = samples[number % len(samples)]
+        device_id = (
+            f"{number:08x}" if isinstance(template["id"], str) else 1000 + number
+        )
+        fleet.append((template, device_id))
+
+    payloads = []
+    for _ in range(count):
+        if rnd.random() < malformed_ratio:
+            payloads.append(rnd.choice(
+                (b'{"time":"2025-12-14 13:29:0', b"rtl_433 version 23.11 starting", b"")
+            ))
+            continue
+        template, device_id = fleet[rnd.randrange(devices)]
+        event = dict(template, id=device_id)
+        for key, value in template.items():
+            if isinstance(value, float):
+                event[key] = round(value + rnd.uniform(-0.5, 0.5), 1)
+        payloads.append(json.dumps(event, separators=(",", ":")).encode())
+
+    return payloads, [f"{template['model']}-{device_id}" for template, device_id in fleet]
+
+
+def load_capture(path: str | Path, count: int) -> tuple[list[bytes], list[str]]:
+    """Return count lines of a recorded capture, repeated if it is shorter, and its unique ids."""
+    with Path(path).open("rb") as file:
+        lines = [line.rstrip(b"\r\n") for line in file if line.strip()]
+    unique_ids = {}
+    for line in lines:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and event.get("model") and event.get("id") is not None:
+            unique_ids.setdefault(f"{event['model']}-{event['id']}", None)
+    return list(islice(cycle(lines), count)), list(unique_ids)
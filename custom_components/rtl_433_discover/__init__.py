@@ -1,13 +1,24 @@
 """The rtl_433 Discovery integration."""
+import asyncio
+from importlib import import_module
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, SIGNAL_CONFIG_ENTRY_CHANGED
 from homeassistant.const import Platform
-from homeassistant.components import mqtt
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, CONF_TOPIC_PREFIX
-from .discovery_manager import Rtl433DiscoveryManager
+from .cache import async_get_cache
+from .const import (
+    DOMAIN,
+    CONF_TOPIC_PREFIX,
+    CONF_HOST_DEVICES,
+    CONF_QUEUE_SIZE,
+    DEFAULT_QUEUE_SIZE,
+    DATA_CACHE,
+    DATA_DEVICES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,20 +31,56 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if CONF_TOPIC_PREFIX in entry.data:
         # This is the Bridge (Listener) Entry
+        # Only the bridge needs the manager, device entries set up without importing it.
+        # It pulls in the MQTT helpers, loaded in the executor instead of on the event loop.
+        await hass.async_add_import_executor_job(import_module, f"{__name__}.discovery_manager")
+        from .discovery_manager import Rtl433DiscoveryManager # pylint: disable=import-outside-toplevel
+        from .hosted import async_migrate_to_entries, async_migrate_to_hosted # pylint: disable=import-outside-toplevel
+
         manager = Rtl433DiscoveryManager(hass, entry)
         hass.data[DOMAIN][entry.entry_id] = manager
-        
-        topic_prefix = entry.data[CONF_TOPIC_PREFIX]
-        
-        async def _mqtt_message_received(msg):
-            """Handle received MQTT message."""
-            await manager.async_process_message(msg)
+        # Sensors of all entries restore from the cache, it is loaded once here,
+        # next to the membership of the hosted devices
+        hosted = manager.hosted
+        await asyncio.gather(async_get_cache(hass), hosted.async_load())
 
-        await mqtt.async_subscribe(hass, topic_prefix, _mqtt_message_received)
-        
-        # Bridge doesn't need to setup platforms, unless it has its own sensors (status etc)
-        # But for now, it just listens and triggers flows.
+        # Switching between hosted devices and one entry per device migrates on the next setup
+        if manager.host_devices and not hosted.enabled:
+            await async_migrate_to_hosted(hass, entry, hosted)
+        elif not manager.host_devices and (hosted.enabled or hosted.devices):
+            await async_migrate_to_entries(hass, entry, hosted)
+        manager.async_load_identity()
         
+        # Processing happens in the ingest worker, the MQTT callback only queues
+        entry.async_create_background_task(
+            hass, manager.queue.async_run(), f"{DOMAIN} ingest {entry.entry_id}"
+        )
+        await manager.async_subscribe()
+        entry.async_on_unload(manager.async_shutdown)
+
+        async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+            """Swap the topic and everything derived from the options in place."""
+            if (
+                entry.options.get(CONF_HOST_DEVICES, False) != manager.host_devices
+                or entry.options.get(CONF_QUEUE_SIZE, DEFAULT_QUEUE_SIZE) != manager.queue.maxsize
+            ):
+                # Entries move between the bridge and device entries, or the queue is rebuilt
+                hass.config_entries.async_schedule_reload(entry.entry_id)
+                return
+            manager.async_update_options()
+            await manager.async_subscribe()
+
+        entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+        manager.availability.async_start()
+        manager.aggregator.async_start()
+        # Device entries being added or removed invalidate the cached routes
+        entry.async_on_unload(
+            async_dispatcher_connect(hass, SIGNAL_CONFIG_ENTRY_CHANGED, manager.async_config_entry_changed)
+        )
+
+        # Bridge diagnostic sensors
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     else:
         # This is a Device Entry
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -45,15 +92,50 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if CONF_TOPIC_PREFIX in entry.data:
         # Unload Bridge
-        # Unsubscribe MQTT is automatic if we used `mqtt.async_subscribe`? 
-        # Actually `mqtt.async_subscribe` returns an unsubscribe callback.
-        # But we didn't store it. 
-        # Standard mqtt integration usually handles unsubscription if expected.
-        # But custom component should cleanup.
-        pass 
+        # Stop packets and write out held values while the sensors are still there
+        manager = hass.data[DOMAIN][entry.entry_id]
+        manager.async_shutdown()
+        if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+            hass.data[DOMAIN].pop(entry.entry_id)
+            hosted = manager.hosted
+            hosted.async_unload_platform()
+            # Keys waiting for the delayed save are written before the next setup loads them
+            await hosted.async_save()
+        return unload_ok
     else:
         # Unload Device
         if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+            if (device := hass.data.get(DATA_DEVICES, {}).get(entry.unique_id)) is not None:
+                device.async_unload_platform()
             return unload_ok
             
     return True
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the shared device object of a removed device, or the membership of a removed bridge."""
+    if CONF_TOPIC_PREFIX not in entry.data:
+        # Entries migrated into the bridge keep their device and cached values
+        if any(
+            entry.unique_id in manager.hosted.devices for manager in hass.data.get(DOMAIN, {}).values()
+        ):
+            return
+        hass.data.get(DATA_DEVICES, {}).pop(entry.unique_id, None)
+        if (cache := hass.data.get(DATA_CACHE)) is not None:
+            cache.async_forget(entry.unique_id)
+    else:
+        from .hosted import HostedDevices # pylint: disable=import-outside-toplevel
+
+        await HostedDevices(hass, entry).async_remove_store()
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device_entry: dr.DeviceEntry
+) -> bool:
+    """Allow deleting devices hosted by the bridge."""
+    if CONF_TOPIC_PREFIX not in entry.data:
+        return False
+    manager = hass.data[DOMAIN][entry.entry_id]
+    for domain, unique_id in device_entry.identifiers:
+        if domain == DOMAIN and unique_id in manager.hosted.devices:
+            manager.async_unhost(unique_id)
+            return True
+    return False
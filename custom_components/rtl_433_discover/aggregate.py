@@ -0,0 +1,226 @@
+"""Rolling window statistics of device readings, written at a fixed interval."""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import timedelta
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import DEGREE, LIGHT_LUX, UnitOfSpeed, UnitOfVolumetricFlux
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_DEVICES
+
+if TYPE_CHECKING:
+    from .device import Rtl433Device
+
+KIND_MAX = "max"
+KIND_MEAN = "mean"
+KIND_DIRECTION = "direction" # vector mean of an angle in degrees
+KIND_RATE = "rate" # increase of a counter per hour
+
+# Buckets a window is split into, memory per statistic is fixed by this
+BUCKETS = 15
+# Per bucket: epoch, samples, sum (sin for directions), max, cos for directions
+_EPOCH, _COUNT, _TOTAL, _PEAK, _COS = range(5)
+_WIDTH = 5
+
+
+@dataclass(frozen=True, slots=True)
+class AggregateSpec:
+    """A statistic derived from one rtl_433 key."""
+
+    source: str
+    kind: str
+    name: str
+    device_class: SensorDeviceClass | None = None
+    unit: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Return the key of the derived sensor, e.g. wind_max_m_s_max."""
+        return f"{self.source}_{self.kind}"
+
+
+_WIND_M_S = (SensorDeviceClass.WIND_SPEED, UnitOfSpeed.METERS_PER_SECOND)
+_WIND_KM_H = (SensorDeviceClass.WIND_SPEED, UnitOfSpeed.KILOMETERS_PER_HOUR)
+
+AGGREGATES: tuple[AggregateSpec, ...] = (
+    AggregateSpec("wind_max_m_s", KIND_MAX, "Wind Gust", *_WIND_M_S),
+    AggregateSpec("wind_max_km_h", KIND_MAX, "Wind Gust", *_WIND_KM_H),
+    AggregateSpec("wind_avg_m_s", KIND_MEAN, "Wind Avg Mean", *_WIND_M_S),
+    AggregateSpec("wind_avg_km_h", KIND_MEAN, "Wind Avg Mean", *_WIND_KM_H),
+    AggregateSpec("wind_dir_deg", KIND_DIRECTION, "Wind Direction Mean", None, DEGREE),
+    AggregateSpec(
+        "rain_mm", KIND_RATE, "Rain Rate",
+        SensorDeviceClass.PRECIPITATION_INTENSITY, UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+    ),
+    AggregateSpec(
+        "rain_in", KIND_RATE, "Rain Rate",
+        SensorDeviceClass.PRECIPITATION_INTENSITY, UnitOfVolumetricFlux.INCHES_PER_HOUR,
+    ),
+    AggregateSpec("light_lux", KIND_MEAN, "Light Mean", SensorDeviceClass.ILLUMINANCE, LIGHT_LUX),
+)
+
+# Keys of the derived sensors, they share the registry with the keys a device sends
+AGGREGATE_KEYS = frozenset(spec.key for spec in AGGREGATES)
+
+# Source key -> statistics derived from it
+_BY_SOURCE: dict[str, tuple[AggregateSpec, ...]] = {}
+for _spec in AGGREGATES:
+    _BY_SOURCE[_spec.source] = (*_BY_SOURCE.get(_spec.source, ()), _spec)
+
+# Keys the statistics are derived from, their raw sensors are throttled to the write interval
+AGGREGATE_SOURCES = frozenset(_BY_SOURCE)
+
+
+class RollingWindow:
+    """One statistic over the last `window` seconds, in a fixed size array.
+
+    The window is split into BUCKETS buckets of running sums. A sample lands in
+    the bucket of its time slot, a bucket left over from an earlier round is
+    reset first, so nothing grows with the packet rate.
+    """
+
+    __slots__ = ("kind", "window", "_bucket", "_data", "_last")
+
+    def __init__(self, kind: str, window: float) -> None:
+        """Initialize."""
+        self.kind = kind
+        self.window = window
+        self._bucket = window / BUCKETS
+        self._data = array("d", bytes(8 * BUCKETS * _WIDTH))
+        self._last = math.nan # previous reading, for rates
+
+    def add(self, value: float, now: float) -> None:
+        """Add a sample taken at monotonic time now."""
+        epoch = now // self._bucket
+        base = int(epoch % BUCKETS) * _WIDTH
+        data = self._data
+        if data[base + _EPOCH] != epoch:
+            data[base:base + _WIDTH] = array("d", (epoch, 0.0, 0.0, -math.inf, 0.0))
+        data[base + _COUNT] += 1
+        kind = self.kind
+        if kind == KIND_MAX:
+            if value > data[base + _PEAK]:
+                data[base + _PEAK] = value
+        elif kind == KIND_MEAN:
+            data[base + _TOTAL] += value
+        elif kind == KIND_DIRECTION:
+            angle = math.radians(value)
+            data[base + _TOTAL] += math.sin(angle)
+            data[base + _COS] += math.cos(angle)
+        else:
+            # Counters restart at 0 with a new battery, only increases count
+            if value > self._last:
+                data[base + _TOTAL] += value - self._last
+            self._last = value
+
+    def value(self, now: float) -> float | None:
+        """Return the statistic over the window, None without samples in it."""
+        oldest = now // self._bucket - BUCKETS + 1
+        data = self._data
+        count = total = cos = 0.0
+        peak = -math.inf
+        for base in range(0, BUCKETS * _WIDTH, _WIDTH):
+            if data[base + _EPOCH] < oldest or not data[base + _COUNT]:
+                continue
+            count += data[base + _COUNT]
+            total += data[base + _TOTAL]
+            cos += data[base + _COS]
+            peak = max(peak, data[base + _PEAK])
+        if not count:
+            return None
+        kind = self.kind
+        if kind == KIND_MAX:
+            return peak
+        if kind == KIND_MEAN:
+            return round(total / count, 2)
+        if kind == KIND_DIRECTION:
+            return round(math.degrees(math.atan2(total, cos)) % 360, 1)
+        return round(total * 3600 / self.window, 2)
+
+
+class Aggregator:
+    """Feed device readings into rolling windows and write the statistics periodically.
+
+    Derived sensors are created the first time a device sends their source key.
+    Packets only update the windows, states are written from a single timer
+    every `interval` seconds, so a chatty anemometer writes its gust once per
+    interval instead of once per packet.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: float, interval: float) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.window = window
+        self.interval = interval
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    def __bool__(self) -> bool:
+        """Return True if aggregation is enabled."""
+        return self.window > 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start the timer, windows of other sizes start over."""
+        for device in self.hass.data.get(DATA_DEVICES, {}).values():
+            for sensor in device.aggregates.values():
+                if not self:
+                    sensor.async_reset(None)
+                elif sensor.window is None or sensor.window.window != self.window:
+                    sensor.async_reset(RollingWindow(sensor.kind, self.window))
+        if self:
+            self._unsub_timer = async_track_time_interval(
+                self.hass, self._async_write, timedelta(seconds=self.interval)
+            )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_feed(self, device: Rtl433Device, payload: dict[str, Any]) -> None:
+        """Add the readings of one packet."""
+        if not (sources := payload.keys() & _BY_SOURCE.keys()):
+            return
+        now = time.monotonic()
+        aggregates = device.aggregates
+        for source in sources:
+            value = payload[source]
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            for spec in _BY_SOURCE[source]:
+                if (sensor := aggregates.get(spec.key)) is None:
+                    if (sensor := self._async_add_sensor(device, spec)) is None:
+                        continue
+                sensor.window.add(value, now)
+
+    @callback
+    def _async_add_sensor(self, device: Rtl433Device, spec: AggregateSpec):
+        """Create the derived sensor through the device's platform."""
+        if device.add_entities is None:
+            return None
+        # Imported here, the sensor platform imports the manager which imports this module
+        from .sensor import Rtl433AggregateSensor # pylint: disable=import-outside-toplevel
+
+        sensor = device.aggregates[spec.key] = Rtl433AggregateSensor(
+            device, spec, RollingWindow(spec.kind, self.window)
+        )
+        device.add_entities([sensor])
+        return sensor
+
+    @callback
+    def _async_write(self, _now=None) -> None:
+        """Write the statistics of all derived sensors."""
+        now = time.monotonic()
+        for device in self.hass.data.get(DATA_DEVICES, {}).values():
+            for sensor in device.aggregates.values():
+                sensor.async_write_value(now)
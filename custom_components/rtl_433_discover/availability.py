@@ -0,0 +1,150 @@
+"""Marking devices unavailable when they stop transmitting."""
+from __future__ import annotations
+
+from datetime import timedelta
+import fnmatch
+import heapq
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
+
+from .const import DATA_DEVICES
+
+if TYPE_CHECKING:
+    from .device import Rtl433Device
+
+# How often the expiry heap is checked
+SWEEP_INTERVAL = timedelta(seconds=10)
+# Target matching every model without a more specific expiry
+DEFAULT_TARGET = "*"
+
+
+def parse_expiry_option(value: str | None) -> dict[str, float]:
+    """Parse "model=seconds, ..." into expiries.
+
+    The model may contain wildcards ("Fineoffset-WH5*"), "*" matches every other
+    model. Raises ValueError on malformed entries.
+    """
+    expiries = {}
+    if not value:
+        return expiries
+    for item in value.split(","):
+        if not (item := item.strip()):
+            continue
+        target, sep, seconds = item.partition("=")
+        if not sep or not (target := target.strip()):
+            raise ValueError(f"Invalid expiry: {item}")
+        if (expiry := float(seconds)) <= 0:
+            raise ValueError(f"Invalid expiry: {item}")
+        expiries[target] = expiry
+    return expiries
+
+
+class AvailabilityTracker:
+    """Watch device last seen times from one periodic sweep.
+
+    Tracked devices sit in a heap ordered by the time they would expire. Packets
+    only stamp `last_seen` on the device, so the heap entry goes stale instead of
+    being moved: the sweep pops due entries, pushes devices that were heard from
+    since back with their real deadline and marks the rest unavailable in one batch.
+    """
+
+    def __init__(self, hass: HomeAssistant, expiries: dict[str, float]) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._exact = {target: expiry for target, expiry in expiries.items() if not _is_glob(target)}
+        self._globs = [
+            (target, expiry) for target, expiry in expiries.items()
+            if _is_glob(target) and target != DEFAULT_TARGET
+        ]
+        self._default = expiries.get(DEFAULT_TARGET)
+        self._by_model: dict[str, float | None] = {}
+        self._heap: list[tuple[float, str]] = [] # (deadline timestamp, unique_id)
+        self._tracked: set[str] = set() # devices in the heap, all of them available
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    def __bool__(self) -> bool:
+        """Return True if any expiry is configured."""
+        return bool(self._exact or self._globs or self._default)
+
+    def expiry(self, model: str) -> float | None:
+        """Return the expiry for a model, resolved once per model."""
+        try:
+            return self._by_model[model]
+        except KeyError:
+            pass
+        expiry = self._exact.get(model)
+        if expiry is None:
+            expiry = next(
+                (expiry for target, expiry in self._globs if fnmatch.fnmatchcase(model, target)),
+                self._default,
+            )
+        self._by_model[model] = expiry
+        return expiry
+
+    @callback
+    def async_start(self) -> None:
+        """Start the sweep, and track every known device once Home Assistant has started."""
+        # Devices marked unavailable under previous options that no longer expire
+        for device in self.hass.data.get(DATA_DEVICES, {}).values():
+            if not device.available and self.expiry(device.model) is None:
+                device.async_set_available(True)
+        if not self:
+            return
+        self._unsubs.append(async_track_time_interval(self.hass, self._async_sweep, SWEEP_INTERVAL))
+        # Device platforms are set up by then, devices silent since the restart expire too
+        self._unsubs.append(async_at_started(self.hass, self._async_track_all))
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the sweep."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _async_track_all(self, _hass: HomeAssistant | None = None) -> None:
+        """Track all known devices."""
+        for device in list(self.hass.data.get(DATA_DEVICES, {}).values()):
+            self.async_seen(device)
+
+    @callback
+    def async_seen(self, device: Rtl433Device) -> None:
+        """Track a device that was heard from, making it available again."""
+        if device.unique_id in self._tracked:
+            return
+        if (expiry := self.expiry(device.model)) is None:
+            return
+        self._tracked.add(device.unique_id)
+        heapq.heappush(self._heap, ((device.last_seen or time.time()) + expiry, device.unique_id))
+        if not device.available:
+            device.async_set_available(True)
+
+    @callback
+    def _async_sweep(self, _now=None) -> None:
+        """Mark all devices past their expiry unavailable."""
+        now = time.time()
+        heap = self._heap
+        devices = self.hass.data.get(DATA_DEVICES, {})
+        expired = []
+        while heap and heap[0][0] <= now:
+            _, unique_id = heapq.heappop(heap)
+            device = devices.get(unique_id)
+            if device is None or (expiry := self.expiry(device.model)) is None:
+                self._tracked.discard(unique_id)
+                continue
+            if (deadline := (device.last_seen or 0) + expiry) > now:
+                heapq.heappush(heap, (deadline, unique_id))
+                continue
+            self._tracked.discard(unique_id)
+            expired.append(device)
+
+        for device in expired:
+            device.async_set_available(False)
+
+
+def _is_glob(target: str) -> bool:
+    """Return True if the target has wildcards."""
+    return any(char in target for char in "*?[")
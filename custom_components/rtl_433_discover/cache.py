@@ -0,0 +1,91 @@
+"""Persistent cache of the last known device state, restored at startup."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, DATA_CACHE, DATA_DEVICES
+
+STORAGE_VERSION = 1
+# Seconds between writes, the Store also writes pending data when Home Assistant stops
+SAVE_DELAY = 60
+
+
+class DeviceCache:
+    """Last values, last seen time and keys of every device, kept in one Store.
+
+    Sensors take their initial state from here instead of each one doing its own
+    RestoreEntity lookup, so rarely transmitting devices (rain gauges) have a
+    value straight after a restart. Live state is read from the device objects
+    when saving, packets only flag that a save is due.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.cache")
+        # unique_id -> {"last_seen": timestamp, "keys": [...], "values": {key: value}, "slot": [...]}
+        self.devices: dict[str, dict[str, Any]] = {}
+        self._load_task: asyncio.Task | None = None
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the cache, the first caller does the loading and the others wait."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        """Read the Store."""
+        if (data := await self._store.async_load()) is not None:
+            self.devices = data["devices"]
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Flag that a device changed, saved after SAVE_DELAY."""
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_forget(self, unique_id: str) -> None:
+        """Drop a removed device."""
+        if self.devices.pop(unique_id, None) is not None:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Collect the live device state into the cache."""
+        self._save_pending = False
+        for unique_id, device in self.hass.data.get(DATA_DEVICES, {}).items():
+            if device.last_seen is None:
+                continue
+            cached = self.devices.get(unique_id, {})
+            values = dict(cached.get("values", {}))
+            values.update(
+                (key, sensor.native_value)
+                for key, sensor in device.sensors.items()
+                if sensor.native_value is not None
+            )
+            self.devices[unique_id] = {
+                "last_seen": device.last_seen,
+                # Keys are cleared while the platform is unloaded
+                "keys": sorted(device.keys) or cached.get("keys", []),
+                "values": values,
+            }
+            # The bridge rebuilds its identity index from the slots at startup
+            if (slot := device.slot or cached.get("slot")) is not None:
+                self.devices[unique_id]["slot"] = list(slot)
+        return {"devices": self.devices}
+
+
+async def async_get_cache(hass: HomeAssistant) -> DeviceCache:
+    """Return the shared cache, loaded once for the bridge and all device entries."""
+    if (cache := hass.data.get(DATA_CACHE)) is None:
+        cache = hass.data[DATA_CACHE] = DeviceCache(hass)
+    await cache.async_load()
+    return cache
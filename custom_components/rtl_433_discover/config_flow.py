@@ -2,19 +2,69 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components.mqtt import valid_subscribe_topic
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import DOMAIN, CONF_TOPIC_PREFIX, DEFAULT_TOPIC_PREFIX, CONF_IGNORE_DEVICES
+from .const import (
+    DOMAIN,
+    CONF_TOPIC_PREFIX,
+    CONF_DEVICE_TOPIC,
+    DEFAULT_TOPIC_PREFIX,
+    CONF_IGNORE_DEVICES,
+    CONF_DISCOVERY_INTERVAL,
+    CONF_THROTTLE,
+    CONF_FIELD_OVERRIDES,
+    CONF_DEDUP_WINDOW,
+    CONF_PREFILTER,
+    CONF_QUEUE_SIZE,
+    CONF_OVERFLOW,
+    DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_OVERFLOW,
+    DEFAULT_DEDUP_WINDOW,
+    CONF_KEYS,
+    CONF_BRIDGE,
+    CONF_HOST_DEVICES,
+    CONF_EXPIRE_AFTER,
+    CONF_REBIND_AFTER,
+    DEFAULT_REBIND_AFTER,
+    CONF_AGGREGATE_WINDOW,
+    CONF_AGGREGATE_INTERVAL,
+    CONF_VALIDATE,
+    CONF_DISCOVERY_SIGHTINGS,
+    CONF_DISCOVERY_WINDOW,
+    DEFAULT_DISCOVERY_SIGHTINGS,
+    DEFAULT_DISCOVERY_WINDOW,
+    DEFAULT_AGGREGATE_WINDOW,
+    DEFAULT_AGGREGATE_INTERVAL,
+    AGGREGATE_WINDOWS,
+)
+from .availability import parse_expiry_option
+from .pipeline import OVERFLOW_POLICIES
+from .fields import parse_field_overrides
+from .ignore import IgnoreMatcher, parse_ignore_option
+from .throttle import parse_throttle_option
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields of the bulk adopt / ignore step
+CONF_ACTION = "action"
+CONF_MODEL_FILTER = "model"
+CONF_MIN_PACKETS = "min_packets"
+CONF_MIN_RSSI = "min_rssi"
+ACTION_ADOPT = "adopt"
+ACTION_IGNORE = "ignore"
+# Discovered devices listed in the bulk step, the filter still covers all of them
+MAX_TABLE_ROWS = 50
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_TOPIC_PREFIX, default=DEFAULT_TOPIC_PREFIX): str,
@@ -49,7 +99,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         model = discovery_info["model"]
         
         await self.async_set_unique_id(unique_id)
-        self._abort_if_unique_id_configured(updates=discovery_info)
+        # The seen keys are owned by the entry once it exists, don't overwrite them
+        self._abort_if_unique_id_configured(
+            updates={
+                key: value for key, value in discovery_info.items() if key not in (CONF_KEYS, CONF_BRIDGE)
+            }
+        )
 
         self.context["title_placeholders"] = {"name": f"{model} {unique_id}"}
         
@@ -63,9 +118,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Confirm discovery."""
         if user_input is not None:
+             data = dict(self.discovery_data)
+             bridge_id = data.pop(CONF_BRIDGE, None)
+             manager = self.hass.data.get(DOMAIN, {}).get(bridge_id)
+             if manager is not None and manager.host_devices:
+                 # The bridge hosts its devices, no entry of our own
+                 await manager.async_host(
+                     {data["unique_id"]: (data["model"], data.get(CONF_KEYS, []))}, self.flow_id
+                 )
+                 return self.async_abort(reason="added_to_bridge")
              return self.async_create_entry(
-                 title=f"{self.discovery_data['model']} {self.discovery_data['unique_id']}",
-                 data=self.discovery_data
+                 title=f"{data['model']} {data['unique_id']}",
+                 data=data
              )
              
         return self.async_show_form(
@@ -73,6 +137,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"name": f"{self.discovery_data['model']} {self.discovery_data['unique_id']}"}
         )
 
+    async def async_step_adopt(self, data: dict[str, Any]) -> FlowResult:
+        """Create a device entry without asking, for devices adopted in bulk or moved off a bridge."""
+        # The discovery card of the same device may still be open, it is aborted once the entry exists
+        await self.async_set_unique_id(data["unique_id"], raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=f"{data['model']} {data['unique_id']}", data=data)
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -91,19 +162,195 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Choose between the bridge settings and the discovered devices."""
+        return self.async_show_menu(step_id="init", menu_options=["settings", "devices"])
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                valid_subscribe_topic(user_input[CONF_TOPIC_PREFIX])
+            except vol.Invalid:
+                errors[CONF_TOPIC_PREFIX] = "invalid_topic"
+            if device_topic := user_input.get(CONF_DEVICE_TOPIC):
+                try:
+                    valid_subscribe_topic(f"{device_topic}/#")
+                except vol.Invalid:
+                    errors[CONF_DEVICE_TOPIC] = "invalid_topic"
+            try:
+                parse_throttle_option(user_input.get(CONF_THROTTLE))
+            except ValueError:
+                errors[CONF_THROTTLE] = "invalid_throttle"
+            try:
+                parse_field_overrides(user_input.get(CONF_FIELD_OVERRIDES))
+            except ValueError:
+                errors[CONF_FIELD_OVERRIDES] = "invalid_field_overrides"
+            try:
+                parse_expiry_option(user_input.get(CONF_EXPIRE_AFTER))
+            except ValueError:
+                errors[CONF_EXPIRE_AFTER] = "invalid_expire_after"
+            try:
+                IgnoreMatcher(parse_ignore_option(user_input.get(CONF_IGNORE_DEVICES)))
+            except ValueError:
+                errors[CONF_IGNORE_DEVICES] = "invalid_ignore"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
-            step_id="init",
+            step_id="settings",
             data_schema=vol.Schema(
                 {
+                    vol.Required(
+                        CONF_TOPIC_PREFIX,
+                        default=self.config_entry.options.get(CONF_TOPIC_PREFIX)
+                        or self.config_entry.data.get(CONF_TOPIC_PREFIX, DEFAULT_TOPIC_PREFIX),
+                    ): str,
+                    vol.Optional(
+                        CONF_DEVICE_TOPIC,
+                        default=self.config_entry.options.get(CONF_DEVICE_TOPIC, ""),
+                    ): str,
                     vol.Optional(
                         CONF_IGNORE_DEVICES,
                         default=self.config_entry.options.get(CONF_IGNORE_DEVICES, ""),
                     ): str,
+                    vol.Optional(
+                        CONF_DISCOVERY_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DISCOVERY_SIGHTINGS,
+                        default=self.config_entry.options.get(
+                            CONF_DISCOVERY_SIGHTINGS, DEFAULT_DISCOVERY_SIGHTINGS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                    vol.Optional(
+                        CONF_DISCOVERY_WINDOW,
+                        default=self.config_entry.options.get(CONF_DISCOVERY_WINDOW, DEFAULT_DISCOVERY_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_THROTTLE,
+                        default=self.config_entry.options.get(CONF_THROTTLE, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_PREFILTER,
+                        default=self.config_entry.options.get(CONF_PREFILTER, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_QUEUE_SIZE,
+                        default=self.config_entry.options.get(CONF_QUEUE_SIZE, DEFAULT_QUEUE_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_OVERFLOW,
+                        default=self.config_entry.options.get(CONF_OVERFLOW, DEFAULT_OVERFLOW),
+                    ): vol.In(OVERFLOW_POLICIES),
+                    vol.Optional(
+                        CONF_EXPIRE_AFTER,
+                        default=self.config_entry.options.get(CONF_EXPIRE_AFTER, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_REBIND_AFTER,
+                        default=self.config_entry.options.get(CONF_REBIND_AFTER, DEFAULT_REBIND_AFTER),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_AGGREGATE_WINDOW,
+                        default=self.config_entry.options.get(CONF_AGGREGATE_WINDOW, DEFAULT_AGGREGATE_WINDOW),
+                    ): vol.In(AGGREGATE_WINDOWS),
+                    vol.Optional(
+                        CONF_AGGREGATE_INTERVAL,
+                        default=self.config_entry.options.get(CONF_AGGREGATE_INTERVAL, DEFAULT_AGGREGATE_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_HOST_DEVICES,
+                        default=self.config_entry.options.get(CONF_HOST_DEVICES, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DEDUP_WINDOW,
+                        default=self.config_entry.options.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_FIELD_OVERRIDES,
+                        default=self.config_entry.options.get(CONF_FIELD_OVERRIDES, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_VALIDATE,
+                        default=self.config_entry.options.get(CONF_VALIDATE, True),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_devices(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Adopt or ignore the discovered devices matching a filter in one go."""
+        manager = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if manager is None:
+            return self.async_abort(reason="not_loaded")
+
+        errors = {}
+        if user_input is not None:
+            selected = manager.async_select_seen(
+                user_input[CONF_MODEL_FILTER],
+                user_input[CONF_MIN_PACKETS],
+                user_input.get(CONF_MIN_RSSI),
+            )
+            if not selected:
+                errors["base"] = "no_devices"
+            elif user_input[CONF_ACTION] == ACTION_IGNORE:
+                ignored = self.config_entry.options.get(CONF_IGNORE_DEVICES, "")
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        **self.config_entry.options,
+                        CONF_IGNORE_DEVICES: ", ".join(filter(None, [ignored, *selected])),
+                    },
+                )
+            else:
+                await manager.async_adopt(selected)
+                return self.async_create_entry(title="", data=dict(self.config_entry.options))
+
+        return self.async_show_form(
+            step_id="devices",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_ACTION, default=ACTION_ADOPT): vol.In(
+                        [ACTION_ADOPT, ACTION_IGNORE]
+                    ),
+                    vol.Required(CONF_MODEL_FILTER, default="*"): str,
+                    vol.Required(CONF_MIN_PACKETS, default=1): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
+                    vol.Optional(CONF_MIN_RSSI): vol.Coerce(float),
                 }
             ),
+            description_placeholders={"devices": _seen_devices_table(manager)},
+            errors=errors,
+        )
+
+
+def _seen_devices_table(manager) -> str:
+    """Render the discovered devices as a markdown table, busiest first."""
+    if not manager.seen_devices:
+        return "No devices discovered yet."
+    now = time.monotonic()
+    seen_devices = manager.top_seen_devices(MAX_TABLE_ROWS)
+    lines = [
+        "| Device | Packets | Per minute | Last seen | RSSI |",
+        "|---|---|---|---|---|",
+    ]
+    for unique_id, seen in seen_devices:
+        rate = f"{seen.rate:.1f}" if seen.rate is not None else "-"
+        rssi = f"{seen.rssi} dB" if seen.rssi is not None else "-"
+        lines.append(
+            f"| {unique_id} | {seen.packets} | {rate} | {now - seen.last_seen:.0f} s ago | {rssi} |"
         )
+    if len(manager.seen_devices) > MAX_TABLE_ROWS:
+        lines.append(f"\n{len(manager.seen_devices) - MAX_TABLE_ROWS} more not shown.")
+    return "\n".join(lines)
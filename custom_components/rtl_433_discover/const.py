@@ -2,8 +2,46 @@
 
 DOMAIN = "rtl_433_discover"
 CONF_TOPIC_PREFIX = "topic_prefix"
+CONF_DEVICE_TOPIC = "device_topic" # per-field topic tree of configured devices, e.g. rtl_433/+/devices
 CONF_IGNORE_DEVICES = "ignore_devices"
+CONF_DISCOVERY_INTERVAL = "discovery_interval"
+CONF_THROTTLE = "throttle"
+CONF_PREFILTER = "prefilter"
+CONF_QUEUE_SIZE = "queue_size"
+CONF_OVERFLOW = "overflow"
+CONF_FIELD_OVERRIDES = "field_overrides"
+CONF_DEDUP_WINDOW = "dedup_window"
+CONF_EXPIRE_AFTER = "expire_after"
+CONF_HOST_DEVICES = "host_devices" # bridge hosts its devices instead of one entry each
+CONF_BRIDGE = "bridge" # entry_id of the hosting bridge in discovery info
+CONF_KEYS = "keys" # keys seen from a device, persisted in the device entry data
+CONF_ALIAS = "alias" # unique_id a device sends since its id changed, persisted like the keys
+SOURCE_ADOPT = "adopt" # config flow source creating a device entry without asking, for bulk adoption and migration
+CONF_REBIND_AFTER = "rebind_after"
+CONF_AGGREGATE_WINDOW = "aggregate_window"
+CONF_AGGREGATE_INTERVAL = "aggregate_interval"
+CONF_VALIDATE = "validate"
+CONF_DISCOVERY_SIGHTINGS = "discovery_sightings"
+CONF_DISCOVERY_WINDOW = "discovery_window"
 DEFAULT_TOPIC_PREFIX = "rtl_433/+/events"
+DEFAULT_DISCOVERY_INTERVAL = 60 # seconds between discovery flows for the same unknown device
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_OVERFLOW = "coalesce"
+DEFAULT_DEDUP_WINDOW = 0 # seconds, 0 disables cross-receiver deduplication
+DEFAULT_REBIND_AFTER = 300 # seconds a device is silent before a new id on its channel takes over, 0 disables
+DEFAULT_AGGREGATE_WINDOW = 0 # minutes of the rolling statistics, 0 disables them
+DEFAULT_AGGREGATE_INTERVAL = 60 # seconds between writes of the rolling statistics
+AGGREGATE_WINDOWS = [0, 1, 5, 15]
+DEFAULT_DISCOVERY_SIGHTINGS = 1 # transmissions of an unknown device before it is offered, 1 offers it right away
+DEFAULT_DISCOVERY_WINDOW = 10 # minutes those transmissions have to fall within
 
 SIGNAL_NEW_SENSOR = "rtl_433_discover_new_sensor"
-SIGNAL_UPDATE_SENSOR = "rtl_433_discover_update_sensor"
+
+# hass.data key for the Rtl433Device objects shared by all entries, keyed by unique_id
+DATA_DEVICES = f"{DOMAIN}_devices"
+
+# hass.data key for the field catalogue with the bridge's overrides applied
+DATA_FIELDS = f"{DOMAIN}_fields"
+
+# hass.data key for the DeviceCache shared by all entries
+DATA_CACHE = f"{DOMAIN}_cache"
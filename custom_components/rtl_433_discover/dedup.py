@@ -0,0 +1,104 @@
+"""Suppression of the same transmission heard by several receivers."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+import time
+from typing import Any
+
+from .fields import FIELDS, FieldSpec
+
+# Fields that differ between receivers hearing the same transmission. rtl_433 stamps
+# "time" from the receiver clock with one second resolution, so the window stands in for it.
+RECEIVER_KEYS = frozenset({"time", "rssi", "snr", "noise", "freq", "freq1", "freq2"})
+# Upper bound for transmissions remembered inside the window
+MAX_ENTRIES = 4096
+# Best receivers are tracked for at most this many devices
+MAX_RECEIVERS = 4096
+
+
+def topic_receiver(pattern: str, topic: str) -> str:
+    """Return the part of topic matched by the wildcards of the subscription pattern.
+
+    For "rtl_433/+/events" that is the host name rtl_433 publishes under. Without
+    single level wildcards the whole topic identifies the receiver.
+    """
+    wildcards = [index for index, level in enumerate(pattern.split("/")) if level == "+"]
+    levels = topic.split("/")
+    if not wildcards or len(levels) <= wildcards[-1]:
+        return topic
+    return "/".join(levels[index] for index in wildcards)
+
+
+def _score(payload: dict[str, Any]) -> float | None:
+    """Return how well a copy was received, rssi with snr as fallback."""
+    score = payload.get("rssi", payload.get("snr"))
+    if isinstance(score, (int, float)) and not isinstance(score, bool):
+        return score
+    return None
+
+
+class Deduplicator:
+    """Drop repeats of a transmission arriving from other receivers within a window.
+
+    The first copy is processed straight away, later copies only tell us whether
+    another receiver heard the device better. A transmission is identified by
+    the device, its channel and the catalogue readings it carries, as a set, so
+    key order and extra metadata that differ between rtl_433 versions don't
+    hide a copy. Transmissions are remembered in a dict with a ring buffer of
+    expiry times next to it, so every check is O(1) amortized and memory is
+    bounded by MAX_ENTRIES.
+    """
+
+    def __init__(self, window: float, fields: Mapping[str, FieldSpec] = FIELDS) -> None:
+        """Initialize."""
+        self.window = window
+        self._readings = frozenset(fields.keys() - RECEIVER_KEYS)
+        self._ring: deque[tuple[float, tuple]] = deque() # (expiry, key), oldest first
+        # key -> [best score, receiver with that score]
+        self._seen: dict[tuple, list] = {}
+        self.receivers: dict[str, str] = {} # unique_id -> receiver hearing it best
+
+    def __bool__(self) -> bool:
+        """Return True if deduplication is enabled."""
+        return self.window > 0
+
+    def is_duplicate(self, unique_id: str, payload: dict[str, Any], receiver: str) -> bool:
+        """Return True if this transmission was already processed."""
+        now = time.monotonic()
+        ring = self._ring
+        while ring and ring[0][0] <= now:
+            self._seen.pop(ring.popleft()[1], None)
+
+        try:
+            if readings := payload.keys() & self._readings:
+                values = frozenset((name, payload[name]) for name in readings)
+            else:
+                # Events (remotes, doorbells) carry their data outside the catalogue
+                values = frozenset(item for item in payload.items() if item[0] not in RECEIVER_KEYS)
+            key = (unique_id, payload.get("channel"), values)
+            seen = self._seen.get(key)
+        except TypeError:
+            # Unhashable values (lists), can't tell copies apart
+            return False
+
+        score = _score(payload)
+        if seen is not None:
+            if score is not None and (seen[0] is None or score > seen[0]):
+                seen[0] = score
+                seen[1] = receiver
+                self._set_receiver(unique_id, receiver)
+            return True
+
+        if len(ring) >= MAX_ENTRIES:
+            self._seen.pop(ring.popleft()[1], None)
+        self._seen[key] = [score, receiver]
+        ring.append((now + self.window, key))
+        self._set_receiver(unique_id, receiver)
+        return False
+
+    def _set_receiver(self, unique_id: str, receiver: str) -> None:
+        """Remember which receiver hears a device best."""
+        receivers = self.receivers
+        if unique_id in receivers or len(receivers) < MAX_RECEIVERS:
+            receivers[unique_id] = receiver
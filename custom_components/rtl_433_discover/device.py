@@ -0,0 +1,207 @@
+"""Per-device state shared between the bridge and the sensor platform."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import CONF_ALIAS, CONF_KEYS, DATA_CACHE, DATA_DEVICES, DOMAIN
+from .fields import FIELDS, FieldSpec
+
+if TYPE_CHECKING:
+    from .cache import DeviceCache
+    from .hosted import HostedDevices
+    from .sensor import Rtl433AggregateSensor, Rtl433Sensor
+    from .throttle import Throttle
+
+
+class Rtl433Device:
+    """A configured rtl_433 device and the sensors it feeds.
+
+    The bridge hands every parsed packet for the device to `async_update`, which
+    updates all of its sensors in one pass instead of one dispatcher signal per key.
+    Sensors are only created for keys the device actually sends: the first time a
+    new key shows up it is added through the platform and remembered in the entry,
+    or in the bridge's membership store for devices hosted by the bridge.
+
+    Installs with thousands of devices keep one of these per device, so it is
+    slotted and everything its sensors have in common (ids, device info) lives
+    here once instead of on every sensor.
+    """
+
+    __slots__ = (
+        "hass",
+        "unique_id",
+        "model",
+        "sensors",
+        "aggregates",
+        "keys",
+        "entry",
+        "add_entities",
+        "hosted",
+        "cache",
+        "last_seen",
+        "available",
+        "slot",
+        "readings",
+        "strikes",
+        "_device_info",
+    )
+
+    def __init__(self, unique_id: str, model: str) -> None:
+        """Initialize."""
+        self.hass: HomeAssistant | None = None
+        self.unique_id = sys.intern(unique_id)
+        self.model = sys.intern(model)
+        self.sensors: dict[str, Rtl433Sensor] = {} # key -> sensor
+        self.aggregates: dict[str, Rtl433AggregateSensor] = {} # key -> derived sensor of the aggregator
+        self.keys: set[str] = set() # keys with an entity, added or pending
+        self.entry: ConfigEntry | None = None
+        self.add_entities: AddEntitiesCallback | None = None
+        self.hosted: HostedDevices | None = None # set if the bridge hosts the device
+        self.cache: DeviceCache | None = None
+        self.last_seen: float | None = None # timestamp of the last packet
+        self.available = True # False once the bridge's expiry for the model passed
+        self.slot: tuple | None = None # (model, channel, receiver) it was last heard on
+        # Validation state: last accepted reading of rate limited keys and counters,
+        # and how many packets in a row disagreed with it
+        self.readings: dict[str, Any] = {}
+        self.strikes: dict[str, int] = {}
+        self._device_info: DeviceInfo | None = None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device registry info, shared by all sensors of the device."""
+        if self._device_info is None:
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.unique_id)},
+                name=f"{self.model} {self.unique_id.split('-')[-1]}",
+                manufacturer="rtl_433",
+                model=self.model,
+            )
+        return self._device_info
+
+    @callback
+    def async_setup_platform(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        add_entities: AddEntitiesCallback,
+        hosted: HostedDevices | None = None,
+    ) -> None:
+        """Attach the loaded sensor platform."""
+        self.hass = hass
+        self.entry = entry
+        self.add_entities = add_entities
+        self.hosted = hosted
+        # Loaded by the platform setup before any device attaches
+        self.cache = hass.data.get(DATA_CACHE)
+        if self.last_seen is None and self.cache is not None:
+            cached = self.cache.devices.get(self.unique_id, {})
+            self.last_seen = cached.get("last_seen")
+            if (slot := cached.get("slot")) is not None:
+                self.slot = tuple(slot)
+
+    @callback
+    def async_unload_platform(self) -> None:
+        """Detach the sensor platform, new keys wait for the next setup."""
+        self.entry = None
+        self.add_entities = None
+        self.hosted = None
+        self.keys.clear()
+
+    @callback
+    def async_update(
+        self,
+        payload: dict[str, Any],
+        throttle: Throttle | None = None,
+        fields: Mapping[str, FieldSpec] = FIELDS,
+    ) -> None:
+        """Update all sensors of this device from one packet."""
+        self.last_seen = time.time()
+        if self.cache is not None:
+            self.cache.async_schedule_save()
+        sensors = self.sensors
+        # Key views intersect in C, most packets carry more keys than we have sensors for
+        for key in payload.keys() & sensors.keys():
+            sensors[key].async_set_value(payload[key], throttle)
+        if self.add_entities is not None and (new_keys := payload.keys() - self.keys):
+            if new_keys := new_keys.intersection(fields):
+                self._async_add_keys(new_keys, payload, fields)
+
+    @callback
+    def async_update_field(
+        self,
+        key: str,
+        value: Any,
+        throttle: Throttle | None = None,
+        fields: Mapping[str, FieldSpec] = FIELDS,
+    ) -> None:
+        """Update one sensor from a per-field topic."""
+        self.last_seen = time.time()
+        if self.cache is not None:
+            self.cache.async_schedule_save()
+        if (sensor := self.sensors.get(key)) is not None:
+            sensor.async_set_value(value, throttle)
+        elif self.add_entities is not None and key not in self.keys and key in fields:
+            self._async_add_keys({key}, {key: value}, fields)
+
+    @callback
+    def async_set_available(self, available: bool) -> None:
+        """Mark the device and all its sensors (un)available."""
+        self.available = available
+        for sensor in self.sensors.values():
+            sensor.async_write_ha_state()
+
+    @callback
+    def async_set_alias(self, alias: str | None) -> None:
+        """Remember the id the device sends since it changed, None once it sends its own again."""
+        if self.hosted is not None:
+            self.hosted.async_set_alias(self.unique_id, alias)
+        elif (entry := self.entry) is not None:
+            data = {key: value for key, value in entry.data.items() if key != CONF_ALIAS}
+            if alias is not None:
+                data[CONF_ALIAS] = alias
+            self.hass.config_entries.async_update_entry(entry, data=data)
+
+    @callback
+    def _async_add_keys(
+        self, keys: set[str], payload: dict[str, Any], fields: Mapping[str, FieldSpec]
+    ) -> None:
+        """Create the sensors for keys seen for the first time."""
+        # Imported here, the sensor platform imports this module
+        from .sensor import Rtl433Sensor # pylint: disable=import-outside-toplevel
+
+        keys = intern_keys(keys)
+        self.keys.update(keys)
+        self.add_entities(
+            [Rtl433Sensor(self, key, fields[key], payload[key]) for key in sorted(keys)]
+        )
+        if self.hosted is not None:
+            self.hosted.async_set_keys(self.unique_id, self.keys)
+            return
+        entry = self.entry
+        if not keys.issubset(entry.data.get(CONF_KEYS, ())):
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_KEYS: sorted(self.keys)}
+            )
+
+
+def intern_keys(keys: Iterable[str]) -> set[str]:
+    """Return the keys interned, all devices and sensors share one string per key."""
+    return {sys.intern(key) for key in keys}
+
+
+@callback
+def async_get_device(hass: HomeAssistant, unique_id: str, model: str) -> Rtl433Device:
+    """Return the shared device object, creating it on first use."""
+    devices: dict[str, Rtl433Device] = hass.data.setdefault(DATA_DEVICES, {})
+    if (device := devices.get(unique_id)) is None:
+        device = devices[unique_id] = Rtl433Device(unique_id, model)
+    return device
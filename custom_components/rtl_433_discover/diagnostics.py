@@ -0,0 +1,56 @@
+"""Diagnostics support for rtl_433 Discovery."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_TOPIC_PREFIX, DATA_DEVICES
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    if CONF_TOPIC_PREFIX not in entry.data:
+        device = hass.data.get(DATA_DEVICES, {}).get(entry.unique_id)
+        return {
+            "data": dict(entry.data),
+            "sensors": sorted(device.sensors) if device else [],
+        }
+
+    manager = hass.data[DOMAIN][entry.entry_id]
+    queue = manager.queue
+    return {
+        "data": dict(entry.data),
+        "options": dict(entry.options),
+        "counters": dict(manager.counters),
+        "processing_time_ms": {
+            "p50": manager.processing_time_percentile(50),
+            "p99": manager.processing_time_percentile(99),
+        },
+        "queue": {
+            "depth": queue.depth,
+            "max_depth": queue.max_depth,
+            "dropped": queue.dropped,
+            "coalesced": queue.coalesced,
+        },
+        "device_packets": dict(manager.device_packets.most_common()),
+        "best_receivers": dict(manager.dedup.receivers),
+        "hosted_devices": manager.hosted.devices,
+        "aliases": dict(manager.identity.aliases),
+        "unknown_devices": {
+            "tracked": len(manager.seen_devices),
+            "top": {
+                unique_id: {
+                    "model": seen.model,
+                    "packets": seen.packets,
+                    "per_minute": seen.rate,
+                    "rssi": seen.rssi,
+                    "keys": sorted(seen.keys),
+                }
+                for unique_id, seen in manager.top_seen_devices()
+            },
+        },
+    }
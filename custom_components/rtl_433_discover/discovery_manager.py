@@ -1,25 +1,139 @@
 """Device discovery logic."""
-import json
+from __future__ import annotations
+
+import asyncio
+import fnmatch
 import logging
+import time
+from collections import Counter, OrderedDict, deque
+import heapq
+from typing import Any, NamedTuple
+
+from homeassistant.components import mqtt
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntry, ConfigEntryChange
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import device_registry as dr
-from .const import DOMAIN, SIGNAL_NEW_SENSOR, SIGNAL_UPDATE_SENSOR, CONF_IGNORE_DEVICES
+from .const import (
+    DOMAIN,
+    SIGNAL_NEW_SENSOR,
+    CONF_IGNORE_DEVICES,
+    CONF_DISCOVERY_INTERVAL,
+    CONF_THROTTLE,
+    CONF_PREFILTER,
+    CONF_QUEUE_SIZE,
+    CONF_OVERFLOW,
+    DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_OVERFLOW,
+    CONF_FIELD_OVERRIDES,
+    CONF_DEDUP_WINDOW,
+    CONF_HOST_DEVICES,
+    CONF_EXPIRE_AFTER,
+    CONF_BRIDGE,
+    CONF_TOPIC_PREFIX,
+    CONF_DEVICE_TOPIC,
+    CONF_KEYS,
+    CONF_ALIAS,
+    SOURCE_ADOPT,
+    CONF_REBIND_AFTER,
+    CONF_AGGREGATE_WINDOW,
+    CONF_AGGREGATE_INTERVAL,
+    CONF_VALIDATE,
+    CONF_DISCOVERY_SIGHTINGS,
+    CONF_DISCOVERY_WINDOW,
+    DATA_CACHE,
+    DATA_DEVICES,
+    DATA_FIELDS,
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_REBIND_AFTER,
+    DEFAULT_AGGREGATE_WINDOW,
+    DEFAULT_AGGREGATE_INTERVAL,
+    DEFAULT_DISCOVERY_SIGHTINGS,
+    DEFAULT_DISCOVERY_WINDOW,
+    DEFAULT_TOPIC_PREFIX,
+)
+from .aggregate import AGGREGATE_SOURCES, Aggregator
+from .availability import AvailabilityTracker, parse_expiry_option
+from .dedup import Deduplicator, topic_receiver
+from .device import Rtl433Device, async_get_device
+from .hosted import HostedDevices
+from .identity import IdentityIndex
+from .fields import build_fields, parse_field_overrides
+from .ignore import IgnoreMatcher
+from .payload import NO_DEVICE, JSONDecodeError, json_loads, parse_scalar, peek_device
+from .pipeline import IngestQueue
+from .throttle import Throttle, ThrottlePolicy, parse_throttle_option
+from .validate import Validator
 
 _LOGGER = logging.getLogger(__name__)
 
-# List of keys we want to track as sensors
-TRACKED_KEYS = [
-    "temperature_C",
-    "humidity",
-    "wind_max_m_s",
-    "wind_avg_m_s",
-    "wind_dir_deg",
-    "rain_mm",
-    "light_klx",
-    "light_lux",
-    "uv",
-    "battery_ok"
-]
+# Upper bound for the route table, unknown devices passing by would otherwise grow it forever
+MAX_ROUTES = 65536
+# Pending discovery table is pruned of expired entries once it reaches this size
+MAX_PENDING_FLOWS = 4096
+# Per-device packet counts are kept for at most this many devices
+MAX_DEVICE_COUNTS = 4096
+# Unconfigured devices remembered for discovery and the bulk adopt / ignore step,
+# the least recently heard is dropped beyond this
+MAX_SEEN_DEVICES = 4096
+# Packets of an unknown device closer together than this are repeats of one transmission
+SIGHTING_GAP = 5
+# Unknown devices listed in the diagnostics
+TOP_SEEN_DEVICES = 20
+# Processing times kept for the p50/p99 diagnostics
+TIMING_SAMPLES = 1000
+# Topic -> receiver cache is cleared once it reaches this size
+MAX_TOPICS = 1024
+# Upper bound for the per-field topic table, one entry per device and field
+MAX_FIELD_ROUTES = 65536
+# A flow that aborted (already in progress, already configured) is held back this many windows
+NEGATIVE_CACHE_FACTOR = 10
+
+
+class DeviceRoute(NamedTuple):
+    """Precomputed routing decision for a (model, id) pair."""
+
+    unique_id: str
+    ignored: bool
+    # None if the device has no config entry yet
+    device: Rtl433Device | None
+
+
+class FieldRoute(NamedTuple):
+    """Precomputed routing decision for a per-field topic."""
+
+    device: Rtl433Device
+    key: str
+    # (channel, receiver) for the identity index, None if the topic has no channel level
+    slot: tuple[Any, str] | None
+
+
+class SeenDevice:
+    """An unconfigured device heard by the bridge."""
+
+    __slots__ = ("model", "first_seen", "first_heard", "last_seen", "packets", "rssi", "keys", "sightings")
+
+    def __init__(self, model: str, now: float, sightings: int) -> None:
+        """Initialize."""
+        self.model = model
+        self.first_seen = now # monotonic
+        self.first_heard = time.time() # timestamp, compared against last_seen of configured devices
+        self.last_seen = now # monotonic
+        self.packets = 0
+        self.rssi: float | None = None # last reported, rtl_433 needs -M level for it
+        self.keys: set[str] = set() # catalogue keys the device sent
+        # monotonic times of the last transmissions, as many as discovery asks for
+        self.sightings: deque[float] = deque(maxlen=sightings)
+
+    @property
+    def rate(self) -> float | None:
+        """Return packets per minute, None until heard twice."""
+        if self.packets < 2 or self.last_seen <= self.first_seen:
+            return None
+        return (self.packets - 1) * 60 / (self.last_seen - self.first_seen)
+
 
 class Rtl433DiscoveryManager:
     """Class to manage rtl_433 discovery."""
@@ -28,22 +142,373 @@ class Rtl433DiscoveryManager:
         """Initialize."""
         self.hass = hass
         self.entry = entry
-        self.known_sensors = set() # Store unique_id of sensors we've already created
+        self.matcher = IgnoreMatcher.from_option(entry.options.get(CONF_IGNORE_DEVICES, ""))
+        self._routes: dict[tuple[str, Any], DeviceRoute] = {}
+        self._route_keys: dict[str, tuple[str, Any]] = {} # unique_id -> route key
+        self._pending_flows: dict[str, float] = {} # unique_id -> monotonic time flows are held until
+        self.discovery_interval = entry.options.get(CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL)
+        self.counters: Counter[str] = Counter()
+        self.device_packets: Counter[str] = Counter() # unique_id -> packets, ignored devices excluded
+        # unique_id -> unconfigured device, least recently heard first
+        self.seen_devices: OrderedDict[str, SeenDevice] = OrderedDict()
+        self.discovery_sightings = entry.options.get(CONF_DISCOVERY_SIGHTINGS, DEFAULT_DISCOVERY_SIGHTINGS)
+        self.discovery_window = entry.options.get(CONF_DISCOVERY_WINDOW, DEFAULT_DISCOVERY_WINDOW) * 60
+        self.timings: deque[float] = deque(maxlen=TIMING_SAMPLES) # seconds per message
+        self.throttle = self._build_throttle()
+        self.fields = self._build_fields()
+        self.validator = self._build_validator()
+        self.availability = self._build_availability() # started by the bridge setup
+        self.aggregator = self._build_aggregator() # started by the bridge setup
+        self.prefilter = entry.options.get(CONF_PREFILTER, False)
+        # Devices hosted by the bridge, loaded by the bridge setup
+        self.host_devices = entry.options.get(CONF_HOST_DEVICES, False)
+        self.hosted = HostedDevices(hass, entry)
+        self.dedup = Deduplicator(entry.options.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW), self.fields)
+        # Loaded by the bridge setup once the hosted devices and the cache are
+        self.identity = IdentityIndex(entry.options.get(CONF_REBIND_AFTER, DEFAULT_REBIND_AFTER))
+        self._topic_receivers: dict[str, str] = {}
+        # Subscribed by the bridge setup, swapped in place when the topic options change
+        self.topic: str | None = None
+        self.device_topic: str | None = None
+        self._subscriptions: dict[str, CALLBACK_TYPE] = {} # topic filter -> unsubscribe
+        self._subscribe_lock = asyncio.Lock()
+        # Per-field topic -> (device, key), None for topics that don't belong to a configured device
+        self._field_routes: dict[str, FieldRoute | None] = {}
+        self._field_devices: set[str] = set() # devices updated from their field topics
+        self.queue = IngestQueue(
+            self.async_process_message,
+            entry.options.get(CONF_QUEUE_SIZE, DEFAULT_QUEUE_SIZE),
+            entry.options.get(CONF_OVERFLOW, DEFAULT_OVERFLOW),
+        )
 
     @property
     def ignored_devices(self):
         """Return list of ignored devices."""
-        ignore_str = self.entry.options.get(CONF_IGNORE_DEVICES, "")
-        if not ignore_str:
-            return []
-        # Split by comma and strip whitespace
-        return [x.strip() for x in ignore_str.split(",") if x.strip()]
+        return list(self.matcher.entries)
+
+    @callback
+    def async_update_options(self):
+        """Rebuild everything derived from the entry options."""
+        self.matcher = IgnoreMatcher.from_option(self.entry.options.get(CONF_IGNORE_DEVICES, ""))
+        self.discovery_interval = self.entry.options.get(CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL)
+        self.discovery_sightings = self.entry.options.get(CONF_DISCOVERY_SIGHTINGS, DEFAULT_DISCOVERY_SIGHTINGS)
+        self.discovery_window = self.entry.options.get(CONF_DISCOVERY_WINDOW, DEFAULT_DISCOVERY_WINDOW) * 60
+        self.prefilter = self.entry.options.get(CONF_PREFILTER, False)
+        self.queue.overflow = self.entry.options.get(CONF_OVERFLOW, DEFAULT_OVERFLOW)
+        self.identity.silence = self.entry.options.get(CONF_REBIND_AFTER, DEFAULT_REBIND_AFTER)
+        self._topic_receivers.clear()
+        self.async_invalidate_routes()
+        self._pending_flows.clear()
+        if self.matcher:
+            self.seen_devices = OrderedDict(
+                (unique_id, seen) for unique_id, seen in self.seen_devices.items()
+                if not self.matcher.is_ignored(unique_id, unique_id[len(seen.model) + 1:])
+            )
+        for seen in self.seen_devices.values():
+            if seen.sightings.maxlen != self.discovery_sightings:
+                seen.sightings = deque(seen.sightings, maxlen=self.discovery_sightings)
+        # Held values of the old policies are written out before swapping
+        self.throttle.async_shutdown()
+        self.throttle = self._build_throttle()
+        # Only new sensors pick up changed overrides, existing ones keep their spec until reload
+        self.fields = self._build_fields()
+        self.dedup = Deduplicator(self.entry.options.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW), self.fields)
+        self.validator = self._build_validator()
+        self.availability.async_shutdown()
+        self.availability = self._build_availability()
+        self.availability.async_start()
+        self.aggregator.async_shutdown()
+        self.aggregator = self._build_aggregator()
+        self.aggregator.async_start()
+
+    @property
+    def configured_topic(self) -> str:
+        """Return the topic to subscribe to, the options override the one the bridge was set up with."""
+        return self.entry.options.get(CONF_TOPIC_PREFIX) or self.entry.data.get(
+            CONF_TOPIC_PREFIX, DEFAULT_TOPIC_PREFIX
+        )
+
+    async def async_subscribe(self) -> None:
+        """Subscribe to the configured topics, replacing the current subscriptions.
+
+        All new subscriptions are made before any old one is dropped, so no
+        packet is lost in between. While they are being made, a packet matching
+        an old and a new topic arrives through both, the deduplication window
+        drops the second one if it is set.
+        """
+        async with self._subscribe_lock:
+            topic = self.configured_topic
+            device_topic = self.entry.options.get(CONF_DEVICE_TOPIC) or None
+            wanted = {topic: self.queue.async_put}
+            if device_topic:
+                # Field updates are a dict lookup each, they skip the ingest queue
+                wanted[f"{device_topic}/#"] = self.async_field_received
+
+            subscriptions = {}
+            for topic_filter, handler in wanted.items():
+                if (unsubscribe := self._subscriptions.get(topic_filter)) is None:
+                    # Raw bytes, the manager decodes them itself (orjson takes bytes directly)
+                    unsubscribe = await mqtt.async_subscribe(self.hass, topic_filter, handler, encoding=None)
+                subscriptions[topic_filter] = unsubscribe
+            # Every new filter is live now, the old ones are dropped without awaiting in between
+            for topic_filter, unsubscribe in self._subscriptions.items():
+                if topic_filter not in subscriptions:
+                    _LOGGER.debug("Unsubscribing from %s", topic_filter)
+                    unsubscribe()
+            self._subscriptions = subscriptions
+
+            if topic != self.topic:
+                self.topic = topic
+                self._topic_receivers.clear()
+            if device_topic != self.device_topic:
+                self.device_topic = device_topic
+                self._async_clear_field_routes()
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop receiving packets."""
+        subscriptions, self._subscriptions = self._subscriptions, {}
+        for unsubscribe in subscriptions.values():
+            unsubscribe()
+
+    def _build_fields(self):
+        """Build the field catalogue with the overrides from the options."""
+        try:
+            overrides = parse_field_overrides(self.entry.options.get(CONF_FIELD_OVERRIDES, ""))
+        except ValueError as err:
+            _LOGGER.warning("Ignoring field overrides: %s", err)
+            overrides = {}
+        fields = build_fields(overrides)
+        # The sensor platform of the device entries reads it from here
+        self.hass.data[DATA_FIELDS] = fields
+        return fields
+
+    def _build_validator(self) -> Validator:
+        """Build the plausibility checks from the field catalogue."""
+        return Validator(self.fields if self.entry.options.get(CONF_VALIDATE, True) else {})
+
+    def _build_availability(self) -> AvailabilityTracker:
+        """Build the availability tracker from the options."""
+        try:
+            expiries = parse_expiry_option(self.entry.options.get(CONF_EXPIRE_AFTER, ""))
+        except ValueError as err:
+            _LOGGER.warning("Ignoring expire_after option: %s", err)
+            expiries = {}
+        return AvailabilityTracker(self.hass, expiries)
+
+    def _build_aggregator(self) -> Aggregator:
+        """Build the rolling window statistics from the options."""
+        return Aggregator(
+            self.hass,
+            self.entry.options.get(CONF_AGGREGATE_WINDOW, DEFAULT_AGGREGATE_WINDOW) * 60,
+            self.entry.options.get(CONF_AGGREGATE_INTERVAL, DEFAULT_AGGREGATE_INTERVAL),
+        )
+
+    def _build_throttle(self) -> Throttle:
+        """Build the write throttle from the options."""
+        try:
+            policies = parse_throttle_option(self.entry.options.get(CONF_THROTTLE, ""))
+        except ValueError as err:
+            _LOGGER.warning("Ignoring throttle option: %s", err)
+            policies = {}
+        if self.entry.options.get(CONF_AGGREGATE_WINDOW, DEFAULT_AGGREGATE_WINDOW):
+            # The statistics carry these readings, their raw sensors write no more often than
+            # the statistics do, unless the options have a policy for the key itself
+            interval = self.entry.options.get(CONF_AGGREGATE_INTERVAL, DEFAULT_AGGREGATE_INTERVAL)
+            for key in AGGREGATE_SOURCES:
+                policies.setdefault(key, ThrottlePolicy(interval))
+        return Throttle(self.hass, policies)
+
+    @callback
+    def async_shutdown(self):
+        """Stop receiving packets, stop timers and write out held values."""
+        self.async_unsubscribe()
+        self.throttle.async_shutdown()
+        self.availability.async_shutdown()
+        self.aggregator.async_shutdown()
+
+    @callback
+    def async_load_identity(self):
+        """Build the identity index from the stored aliases and the slots in the cache."""
+        identity = self.identity
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if (alias := entry.data.get(CONF_ALIAS)) is not None and entry.unique_id:
+                identity.async_add_alias(alias, entry.unique_id)
+        for unique_id, member in self.hosted.devices.items():
+            if (alias := member.get(CONF_ALIAS)) is not None:
+                identity.async_add_alias(alias, unique_id)
+        if (cache := self.hass.data.get(DATA_CACHE)) is not None:
+            for unique_id, cached in cache.devices.items():
+                if (slot := cached.get("slot")) is not None:
+                    identity.slots[tuple(slot)] = unique_id
+        self.async_invalidate_routes()
+
+    @callback
+    def async_invalidate_routes(self):
+        """Drop all cached routes."""
+        self._routes.clear()
+        self._route_keys.clear()
+        self._async_clear_field_routes()
+
+    @callback
+    def _async_clear_field_routes(self):
+        """Drop the per-field topic table, devices go back to their events until resolved again."""
+        self._field_routes.clear()
+        self._field_devices.clear()
+
+    @callback
+    def async_config_entry_changed(self, change: ConfigEntryChange, entry: ConfigEntry):
+        """Drop the cached route of a device entry that was added or removed."""
+        if entry.domain != DOMAIN or change not in (ConfigEntryChange.ADDED, ConfigEntryChange.REMOVED):
+            return
+        if change == ConfigEntryChange.REMOVED:
+            self.identity.async_forget(entry.unique_id)
+        self._async_forget(entry.unique_id)
+
+    @callback
+    def _async_build_route(self, model: str, device_id: Any) -> DeviceRoute:
+        """Resolve ignore state, config entry and device object for a device once."""
+        unique_device_id = f"{model}-{device_id}"
+        ignored = self.matcher.is_ignored(unique_device_id, device_id)
+        if not ignored and (alias := self.identity.async_remove_alias(unique_device_id)) is not None:
+            self._async_unbind(unique_device_id, model, alias)
+        # An id bound to a configured device after its battery was changed routes to that device
+        unique_device_id = self.identity.aliases.get(unique_device_id, unique_device_id)
+
+        device = None
+        if not ignored:
+            if unique_device_id in self.hosted.devices:
+                # Hosted by the bridge, there is no entry to look up
+                device = async_get_device(self.hass, unique_device_id, model)
+            # We check if a Config Entry exists with this unique_id
+            elif (entry := self.hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_device_id)) is not None:
+                if entry.source == SOURCE_IGNORE:
+                    # Devices ignored from the discovered card get an entry with the ignore source
+                    ignored = True
+                else:
+                    device = async_get_device(self.hass, unique_device_id, model)
+
+        route = DeviceRoute(unique_device_id, ignored, device)
+        if len(self._routes) >= MAX_ROUTES:
+            self.async_invalidate_routes()
+        self._routes[(model, device_id)] = route
+        self._route_keys[unique_device_id] = (model, device_id)
+        return route
+
+    @callback
+    def _async_build_field_route(self, topic: str) -> FieldRoute | None:
+        """Resolve the device, key and slot of a per-field topic once.
+
+        rtl_433 publishes fields under <prefix>[/type]/<model>[/subtype][/channel]/<id>/<key>,
+        the id is always the level before the key but the model can be any of the
+        levels before that, so each is tried against the configured devices. A
+        level between the model and the id is taken as the channel, so devices
+        fed by their field topics keep their slot for rebinding like on events.
+        """
+        levels = topic.split("/")[self.device_topic.count("/") + 1:]
+        route = None
+        # Fields outside the catalogue (model, id, mic, ...) never get a sensor
+        if len(levels) >= 3 and levels[-1] in self.fields:
+            *path, device_id, key = levels
+            devices = self.hass.data.get(DATA_DEVICES, {})
+            for index, model in enumerate(path):
+                unique_device_id = f"{model}-{device_id}"
+                if (device := devices.get(unique_device_id)) is not None:
+                    if not self.matcher.is_ignored(unique_device_id, device_id):
+                        slot = None
+                        if index + 1 < len(path):
+                            slot = (parse_scalar(path[-1]), self._field_receiver(topic))
+                        route = FieldRoute(device, key, slot)
+                        self._field_devices.add(unique_device_id)
+                    break
+
+        if len(self._field_routes) >= MAX_FIELD_ROUTES:
+            self._async_clear_field_routes()
+        self._field_routes[topic] = route
+        return route
+
+    def _field_receiver(self, topic: str) -> str:
+        """Return the receiver a per-field message came from, as the events of that receiver name it."""
+        if "+" in self.device_topic:
+            return topic_receiver(self.device_topic, topic)
+        # A single receiver without wildcards shares the slot of its events topic
+        events_topic = self.topic or self.configured_topic
+        return topic_receiver(events_topic, events_topic)
+
+    @callback
+    def async_field_received(self, msg) -> None:
+        """Update a sensor from its per-field topic, without any JSON to decode."""
+        try:
+            route = self._field_routes[msg.topic]
+        except KeyError:
+            route = self._async_build_field_route(msg.topic)
+        if route is None:
+            # Unconfigured devices and fields we don't track, discovery runs on the events
+            return
+
+        device, key, slot = route
+        self.counters["field_updates"] += 1
+        if self.identity and slot is not None:
+            self.identity.async_seen(device, *slot)
+        if self.availability:
+            self.availability.async_seen(device)
+        value = parse_scalar(msg.payload)
+        if self.validator and not self.validator.async_check_value(device, key, value):
+            self.counters["rejected"] += 1
+            return
+        device.async_update_field(key, value, self.throttle, self.fields)
+        if self.aggregator:
+            self.aggregator.async_feed(device, {key: value})
+
+    def _receiver(self, topic: str) -> str:
+        """Return the receiver a message came from, derived from its topic."""
+        try:
+            return self._topic_receivers[topic]
+        except KeyError:
+            pass
+        if len(self._topic_receivers) >= MAX_TOPICS:
+            self._topic_receivers.clear()
+        receiver = self._topic_receivers[topic] = topic_receiver(self.topic or self.configured_topic, topic)
+        return receiver
+
+    def processing_time_percentile(self, percentile: float) -> float | None:
+        """Return a percentile of the recent processing times in milliseconds."""
+        if not self.timings:
+            return None
+        timings = sorted(self.timings)
+        return timings[min(int(len(timings) * percentile / 100), len(timings) - 1)] * 1000
 
     async def async_process_message(self, msg):
         """Process a message."""
+        start = time.perf_counter()
+        self.counters["messages"] += 1
         try:
-            payload = json.loads(msg.payload)
-        except json.JSONDecodeError:
+            await self._async_process_message(msg)
+        finally:
+            self.timings.append(time.perf_counter() - start)
+
+    async def _async_process_message(self, msg):
+        """Decode, filter and route a message."""
+        raw = msg.payload
+        if self.prefilter or self._field_devices:
+            peek = peek_device(raw)
+            if peek is not None and f"{peek[0]}-{peek[1]}" in self._field_devices:
+                # Already updated from its per-field topics
+                self.counters["topic_routed"] += 1
+                return
+            if self.prefilter and peek is not None:
+                # Drop ignored and malformed traffic before paying for a full decode
+                if peek is NO_DEVICE:
+                    self.counters["prefiltered"] += 1
+                    return
+                if self.matcher and self.matcher.is_ignored(f"{peek[0]}-{peek[1]}", peek[1]):
+                    self.counters["ignored"] += 1
+                    return
+
+        try:
+            payload = json_loads(raw)
+        except JSONDecodeError:
+            self.counters["decode_failures"] += 1
             _LOGGER.debug("Failed to decode JSON from %s", msg.topic)
             return
 
@@ -59,45 +524,257 @@ class Rtl433DiscoveryManager:
             # If no ID, we can't really track it reliably as a unique device.
             return
 
-        # Check against Ignore List
-        # We check both exact "43951" and "Bresser-7in1-43951" mostly just ID is easier for user
-        # But ID might not be unique across models. 
-        # Let's support verifying against "model-id" and just "id"
-        unique_device_id = f"{model}-{device_id}"
-        
-        ignored = self.ignored_devices
-        # Check explicit unique ID match or simple ID match (converted to string)
-        if unique_device_id in ignored or str(device_id) in ignored:
-            _LOGGER.debug("Ignoring device %s (matched ignore list)", unique_device_id)
+        # Ignore state, config entry and device object are resolved once per (model, id).
+        # We check both exact "43951" and "Bresser-7in1-43951" against the ignore list,
+        # mostly just ID is easier for user, but ID might not be unique across models.
+        try:
+            route = self._routes.get((model, device_id))
+        except TypeError:
+            # Unhashable id, can't be a real device
             return
+        if route is None:
+            route = self._async_build_route(model, device_id)
 
-        # Check if already configured
-        # We check if a Config Entry exists with this unique_id
-        entry = self.hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_device_id)
-        
-        if entry:
-            # Already configured, just update sensors
-            # Iterate through payload and update sensors
-            for key, value in payload.items():
-                if key in TRACKED_KEYS:
-                     unique_sensor_id = f"{unique_device_id}_{key}"
-                     async_dispatcher_send(self.hass, f"{SIGNAL_UPDATE_SENSOR}_{unique_sensor_id}", value)
+        if route.ignored:
+            self.counters["ignored"] += 1
+            _LOGGER.debug("Ignoring device %s (matched ignore list)", route.unique_id)
+            return
+
+        unique_device_id = route.unique_id
+        if self.dedup and self.dedup.is_duplicate(unique_device_id, payload, self._receiver(msg.topic)):
+            # Same transmission from another receiver, already handled
+            self.counters["duplicates"] += 1
+            return
+
+        device_packets = self.device_packets
+        if unique_device_id in device_packets or len(device_packets) < MAX_DEVICE_COUNTS:
+            device_packets[unique_device_id] += 1
+
+        device = route.device
+        if device is None and self.identity:
+            # A battery swap gives many sensors a new id on the same channel
+            device = self._async_rebind(model, device_id, unique_device_id, payload, msg.topic)
+
+        if device is not None:
+            # Already configured, update all sensors of the device in one pass
+            if self.identity and (channel := payload.get("channel")) is not None:
+                self.identity.async_seen(device, channel, self._receiver(msg.topic))
+            if self.availability:
+                self.availability.async_seen(device)
+            if self.validator and (rejected := self.validator.async_check(device, payload)):
+                # Bad decodes that passed the checksum, the rest of the packet is still good
+                self.counters["rejected"] += rejected
+            device.async_update(payload, self.throttle, self.fields)
+            if self.aggregator:
+                self.aggregator.async_feed(device, payload)
         else:
             # Not configured, trigger discovery flow
-            discovery_info = {
-                "unique_id": unique_device_id,
-                "model": model,
-                "identifiers": [DOMAIN, unique_device_id], # Pass as list
+            self.counters["unknown"] += 1
+            seen = self._async_record_seen(model, unique_device_id, payload)
+            if self._async_sighted(seen):
+                await self._async_start_discovery(model, unique_device_id, payload)
+            else:
+                # Passing cars and neighbours are heard once or twice, not worth a flow yet
+                self.counters["flows_deferred"] += 1
+
+    @callback
+    def _async_rebind(
+        self, model: str, device_id: Any, unique_device_id: str, payload: dict[str, Any], topic: str
+    ) -> Rtl433Device | None:
+        """Bind an unknown id to the silent configured device it replaces, if any."""
+        seen = self.seen_devices.get(unique_device_id)
+        device = self.identity.async_match(
+            model,
+            payload,
+            seen.first_heard if seen is not None else time.time(),
+            self._receiver(topic),
+            self.hass.data.get(DATA_DEVICES, {}),
+            self.fields,
+        )
+        if device is None:
+            return None
+
+        _LOGGER.info("Binding %s to %s, which went silent on the same channel", unique_device_id, device.unique_id)
+        self.counters["rebound"] += 1
+        self.identity.async_add_alias(unique_device_id, device.unique_id)
+        device.async_set_alias(unique_device_id)
+        # Routes of the old id and the discovery state of the new one are stale now
+        self._async_forget(device.unique_id)
+        self._async_forget(unique_device_id)
+        self._async_abort_flows({unique_device_id})
+        self._async_build_route(model, device_id)
+        return device
+
+    @callback
+    def _async_unbind(self, unique_device_id: str, model: str, alias: str) -> None:
+        """Drop the alias of a device whose original id is heard again."""
+        _LOGGER.info("Unbinding %s from %s, which transmits with its own id again", alias, unique_device_id)
+        self.counters["unbound"] += 1
+        device = async_get_device(self.hass, unique_device_id, model)
+        device.async_set_alias(None)
+        # The readings since the binding came from another device
+        device.readings.clear()
+        device.strikes.clear()
+        # The cached route of the alias is kept under the device it was bound to
+        self._async_forget(unique_device_id)
+        self._async_forget(alias)
+
+    @callback
+    def _async_record_seen(self, model: str, unique_device_id: str, payload: dict[str, Any]) -> SeenDevice:
+        """Update the table of unconfigured devices."""
+        now = time.monotonic()
+        seen_devices = self.seen_devices
+        if (seen := seen_devices.get(unique_device_id)) is None:
+            if len(seen_devices) >= MAX_SEEN_DEVICES:
+                # Passing traffic churns through the stale end, devices that keep transmitting stay
+                seen_devices.popitem(last=False)
+                self.counters["seen_evicted"] += 1
+            seen = seen_devices[unique_device_id] = SeenDevice(model, now, self.discovery_sightings)
+        else:
+            seen_devices.move_to_end(unique_device_id)
+        # Measured from the last sighting, a device sending every few seconds still adds one per gap
+        if not seen.sightings or now - seen.sightings[-1] >= SIGHTING_GAP:
+            seen.sightings.append(now)
+        seen.last_seen = now
+        seen.packets += 1
+        if (rssi := payload.get("rssi")) is not None:
+            seen.rssi = rssi
+        if not seen.keys.issuperset(payload.keys() & self.fields.keys()):
+            seen.keys.update(payload.keys() & self.fields.keys())
+        return seen
+
+    def _async_sighted(self, seen: SeenDevice) -> bool:
+        """Return True once an unknown device transmitted often enough to be offered."""
+        if self.discovery_sightings <= 1:
+            return True
+        sightings = seen.sightings
+        return (
+            len(sightings) >= self.discovery_sightings
+            and sightings[-1] - sightings[0] <= self.discovery_window
+        )
+
+    def top_seen_devices(self, count: int = TOP_SEEN_DEVICES) -> list[tuple[str, SeenDevice]]:
+        """Return the unconfigured devices with the most packets, busiest first."""
+        return heapq.nlargest(count, self.seen_devices.items(), key=lambda item: item[1].packets)
+
+    @callback
+    def async_select_seen(
+        self, model: str = "*", min_packets: int = 0, min_rssi: float | None = None
+    ) -> list[str]:
+        """Return the unconfigured devices matching a model glob and thresholds."""
+        return [
+            unique_id
+            for unique_id, seen in self.seen_devices.items()
+            if fnmatch.fnmatchcase(seen.model, model)
+            and seen.packets >= min_packets
+            and (min_rssi is None or (seen.rssi is not None and seen.rssi >= min_rssi))
+        ]
+
+    async def async_adopt(self, unique_ids: list[str]) -> None:
+        """Create device entries for unconfigured devices in one pass."""
+        if self.host_devices:
+            await self.async_host(
+                {
+                    unique_id: (seen.model, seen.keys)
+                    for unique_id in unique_ids
+                    if (seen := self.seen_devices.get(unique_id)) is not None
+                }
+            )
+            return
+
+        config_entries = self.hass.config_entries
+        devices = {}
+        for unique_id in unique_ids:
+            if (seen := self.seen_devices.get(unique_id)) is None:
+                continue
+            if config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_id) is not None:
+                continue
+            devices[unique_id] = {
+                "unique_id": unique_id,
+                "model": seen.model,
+                "identifiers": [DOMAIN, unique_id],
+                CONF_KEYS: sorted(seen.keys),
             }
-            # We add all payload data to discovery info so we can use it if needed, 
-            # though usually we only need model/id to create the entry.
-            # But the entry data usually needs to look like what the device entry expects.
-            # Wait, the device entry just needs model/id to start.
-            
-            # We trigger the flow. This will match against active flows by unique_id automatically.
-            await self.hass.config_entries.flow.async_init(
-                DOMAIN,
-                context={"source": "discovery"}, 
-                data=discovery_info
+
+        self._async_abort_flows(set(devices))
+        await asyncio.gather(
+            *(
+                config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_ADOPT}, data=data)
+                for data in devices.values()
             )
+        )
+
+    async def async_host(self, members: dict[str, tuple[str, Any]], flow_id: str | None = None) -> None:
+        """Add devices to the bridge, unique_id -> (model, keys).
+
+        flow_id is the discovery flow doing the adding, it finishes on its own.
+        """
+        await self.hosted.async_add(members)
+        for unique_id in members:
+            self._async_forget(unique_id)
+        self._async_abort_flows(set(members), flow_id)
+
+    @callback
+    def async_unhost(self, unique_id: str) -> None:
+        """Remove a device from the bridge."""
+        self.hosted.async_remove(unique_id)
+        self.identity.async_forget(unique_id)
+        self._async_forget(unique_id)
+
+    @callback
+    def _async_forget(self, unique_id: str) -> None:
+        """Drop the cached route and discovery state of a device."""
+        self._pending_flows.pop(unique_id, None)
+        self.seen_devices.pop(unique_id, None)
+        if (route_key := self._route_keys.pop(unique_id, None)) is not None:
+            self._routes.pop(route_key, None)
+        if self._field_routes:
+            # Topics of a new device may be cached as unrouted, rebuilt on the next field
+            self._async_clear_field_routes()
+
+    @callback
+    def _async_abort_flows(self, unique_ids: set[str], skip_flow_id: str | None = None) -> None:
+        """Abort discovery cards of devices that are configured now."""
+        flow_manager = self.hass.config_entries.flow
+        for flow in flow_manager.async_progress_by_handler(DOMAIN):
+            if flow["context"].get("unique_id") in unique_ids and flow["flow_id"] != skip_flow_id:
+                flow_manager.async_abort(flow["flow_id"])
 
+    async def _async_start_discovery(self, model: str, unique_device_id: str, payload: dict[str, Any]):
+        """Start a discovery flow, at most once per discovery interval per device."""
+        # rtl_433 repeats each transmission a few times, and unknown neighbours keep
+        # transmitting, so without this every packet would create and abort a flow.
+        now = time.monotonic()
+        if self._pending_flows.get(unique_device_id, 0) > now:
+            self.counters["flows_suppressed"] += 1
+            return
+
+        if len(self._pending_flows) >= MAX_PENDING_FLOWS:
+            self._pending_flows = {
+                key: until for key, until in self._pending_flows.items() if until > now
+            }
+        # Mark as pending before awaiting, so repeats arriving meanwhile are suppressed
+        self._pending_flows[unique_device_id] = now + self.discovery_interval
+        self.counters["flows_started"] += 1
+
+        discovery_info = {
+            "unique_id": unique_device_id,
+            "model": model,
+            "identifiers": [DOMAIN, unique_device_id], # Pass as list
+            # Sensors are created for these keys once the device is confirmed
+            CONF_KEYS: sorted(self.fields.keys() & payload.keys()),
+        }
+        if self.host_devices:
+            # Confirming adds the device to this bridge instead of creating an entry
+            discovery_info[CONF_BRIDGE] = self.entry.entry_id
+        # We trigger the flow. This will match against active flows by unique_id automatically.
+        result = await self.hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": "discovery"},
+            data=discovery_info
+        )
+        if isinstance(result, dict) and result.get("type") == FlowResultType.ABORT:
+            # Flow already waiting for the user or device already set up, back off for longer
+            self._pending_flows[unique_device_id] = (
+                time.monotonic() + self.discovery_interval * NEGATIVE_CACHE_FACTOR
+            )
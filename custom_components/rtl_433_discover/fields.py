@@ -0,0 +1,257 @@
+"""Catalogue of the rtl_433 output fields we turn into sensors."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import math
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import (
+    CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    CONCENTRATION_PARTS_PER_MILLION,
+    DEGREE,
+    LIGHT_LUX,
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfLength,
+    UnitOfPower,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfVolumetricFlux,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    """How one rtl_433 output key maps onto a sensor."""
+
+    name: str
+    device_class: SensorDeviceClass | None = None
+    unit: str | None = None
+    state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT
+    # Applied to the raw value before it reaches the sensor
+    convert: Callable[[Any], Any] | None = None
+    # Plausible raw values, readings outside are dropped as bad decodes
+    minimum: float | None = None
+    maximum: float | None = None
+    # Largest plausible change per minute
+    max_rate: float | None = None
+    # Reception details rather than readings, diagnostic and disabled by default
+    diagnostic: bool = False
+
+
+_TEMPERATURE = (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS)
+_TEMPERATURE_F = (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.FAHRENHEIT)
+_WIND_M_S = (SensorDeviceClass.WIND_SPEED, UnitOfSpeed.METERS_PER_SECOND)
+_WIND_KM_H = (SensorDeviceClass.WIND_SPEED, UnitOfSpeed.KILOMETERS_PER_HOUR)
+_WIND_MI_H = (SensorDeviceClass.WIND_SPEED, UnitOfSpeed.MILES_PER_HOUR)
+
+# rtl_433 key -> (name, device class, unit[, state class])
+# Key names follow the rtl_433 data output conventions (docs/DATA_FORMAT.md).
+_CATALOGUE: dict[str, tuple] = {
+    # Temperature and humidity
+    "temperature_C": ("Temperature", *_TEMPERATURE),
+    "temperature_F": ("Temperature", *_TEMPERATURE_F),
+    "temperature_1_C": ("Temperature 1", *_TEMPERATURE),
+    "temperature_2_C": ("Temperature 2", *_TEMPERATURE),
+    "temperature_1_F": ("Temperature 1", *_TEMPERATURE_F),
+    "temperature_2_F": ("Temperature 2", *_TEMPERATURE_F),
+    "setpoint_C": ("Setpoint", *_TEMPERATURE),
+    "humidity": ("Humidity", SensorDeviceClass.HUMIDITY, PERCENTAGE),
+    "humidity_1": ("Humidity 1", SensorDeviceClass.HUMIDITY, PERCENTAGE),
+    "humidity_2": ("Humidity 2", SensorDeviceClass.HUMIDITY, PERCENTAGE),
+    "moisture": ("Moisture", SensorDeviceClass.MOISTURE, PERCENTAGE),
+    # Pressure, including TPMS
+    "pressure_hPa": ("Pressure", SensorDeviceClass.PRESSURE, UnitOfPressure.HPA),
+    "pressure_kPa": ("Pressure", SensorDeviceClass.PRESSURE, UnitOfPressure.KPA),
+    "pressure_bar": ("Pressure", SensorDeviceClass.PRESSURE, UnitOfPressure.BAR),
+    "pressure_PSI": ("Pressure", SensorDeviceClass.PRESSURE, UnitOfPressure.PSI),
+    "pressure_inHg": ("Pressure", SensorDeviceClass.PRESSURE, UnitOfPressure.INHG),
+    # Wind
+    "wind_max_m_s": ("Wind Max", *_WIND_M_S),
+    "wind_avg_m_s": ("Wind Avg", *_WIND_M_S),
+    "wind_max_km_h": ("Wind Max", *_WIND_KM_H),
+    "wind_avg_km_h": ("Wind Avg", *_WIND_KM_H),
+    "wind_max_mi_h": ("Wind Max", *_WIND_MI_H),
+    "wind_avg_mi_h": ("Wind Avg", *_WIND_MI_H),
+    "wind_dir_deg": ("Wind Direction", None, DEGREE),
+    # Rain
+    "rain_mm": ("Rain", SensorDeviceClass.PRECIPITATION, UnitOfLength.MILLIMETERS, SensorStateClass.TOTAL_INCREASING),
+    "rain_in": ("Rain", SensorDeviceClass.PRECIPITATION, UnitOfLength.INCHES, SensorStateClass.TOTAL_INCREASING),
+    "rain_rate_mm_h": ("Rain Rate", SensorDeviceClass.PRECIPITATION_INTENSITY, UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR),
+    "rain_rate_in_h": ("Rain Rate", SensorDeviceClass.PRECIPITATION_INTENSITY, UnitOfVolumetricFlux.INCHES_PER_HOUR),
+    # Light
+    "light_lux": ("Light", SensorDeviceClass.ILLUMINANCE, LIGHT_LUX),
+    # Illuminance sensors only take lx, devices sending klx also send light_lux
+    "light_klx": ("Light (k)", None, "klx"),
+    "uv": ("UV Index", None, "UV"),
+    "uvi": ("UV Index", None, "UV"),
+    # Air quality
+    "co2_ppm": ("CO2", SensorDeviceClass.CO2, CONCENTRATION_PARTS_PER_MILLION),
+    "pm2_5_ug_m3": ("PM2.5", SensorDeviceClass.PM25, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    "pm10_ug_m3": ("PM10", SensorDeviceClass.PM10, CONCENTRATION_MICROGRAMS_PER_CUBIC_METER),
+    # Power and energy meters
+    "power_W": ("Power", SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "power0_W": ("Power 0", SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "power1_W": ("Power 1", SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "power2_W": ("Power 2", SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "energy_kWh": ("Energy", SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR, SensorStateClass.TOTAL_INCREASING),
+    "current_A": ("Current", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
+    "current": ("Current", SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
+    "voltage_V": ("Voltage", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
+    # Lightning
+    "storm_dist_km": ("Storm Distance", SensorDeviceClass.DISTANCE, UnitOfLength.KILOMETERS),
+    "strike_count": ("Strike Count", None, None, SensorStateClass.TOTAL_INCREASING),
+    # Battery
+    "battery_ok": ("Battery OK", None, None, None),
+    "battery_mV": ("Battery Voltage", SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.MILLIVOLT),
+    # Radio
+    "rssi": ("RSSI", SensorDeviceClass.SIGNAL_STRENGTH, SIGNAL_STRENGTH_DECIBELS),
+    "snr": ("SNR", SensorDeviceClass.SIGNAL_STRENGTH, SIGNAL_STRENGTH_DECIBELS),
+}
+
+
+# Keys describing the reception, not the device, rtl_433 adds them with -M level
+_DIAGNOSTIC = frozenset({"rssi", "snr"})
+
+# rtl_433 key -> (minimum, maximum[, max change per minute]) of the raw value.
+# Bounds are what the hardware can report, not what the weather usually does,
+# a bad decode that still passed the checksum is what they catch.
+_LIMITS: dict[str, tuple] = {
+    "temperature_C": (-60, 80, 10),
+    "temperature_F": (-76, 176, 18),
+    # Probes of BBQ and pool thermometers
+    "temperature_1_C": (-60, 300, 30),
+    "temperature_2_C": (-60, 300, 30),
+    "temperature_1_F": (-76, 572, 54),
+    "temperature_2_F": (-76, 572, 54),
+    "setpoint_C": (0, 40),
+    "humidity": (0, 100),
+    "humidity_1": (0, 100),
+    "humidity_2": (0, 100),
+    "moisture": (0, 100),
+    "pressure_hPa": (300, 1100),
+    "pressure_kPa": (0, 1500),
+    "pressure_bar": (0, 15),
+    "pressure_PSI": (0, 220),
+    "pressure_inHg": (8, 33),
+    "wind_max_m_s": (0, 75),
+    "wind_avg_m_s": (0, 75),
+    "wind_max_km_h": (0, 270),
+    "wind_avg_km_h": (0, 270),
+    "wind_max_mi_h": (0, 170),
+    "wind_avg_mi_h": (0, 170),
+    "wind_dir_deg": (0, 360),
+    "rain_mm": (0, None),
+    "rain_in": (0, None),
+    "rain_rate_mm_h": (0, 2000),
+    "rain_rate_in_h": (0, 80),
+    "light_lux": (0, 200_000),
+    "light_klx": (0, 200),
+    "uv": (0, 20),
+    "uvi": (0, 20),
+    "co2_ppm": (0, 10_000),
+    "pm2_5_ug_m3": (0, 2000),
+    "pm10_ug_m3": (0, 2000),
+    "energy_kWh": (0, None),
+    "storm_dist_km": (0, 100),
+    "strike_count": (0, None),
+    "battery_ok": (0, 1),
+    "battery_mV": (0, 10_000),
+}
+
+
+def _compile(catalogue: dict[str, tuple]) -> dict[str, FieldSpec]:
+    """Turn the declarative tuples into FieldSpecs."""
+    return {
+        key: FieldSpec(
+            *spec,
+            **dict(zip(("minimum", "maximum", "max_rate"), _LIMITS.get(key, ()))),
+            diagnostic=key in _DIAGNOSTIC,
+        )
+        for key, spec in catalogue.items()
+    }
+
+
+# Frozen lookup table used on the hot path
+FIELDS: Mapping[str, FieldSpec] = MappingProxyType(_compile(_CATALOGUE))
+
+
+def default_field(key: str) -> FieldSpec:
+    """Return a generic spec for a key missing from the catalogue."""
+    return FieldSpec(key.replace("_", " ").title(), state_class=None)
+
+
+def parse_field_overrides(value: str | None) -> dict[str, FieldSpec]:
+    """Parse "key=device_class|unit|state_class|scale|min|max|rate, ..." into FieldSpecs.
+
+    Every part after the key is optional, e.g. "depth_cm=distance|cm" or
+    "counter=||total_increasing". A scale multiplies the raw value, e.g.
+    "light_klx=illuminance|lx||1000". The plausibility limits of the raw value
+    are kept from the catalogue unless given, "none" removes one, e.g.
+    "temperature_1_C=temperature|°C||||500|none". Raises ValueError on
+    malformed entries.
+    """
+    overrides = {}
+    if not value:
+        return overrides
+    for item in value.split(","):
+        if not (item := item.strip()):
+            continue
+        key, sep, spec = item.partition("=")
+        if not sep or not (key := key.strip()):
+            raise ValueError(f"Invalid field override: {item}")
+        device_class, unit, state_class, scale, *limits = (
+            part.strip() or None for part in (spec.split("|") + [""] * 7)[:7]
+        )
+        base = FIELDS.get(key) or default_field(key)
+        minimum, maximum, max_rate = (
+            current if limit is None else _limit(limit)
+            for limit, current in zip(limits, (base.minimum, base.maximum, base.max_rate))
+        )
+        overrides[key] = FieldSpec(
+            base.name,
+            SensorDeviceClass(device_class) if device_class else None,
+            unit,
+            SensorStateClass(state_class) if state_class else None,
+            _scaled(float(scale)) if scale else None,
+            # Limits apply to the raw value, a scale doesn't change them
+            minimum,
+            maximum,
+            max_rate,
+            base.diagnostic,
+        )
+    return overrides
+
+
+def _limit(value: str) -> float | None:
+    """Parse one limit of a field override, "none" for no limit."""
+    if value.lower() == "none":
+        return None
+    if math.isnan(limit := float(value)):
+        raise ValueError(f"Invalid limit: {value}")
+    return limit
+
+
+def build_fields(overrides: dict[str, FieldSpec]) -> Mapping[str, FieldSpec]:
+    """Return the catalogue with user overrides applied."""
+    if not overrides:
+        return FIELDS
+    return MappingProxyType({**FIELDS, **overrides})
+
+
+def _scaled(factor: float) -> Callable[[Any], Any]:
+    """Return a converter multiplying numeric values by factor."""
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value * factor
+        return value
+
+    return convert
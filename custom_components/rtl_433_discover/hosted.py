@@ -0,0 +1,224 @@
+"""Devices hosted by the bridge entry instead of one config entry each."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
+
+from .aggregate import AGGREGATE_KEYS
+from .const import DOMAIN, CONF_ALIAS, CONF_KEYS, SOURCE_ADOPT, CONF_TOPIC_PREFIX, DATA_CACHE, DATA_DEVICES
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Key updates are batched, a new device sends all its keys within a few packets
+SAVE_DELAY = 10
+
+
+class HostedDevices:
+    """Membership of the devices a bridge hosts, kept in a Store.
+
+    All hosted devices share the sensor platform of the bridge entry, so startup
+    is one platform setup and one `async_add_entities` call no matter how many
+    devices there are.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.entry = entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.devices"
+        )
+        # Mode the membership was last migrated to, so switching modes migrates once
+        self.enabled = False
+        # unique_id -> {"model": ..., "keys": [...], "alias": ...}, alias only once the id changed
+        self.devices: dict[str, dict[str, Any]] = {}
+        self.add_entities: AddEntitiesCallback | None = None
+
+    async def async_load(self) -> None:
+        """Load the membership, once at bridge setup."""
+        if (data := await self._store.async_load()) is not None:
+            self.enabled = data["enabled"]
+            self.devices = data["devices"]
+
+    async def async_save(self) -> None:
+        """Write the membership now."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove_store(self) -> None:
+        """Delete the stored membership of a removed bridge."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {"enabled": self.enabled, "devices": self.devices}
+
+    @callback
+    def async_setup_platform(self, add_entities: AddEntitiesCallback) -> list:
+        """Attach the bridge sensor platform and return the sensors of all devices."""
+        self.add_entities = add_entities
+        sensors = []
+        for unique_id in self.devices:
+            sensors.extend(self._async_setup_device(unique_id))
+        return sensors
+
+    @callback
+    def async_unload_platform(self) -> None:
+        """Detach the bridge sensor platform."""
+        self.add_entities = None
+        devices = self.hass.data.get(DATA_DEVICES, {})
+        for unique_id in self.devices:
+            if (device := devices.get(unique_id)) is not None:
+                device.async_unload_platform()
+
+    @callback
+    def _async_setup_device(self, unique_id: str) -> list:
+        """Attach a hosted device to the platform and return its sensors."""
+        # Imported here, the sensor platform imports the manager which imports this module
+        from .device import async_get_device # pylint: disable=import-outside-toplevel
+        from .sensor import async_build_sensors # pylint: disable=import-outside-toplevel
+
+        member = self.devices[unique_id]
+        device = async_get_device(self.hass, unique_id, member["model"])
+        device.async_setup_platform(self.hass, self.entry, self.add_entities, self)
+        return async_build_sensors(self.hass, device, member["keys"])
+
+    async def async_add(self, members: dict[str, tuple[str, list[str]]]) -> None:
+        """Host new devices, unique_id -> (model, keys)."""
+        members = {
+            unique_id: member for unique_id, member in members.items() if unique_id not in self.devices
+        }
+        if not members:
+            return
+        for unique_id, (model, keys) in members.items():
+            self.devices[unique_id] = {"model": model, "keys": sorted(keys)}
+        await self.async_save()
+        if self.add_entities is None:
+            return
+        sensors = []
+        for unique_id in members:
+            sensors.extend(self._async_setup_device(unique_id))
+        self.add_entities(sensors)
+
+    @callback
+    def async_remove(self, unique_id: str) -> None:
+        """Stop hosting a device."""
+        if self.devices.pop(unique_id, None) is None:
+            return
+        self._store.async_delay_save(self._data_to_save)
+        if (device := self.hass.data.get(DATA_DEVICES, {}).pop(unique_id, None)) is not None:
+            device.async_unload_platform()
+        if (cache := self.hass.data.get(DATA_CACHE)) is not None:
+            cache.async_forget(unique_id)
+
+    @callback
+    def async_set_keys(self, unique_id: str, keys: set[str]) -> None:
+        """Remember the keys a hosted device sends."""
+        if (member := self.devices.get(unique_id)) is None:
+            return
+        member["keys"] = sorted(keys)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_set_alias(self, unique_id: str, alias: str | None) -> None:
+        """Remember the id a hosted device sends since it changed, None to forget it."""
+        if (member := self.devices.get(unique_id)) is None:
+            return
+        if alias is None:
+            member.pop(CONF_ALIAS, None)
+        else:
+            member[CONF_ALIAS] = alias
+        self._store.async_delay_save(self._data_to_save)
+
+
+async def async_migrate_to_hosted(hass: HomeAssistant, bridge: ConfigEntry, hosted: HostedDevices) -> None:
+    """Move every device entry into the bridge, keeping entity and device registry entries."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    entries = [
+        entry for entry in hass.config_entries.async_entries(DOMAIN)
+        if CONF_TOPIC_PREFIX not in entry.data and entry.source != SOURCE_IGNORE and entry.unique_id
+    ]
+    members = {}
+    aliases = {}
+    for entry in entries:
+        registry_entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+        keys = entry.data.get(CONF_KEYS)
+        if keys is None:
+            prefix = f"{entry.unique_id}_"
+            # Derived sensors are not keys the device sends
+            keys = [
+                key
+                for registry_entry in registry_entries
+                if (key := registry_entry.unique_id.removeprefix(prefix)) not in AGGREGATE_KEYS
+            ]
+        members[entry.unique_id] = (entry.data["model"], keys)
+        if (alias := entry.data.get(CONF_ALIAS)) is not None:
+            aliases[entry.unique_id] = alias
+
+        # Hand the entities and the device over before the entry goes away with them
+        for registry_entry in registry_entries:
+            entity_registry.async_update_entity(registry_entry.entity_id, config_entry_id=bridge.entry_id)
+        if (device_entry := device_registry.async_get_device(identifiers={(DOMAIN, entry.unique_id)})) is not None:
+            device_registry.async_update_device(device_entry.id, add_config_entry_id=bridge.entry_id)
+
+    # Membership is saved before any entry is removed, nothing is lost if we stop halfway
+    hosted.enabled = True
+    hosted.devices.update(
+        {unique_id: {"model": model, "keys": sorted(keys)} for unique_id, (model, keys) in members.items()}
+    )
+    for unique_id, alias in aliases.items():
+        hosted.devices[unique_id][CONF_ALIAS] = alias
+    await hosted.async_save()
+    for entry in entries:
+        await hass.config_entries.async_remove(entry.entry_id)
+    _LOGGER.info("Moved %s device entries into %s", len(entries), bridge.title)
+
+
+async def async_migrate_to_entries(hass: HomeAssistant, bridge: ConfigEntry, hosted: HostedDevices) -> None:
+    """Give every hosted device its own config entry again."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    devices = [
+        {
+            "unique_id": unique_id,
+            "model": member["model"],
+            "identifiers": [DOMAIN, unique_id],
+            CONF_KEYS: member["keys"],
+            **({CONF_ALIAS: member[CONF_ALIAS]} if CONF_ALIAS in member else {}),
+        }
+        for unique_id, member in hosted.devices.items()
+        if hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_id) is None
+    ]
+    results = await asyncio.gather(
+        *(
+            hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_ADOPT}, data=data)
+            for data in devices
+        )
+    )
+
+    bridge_entities = er.async_entries_for_config_entry(entity_registry, bridge.entry_id)
+    entries = [result["result"] for result in results if result["type"] == FlowResultType.CREATE_ENTRY]
+    for entry in entries:
+        # Entities keep their ids and customizations, the setup of the new entry has claimed
+        # the ones it creates right away, the rest follow here
+        prefix = f"{entry.unique_id}_"
+        for registry_entry in bridge_entities:
+            if registry_entry.unique_id.startswith(prefix):
+                entity_registry.async_update_entity(registry_entry.entity_id, config_entry_id=entry.entry_id)
+        if (device_entry := device_registry.async_get_device(identifiers={(DOMAIN, entry.unique_id)})) is not None:
+            device_registry.async_update_device(device_entry.id, remove_config_entry_id=bridge.entry_id)
+
+    hosted.enabled = False
+    hosted.devices.clear()
+    await hosted.async_save()
+    _LOGGER.info("Moved %s hosted devices out of %s", len(entries), bridge.title)
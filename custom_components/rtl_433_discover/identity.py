@@ -0,0 +1,104 @@
+"""Keeping the identity of devices that pick a new id with every battery."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from .device import Rtl433Device
+
+# A slot is where a device transmits: (model, channel, receiver)
+Slot = tuple[str, Any, str]
+
+
+class IdentityIndex:
+    """Which configured device was last heard on each slot, and the ids bound to them.
+
+    Acurite, LaCrosse, Nexus and others choose a random id at power up, so a
+    battery swap looks like a brand new device on the same channel. When an
+    unknown id shows up on the slot of a configured device that has been silent
+    for `silence` seconds, was first heard after that device went silent, and
+    sends no keys that device didn't, the new id is bound to it as an alias
+    instead of being discovered again. A neighbour's sensor that was already
+    transmitting next to ours never qualifies, and should the original id be
+    heard again the alias is dropped.
+
+    Configured devices only cost a tuple compare per packet, unknown ones a dict
+    hit on the slot map.
+    """
+
+    def __init__(self, silence: float) -> None:
+        """Initialize."""
+        self.silence = silence
+        self.slots: dict[Slot, str] = {} # slot -> unique_id of the configured device
+        self.aliases: dict[str, str] = {} # unique_id the device sends -> unique_id of its entry
+        self._alias_of: dict[str, str] = {} # unique_id of the entry -> current alias
+
+    def __bool__(self) -> bool:
+        """Return True if rebinding is enabled."""
+        return self.silence > 0
+
+    @callback
+    def async_add_alias(self, alias: str, unique_id: str) -> None:
+        """Bind an id to a configured device, replacing the id bound before."""
+        if (previous := self._alias_of.get(unique_id)) is not None:
+            self.aliases.pop(previous, None)
+        self.aliases[alias] = unique_id
+        self._alias_of[unique_id] = alias
+
+    @callback
+    def async_remove_alias(self, unique_id: str) -> str | None:
+        """Unbind the id bound to a configured device, return it if there was one."""
+        if (alias := self._alias_of.pop(unique_id, None)) is not None:
+            self.aliases.pop(alias, None)
+        return alias
+
+    @callback
+    def async_seen(self, device: Rtl433Device, channel: Any, receiver: str) -> None:
+        """Remember the slot a configured device transmits on."""
+        if (slot := (device.model, channel, receiver)) != device.slot:
+            device.slot = slot
+            self.slots[slot] = device.unique_id
+
+    @callback
+    def async_match(
+        self,
+        model: str,
+        payload: dict[str, Any],
+        first_heard: float,
+        receiver: str,
+        devices: Mapping[str, Rtl433Device],
+        fields: Mapping[str, Any],
+    ) -> Rtl433Device | None:
+        """Return the silent configured device an unknown device replaces, if any.
+
+        first_heard is the timestamp of the first packet of the unknown device.
+        """
+        if (channel := payload.get("channel")) is None:
+            return None
+        if (unique_id := self.slots.get((model, channel, receiver))) is None:
+            return None
+        device = devices.get(unique_id)
+        # Devices without a loaded platform have no keys to compare against
+        if device is None or device.last_seen is None or not device.keys:
+            return None
+        if time.time() - device.last_seen < self.silence:
+            return None
+        # Heard while our device was still transmitting, a neighbour and not a new id of ours
+        if first_heard <= device.last_seen:
+            return None
+        keys = payload.keys() & fields.keys()
+        if not keys or not keys <= device.keys:
+            return None
+        return device
+
+    @callback
+    def async_forget(self, unique_id: str) -> None:
+        """Drop a removed device."""
+        if (alias := self._alias_of.pop(unique_id, None)) is not None:
+            self.aliases.pop(alias, None)
+        if unique_id in self.slots.values():
+            self.slots = {slot: owner for slot, owner in self.slots.items() if owner != unique_id}
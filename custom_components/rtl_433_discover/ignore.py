@@ -0,0 +1,96 @@
+"""Precompiled ignore list matching."""
+from __future__ import annotations
+
+import fnmatch
+import logging
+import re
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entries starting with this prefix are treated as raw regular expressions
+REGEX_PREFIX = "re:"
+GLOB_CHARS = frozenset("*?[")
+
+# Upper bound for cached per-device decisions, so passing traffic can't grow it forever
+MAX_CACHE_SIZE = 4096
+
+
+def parse_ignore_option(value: str | None) -> list[str]:
+    """Split the comma separated ignore option into clean entries."""
+    if not value:
+        return []
+    return [x.strip() for x in value.split(",") if x.strip()]
+
+
+def _entry_pattern(entry: str) -> str:
+    """Return the regex of a regex entry, raise ValueError if it does not compile."""
+    pattern = entry[len(REGEX_PREFIX):]
+    try:
+        # Checked the way it ends up in the combined pattern, inline flags only work at the start
+        re.compile(f"(?:{pattern})")
+    except re.error as err:
+        raise ValueError(f"Invalid regular expression {entry!r}: {err}") from err
+    return pattern
+
+
+class IgnoreMatcher:
+    """Match devices against the ignore list.
+
+    Exact entries ("Bresser-7in1-43951" or just "43951") go into a frozenset,
+    wildcard entries ("Acurite-*", "*-1234*") and regex entries ("re:^LaCrosse-.*")
+    are compiled into a single pattern. The decision for each device is cached,
+    so repeated packets from the same device cost one dict lookup.
+    """
+
+    def __init__(self, entries: list[str]) -> None:
+        """Compile the matcher, raise ValueError on an invalid regex entry."""
+        self.entries = tuple(entries)
+        exact = set()
+        patterns = []
+        for entry in entries:
+            if entry.startswith(REGEX_PREFIX):
+                patterns.append(_entry_pattern(entry))
+            elif GLOB_CHARS.intersection(entry):
+                patterns.append(fnmatch.translate(entry))
+            else:
+                exact.add(entry)
+
+        self._exact = frozenset(exact)
+        self._pattern = re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+        self._cache: dict[str, bool] = {}
+
+    @classmethod
+    def from_option(cls, value: str | None) -> IgnoreMatcher:
+        """Build a matcher from the ignore_devices option string, skipping invalid regex entries."""
+        entries = []
+        for entry in parse_ignore_option(value):
+            if entry.startswith(REGEX_PREFIX):
+                try:
+                    _entry_pattern(entry)
+                except ValueError as err:
+                    _LOGGER.warning("Ignoring ignore_devices entry: %s", err)
+                    continue
+            entries.append(entry)
+        return cls(entries)
+
+    def __bool__(self) -> bool:
+        """Return True if there is anything to match against."""
+        return bool(self._exact) or self._pattern is not None
+
+    def is_ignored(self, unique_device_id: str, device_id) -> bool:
+        """Return True if the device is on the ignore list."""
+        cached = self._cache.get(unique_device_id)
+        if cached is not None:
+            return cached
+
+        bare_id = str(device_id)
+        ignored = unique_device_id in self._exact or bare_id in self._exact
+        if not ignored and self._pattern is not None:
+            ignored = bool(
+                self._pattern.fullmatch(unique_device_id) or self._pattern.fullmatch(bare_id)
+            )
+
+        if len(self._cache) >= MAX_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[unique_device_id] = ignored
+        return ignored
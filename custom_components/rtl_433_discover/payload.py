@@ -0,0 +1,59 @@
+"""Fast decoding of rtl_433 event payloads."""
+from __future__ import annotations
+
+try:
+    # orjson ships with Home Assistant and decodes bytes without a utf-8 round trip
+    from orjson import JSONDecodeError, loads as json_loads
+except ImportError: # pragma: no cover
+    from json import JSONDecodeError, loads as json_loads
+
+__all__ = ["JSONDecodeError", "json_loads", "peek_device", "parse_scalar", "NO_DEVICE"]
+
+# Returned when the payload can't possibly carry a device
+NO_DEVICE = ("", "")
+
+
+def peek_device(payload: bytes | str) -> tuple[str, str] | None:
+    """Return (model, id) read from the raw payload without decoding it.
+
+    rtl_433 writes compact JSON with plain "model" and "id" values, so a few
+    find() calls are enough. Returns NO_DEVICE if there is no model or id at all
+    (malformed or status messages), and None if the raw scan is inconclusive and
+    a full decode is needed.
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+
+    if (start := payload.find(b'"model":"')) < 0:
+        return None if b'"model"' in payload else NO_DEVICE
+    start += 9
+    end = payload.find(b'"', start)
+    if (id_start := payload.find(b'"id":', end)) < 0:
+        return None if b'"id"' in payload else NO_DEVICE
+    id_start += 5
+    if payload[id_start:id_start + 1] == b'"':
+        id_start += 1
+        id_end = payload.find(b'"', id_start)
+    elif (id_end := payload.find(b",", id_start)) < 0:
+        id_end = payload.find(b"}", id_start)
+    if id_end < 0 or b"\\" in payload[start:end]:
+        return None
+    return payload[start:end].decode(), payload[id_start:id_end].decode()
+
+
+def parse_scalar(payload: bytes | str) -> int | float | str:
+    """Return the value of a per-field topic.
+
+    rtl_433 publishes numbers as plain text and strings unquoted, so this is
+    not JSON, an int or float parse with the text as fallback is all it takes.
+    """
+    if isinstance(payload, bytes):
+        payload = payload.decode()
+    try:
+        return int(payload)
+    except ValueError:
+        pass
+    try:
+        return float(payload)
+    except ValueError:
+        return payload
@@ -0,0 +1,108 @@
+"""Bounded ingestion queue between MQTT and the discovery manager."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import callback
+
+from .payload import NO_DEVICE, peek_device
+
+_LOGGER = logging.getLogger(__name__)
+
+OVERFLOW_COALESCE = "coalesce"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICIES = [OVERFLOW_COALESCE, OVERFLOW_DROP_OLDEST]
+
+# Messages processed before yielding back to the event loop
+BATCH_SIZE = 50
+# Fill level from which the coalesce policy replaces queued messages of a device
+COALESCE_FILL = 0.8
+
+
+class IngestQueue:
+    """Decouple MQTT receipt from processing.
+
+    The MQTT callback only enqueues. A single worker drains the queue in
+    batches and yields to the event loop between batches, so a burst after a
+    broker reconnect or a retained replay doesn't stall everything else.
+
+    Under the coalesce policy, once the queue is COALESCE_FILL full, a device
+    that is already queued has its pending message replaced by the newer one
+    instead of taking another slot. Below that every message is kept, so
+    counters and events in back to back packets aren't lost to a short burst.
+    When the queue is full the oldest message is dropped.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Any], Awaitable[None]],
+        maxsize: int,
+        overflow: str = OVERFLOW_COALESCE,
+    ) -> None:
+        """Initialize."""
+        self._process = process
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+        # Queue holds keys, the message to process for each key lives here,
+        # so coalescing is a dict assignment instead of a queue scan.
+        self._pending: dict[Any, Any] = {}
+        self.overflow = overflow
+        self._coalesce_depth = maxsize * COALESCE_FILL
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Return the queue size."""
+        return self._queue.maxsize
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued messages."""
+        return self._queue.qsize()
+
+    @callback
+    def async_put(self, msg: Any) -> None:
+        """Queue a received message."""
+        key = None
+        queue = self._queue
+        if self.overflow == OVERFLOW_COALESCE and queue.qsize() >= self._coalesce_depth:
+            peek = peek_device(msg.payload)
+            if peek is not None and peek is not NO_DEVICE:
+                key = peek
+                if key in self._pending:
+                    self._pending[key] = msg
+                    self.coalesced += 1
+                    return
+        if key is None:
+            key = object()
+
+        if queue.full():
+            self._pending.pop(queue.get_nowait(), None)
+            self.dropped += 1
+        self._pending[key] = msg
+        queue.put_nowait(key)
+        if (depth := queue.qsize()) > self.max_depth:
+            self.max_depth = depth
+
+    async def async_run(self) -> None:
+        """Drain the queue until cancelled."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for key in batch:
+                if (msg := self._pending.pop(key, None)) is None:
+                    continue
+                try:
+                    await self._process(msg)
+                except Exception: # pylint: disable=broad-except
+                    _LOGGER.exception("Error processing message from %s", msg.topic)
+
+            # Let the rest of Home Assistant run between batches
+            await asyncio.sleep(0)
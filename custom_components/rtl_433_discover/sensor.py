@@ -1,90 +1,120 @@
 """Sensor platform for rtl_433 Discovery."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
 import logging
+import time
+from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.const import (
-    UnitOfTemperature,
-    UnitOfSpeed,
-    UnitOfLength,
-    PERCENTAGE,
-    LIGHT_LUX,
-)
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.const import UnitOfTime
+
+from .cache import async_get_cache
+from .const import DOMAIN, CONF_TOPIC_PREFIX, CONF_KEYS, DATA_FIELDS
+from .device import Rtl433Device, async_get_device, intern_keys
+from .fields import FIELDS, FieldSpec, default_field
 
-from .const import DOMAIN, SIGNAL_UPDATE_SENSOR
-from .discovery_manager import TRACKED_KEYS
+if TYPE_CHECKING:
+    # Annotations only, the platform of a device entry doesn't need the bridge modules
+    from .aggregate import AggregateSpec, RollingWindow
+    from .discovery_manager import Rtl433DiscoveryManager
 
 _LOGGER = logging.getLogger(__name__)
 
-# Mapping of rtl_433 keys to device classes and units
-SENSOR_TYPES = {
-    "temperature_C": {
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "unit": UnitOfTemperature.CELSIUS,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Temperature",
-    },
-    "humidity": {
-        "device_class": SensorDeviceClass.HUMIDITY,
-        "unit": PERCENTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Humidity",
-    },
-    "wind_max_m_s": {
-        "device_class": SensorDeviceClass.WIND_SPEED,
-        "unit": UnitOfSpeed.METERS_PER_SECOND,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Wind Max",
-    },
-    "wind_avg_m_s": {
-        "device_class": SensorDeviceClass.WIND_SPEED,
-        "unit": UnitOfSpeed.METERS_PER_SECOND,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Wind Avg",
-    },
-    "wind_dir_deg": {
-        "device_class": None, 
-        "unit": "°",
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Wind Direction",
-    },
-    "rain_mm": {
-        "device_class": SensorDeviceClass.PRECIPITATION,
-        "unit": UnitOfLength.MILLIMETERS,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "name": "Rain",
-    },
-    "light_lux": {
-        "device_class": SensorDeviceClass.ILLUMINANCE,
-        "unit": LIGHT_LUX,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Light",
-    },
-     "light_klx": {
-        "device_class": SensorDeviceClass.ILLUMINANCE,
-        "unit": "klx",
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "Light (k)",
-    },
-    "uv": {
-        "device_class": None,
-        "unit": "UV",
-        "state_class": SensorStateClass.MEASUREMENT,
-        "name": "UV Index",
-    },
-    "battery_ok": {
-        "device_class": None,
-        "unit": None,
-        "state_class": None,
-        "name": "Battery OK",
-    }
-}
+# Only the bridge diagnostics poll, device sensors are pushed
+SCAN_INTERVAL = timedelta(seconds=30)
+
+@dataclass(frozen=True, kw_only=True)
+class Rtl433BridgeSensorEntityDescription(SensorEntityDescription):
+    """Describes a bridge diagnostic sensor."""
+
+    value_fn: Callable[[Rtl433DiscoveryManager], float | int | None]
+
+
+BRIDGE_SENSORS: tuple[Rtl433BridgeSensorEntityDescription, ...] = (
+    Rtl433BridgeSensorEntityDescription(
+        key="decode_failures",
+        name="Decode failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["decode_failures"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="ignored_packets",
+        name="Ignored packets",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["ignored"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="unknown_packets",
+        name="Unknown device packets",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["unknown"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="flows_started",
+        name="Discovery flows started",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["flows_started"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="flows_suppressed",
+        name="Discovery flows suppressed",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["flows_suppressed"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="duplicate_packets",
+        name="Duplicate packets",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["duplicates"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="rejected_readings",
+        name="Rejected readings",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.counters["rejected"],
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="processing_time_p50",
+        name="Processing time p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda manager: manager.processing_time_percentile(50),
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="processing_time_p99",
+        name="Processing time p99",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda manager: manager.processing_time_percentile(99),
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="queue_depth",
+        name="Queue depth",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda manager: manager.queue.depth,
+    ),
+    Rtl433BridgeSensorEntityDescription(
+        key="queue_dropped",
+        name="Queue dropped packets",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda manager: manager.queue.dropped,
+    ),
+)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -92,78 +122,290 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the rtl_433 sensors for a specific device entry."""
+
+    if CONF_TOPIC_PREFIX in entry.data:
+        # The bridge has its diagnostic sensors, and the sensors of the devices it hosts
+        manager = hass.data[DOMAIN][entry.entry_id]
+        entities = [Rtl433BridgeRateSensor(manager)]
+        entities.extend(
+            Rtl433BridgeSensor(manager, description) for description in BRIDGE_SENSORS
+        )
+        entities.extend(manager.hosted.async_setup_platform(async_add_entities))
+        async_add_entities(entities)
+        return
     
+    await async_get_cache(hass)
     unique_device_id = entry.data["unique_id"]
     model = entry.data["model"]
+    device = async_get_device(hass, unique_device_id, model)
     
-    entities = []
-    # Create valid sensors for this device. 
-    # For now, since we don't know EXACTLY which fields a device has until we see it,
-    # we could just create ALL potential sensors, OR we could rely on the discovery info passed in?
-    # BUT, the ConfigEntry data `discovery_info` was static at time of discovery.
-    # `rtl_433` devices usually have a fixed set of fields.
-    # Let's create sensors for ALL `TRACKED_KEYS` and they will just stay `unavailable` if never updated?
-    # OR, better: We only create them if they were in the original discovery payload?
-    # Let's check `entry.data` for available keys?
-    # For simplicity, let's create what we saw in discovery, OR just all tracked keys.
-    # If we create all, it might clutter.
-    # If we create only saw, we might miss some that appear later?
-    # Usually `rtl_433` sends same set.
-    
-    # Let's assume we create all tracked keys to be safe and consistent.
-    
-    for key in TRACKED_KEYS:
-        entities.append(Rtl433Sensor(unique_device_id, model, key))
-        
-    async_add_entities(entities, True)
+    # Only keys the device was seen sending get an entity, new keys are added by
+    # the device object the first time they show up in a packet.
+    keys = entry.data.get(CONF_KEYS)
+    if keys is None:
+        # Entries from before keys were recorded keep the entities they already have,
+        # derived sensors come back from the aggregator once their source key arrives
+        from .aggregate import AGGREGATE_KEYS # pylint: disable=import-outside-toplevel
+
+        prefix = f"{unique_device_id}_"
+        keys = [
+            key
+            for registry_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+            if (key := registry_entry.unique_id.removeprefix(prefix)) not in AGGREGATE_KEYS
+        ]
+
+    device.async_setup_platform(hass, entry, async_add_entities)
+    async_add_entities(async_build_sensors(hass, device, keys))
+
+
+@callback
+def async_build_sensors(hass: HomeAssistant, device: Rtl433Device, keys) -> list[Rtl433Sensor]:
+    """Return the sensors of a device for the given keys, with their cached values."""
+    fields = hass.data.get(DATA_FIELDS, FIELDS)
+    cached = device.cache.devices.get(device.unique_id, {}).get("values", {}) if device.cache else {}
+    keys = intern_keys(keys)
+    device.keys.update(keys)
+    sensors = []
+    for key in sorted(keys):
+        sensor = Rtl433Sensor(device, key, fields.get(key) or default_field(key))
+        if (value := cached.get(key)) is not None:
+            sensor.async_restore(value)
+        sensors.append(sensor)
+    return sensors
 
 
 class Rtl433Sensor(SensorEntity):
-    """Representation of a rtl_433 sensor."""
+    """Representation of a rtl_433 sensor.
 
-    def __init__(self, unique_device_id, model, key):
+    Ids, names and units are read from the shared device record and the field
+    spec instead of being copied onto every sensor. Entities keep their
+    attributes in a __dict__, so only the device record is slotted.
+    """
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
+    def __init__(self, device, key, spec: FieldSpec, value=None):
         """Initialize the sensor."""
-        self._device_id = unique_device_id
-        self._model = model
+        self._device = device
         self._key = key
-        
-        self._attr_unique_id = f"{unique_device_id}_{key}"
-        self._attr_has_entity_name = True
-        
-        info = SENSOR_TYPES.get(key)
-        self._attr_name = info['name'] if info else key.replace("_", " ").title()
-        self._attr_device_class = info.get('device_class') if info else None
-        self._attr_native_unit_of_measurement = info.get('unit') if info else None
-        self._attr_state_class = info.get('state_class') if info else None
-        
-        self._state = None
-        
+        self._spec = spec
+        self._throttle = None
+
+        if value is not None and spec.convert is not None:
+            value = spec.convert(value)
+        self._state = value
+        # monotonic time of the last state write, the initial value is written when added
+        self.last_write = time.monotonic() if value is not None else 0.0
+        self.pending_value = None # value held back by the throttle
+
+    @property
+    def key(self) -> str:
+        """Return the rtl_433 key of this sensor."""
+        return self._key
+
+    @property
+    def unique_id(self) -> str:
+        """Return the unique id, built when asked, the registry keeps its own copy."""
+        return f"{self._device.unique_id}_{self._key}"
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return self._spec.name
+
+    @property
+    def device_class(self):
+        """Return the device class of the field."""
+        return self._spec.device_class
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return the unit of the field."""
+        return self._spec.unit
+
+    @property
+    def state_class(self):
+        """Return the state class of the field."""
+        return self._spec.state_class
+
+    @property
+    def entity_category(self) -> EntityCategory | None:
+        """Return diagnostic for reception details like the signal level."""
+        return EntityCategory.DIAGNOSTIC if self._spec.diagnostic else None
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Return False for reception details, they change with every packet."""
+        return not self._spec.diagnostic
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=f"{self._model} {self._device_id.split('-')[-1]}",
-            manufacturer="rtl_433",
-            model=self._model,
-        )
+        return self._device.device_info
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
         return self._state
 
+    @property
+    def available(self) -> bool:
+        """Return False once the device stopped transmitting."""
+        return self._device.available
+
+    @callback
+    def async_set_value(self, value, throttle=None):
+        """Update the state, skipping the write if nothing changed."""
+        if (convert := self._spec.convert) is not None:
+            value = convert(value)
+        if throttle is not None and throttle.async_hold(self, value):
+            self._throttle = throttle
+            return
+        self.pending_value = None
+        # rtl_433 repeats identical readings constantly, don't churn the state machine
+        if value == self._state:
+            return
+        self._write_value(value)
+
+    @callback
+    def async_restore(self, value):
+        """Start from the value cached before the restart."""
+        self._state = value
+
+    @callback
+    def async_flush(self):
+        """Write the value held back by the throttle."""
+        value, self.pending_value = self.pending_value, None
+        if value is not None and value != self._state:
+            self._write_value(value)
+
+    @callback
+    def _write_value(self, value):
+        """Write a new value to the state machine."""
+        self._state = value
+        self.last_write = time.monotonic()
+        self.async_write_ha_state()
+
     async def async_added_to_hass(self):
         """Run when entity about to be added to hass."""
-        unique_sensor_id = f"{self._device_id}_{self._key}"
-        signal = f"{SIGNAL_UPDATE_SENSOR}_{unique_sensor_id}"
-        
-        @callback
-        def async_update_state(value):
-            """Update the state."""
+        self._device.sensors[self._key] = self
+
+    async def async_will_remove_from_hass(self):
+        """Run when entity will be removed from hass."""
+        if self._device.sensors.get(self._key) is self:
+            del self._device.sensors[self._key]
+        if self._throttle is not None:
+            self._throttle.async_discard(self)
+
+
+class Rtl433AggregateSensor(SensorEntity):
+    """Rolling window statistic of a device reading, written by the bridge's aggregator."""
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, device: Rtl433Device, spec: AggregateSpec, window: RollingWindow):
+        """Initialize the sensor."""
+        self._device = device
+        self._key = spec.key
+        self.kind = spec.kind
+        self.window = window
+        self._state = None
+        self._attr_unique_id = f"{device.unique_id}_{spec.key}"
+        self._attr_name = spec.name
+        self._attr_device_class = spec.device_class
+        self._attr_native_unit_of_measurement = spec.unit
+        # Attaches to the device of the raw sensors
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device.unique_id)})
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """Return False once the device stopped transmitting."""
+        return self._device.available
+
+    @callback
+    def async_write_value(self, now: float) -> None:
+        """Write the statistic if it changed."""
+        value = self.window.value(now) if self.window is not None else None
+        if value != self._state and self.hass is not None:
             self._state = value
             self.async_write_ha_state()
-            
-        self.async_on_remove(
-            async_dispatcher_connect(self.hass, signal, async_update_state)
+
+    @callback
+    def async_reset(self, window: RollingWindow | None) -> None:
+        """Start over with a new window, or none with aggregation disabled."""
+        self.window = window
+        self.async_write_value(0.0)
+
+    async def async_will_remove_from_hass(self):
+        """Run when entity will be removed from hass."""
+        if self._device.aggregates.get(self._key) is self:
+            del self._device.aggregates[self._key]
+
+
+class Rtl433BridgeSensor(SensorEntity):
+    """Diagnostic sensor of the bridge, polled from the manager counters."""
+
+    entity_description: Rtl433BridgeSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, manager: Rtl433DiscoveryManager, description: SensorEntityDescription):
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._manager = manager
+        entry_id = manager.entry.entry_id
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=manager.entry.title,
+            manufacturer="rtl_433",
+            model="Bridge",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._manager)
+
+
+class Rtl433BridgeRateSensor(Rtl433BridgeSensor):
+    """Messages per second since the previous poll."""
+
+    def __init__(self, manager: Rtl433DiscoveryManager):
+        """Initialize the sensor."""
+        super().__init__(
+            manager,
+            SensorEntityDescription(
+                key="message_rate",
+                name="Message rate",
+                native_unit_of_measurement="msg/s",
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=1,
+            ),
         )
+        self._last_count = manager.counters["messages"]
+        self._last_time = time.monotonic()
+        self._rate = None
+
+    async def async_update(self):
+        """Update the rate."""
+        now = time.monotonic()
+        count = self._manager.counters["messages"]
+        if (elapsed := now - self._last_time) > 0:
+            self._rate = (count - self._last_count) / elapsed
+        self._last_count = count
+        self._last_time = now
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._rate
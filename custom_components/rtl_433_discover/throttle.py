@@ -0,0 +1,159 @@
+"""Rate limiting of sensor state writes."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from .sensor import Rtl433Sensor
+
+_LOGGER = logging.getLogger(__name__)
+
+# Target matching every sensor without a more specific policy
+DEFAULT_TARGET = "*"
+
+
+class ThrottlePolicy(NamedTuple):
+    """At most one write per interval, unless the value moved by more than delta."""
+
+    interval: float
+    delta: float | None = None
+
+
+def parse_throttle_option(value: str | None) -> dict[str, ThrottlePolicy]:
+    """Parse "target=interval[:delta], ..." into policies.
+
+    The target is an rtl_433 key ("battery_ok"), a device class ("wind_speed")
+    or "*" for everything else. Raises ValueError on malformed entries.
+    """
+    policies = {}
+    if not value:
+        return policies
+    for item in value.split(","):
+        if not (item := item.strip()):
+            continue
+        target, sep, spec = item.partition("=")
+        if not sep or not target.strip():
+            raise ValueError(f"Invalid throttle policy: {item}")
+        interval, _, delta = spec.partition(":")
+        policy = ThrottlePolicy(float(interval), float(delta) if delta.strip() else None)
+        if policy.interval < 0 or (policy.delta is not None and policy.delta < 0):
+            raise ValueError(f"Invalid throttle policy: {item}")
+        policies[target.strip()] = policy
+    return policies
+
+
+class Throttle:
+    """Hold back sensor writes according to per key / device class policies.
+
+    Held values are kept on the sensor and flushed from a single timer shared
+    by all sensors, scheduled for the earliest due write.
+    """
+
+    def __init__(self, hass: HomeAssistant, policies: dict[str, ThrottlePolicy]) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._policies = policies
+        self._by_key: dict[str, ThrottlePolicy | None] = {}
+        self._held: dict[Rtl433Sensor, float] = {} # sensor -> due time
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._next_flush = 0.0
+
+    def __bool__(self) -> bool:
+        """Return True if any policy is configured."""
+        return bool(self._policies)
+
+    def _policy(self, sensor: Rtl433Sensor) -> ThrottlePolicy | None:
+        """Return the policy for a sensor, resolved once per key."""
+        key = sensor.key
+        try:
+            return self._by_key[key]
+        except KeyError:
+            pass
+        policies = self._policies
+        policy = policies.get(key)
+        if policy is None and sensor.device_class is not None:
+            policy = policies.get(str(sensor.device_class))
+        if policy is None:
+            policy = policies.get(DEFAULT_TARGET)
+        if policy is not None and policy.interval == 0:
+            policy = None
+        self._by_key[key] = policy
+        return policy
+
+    @callback
+    def async_hold(self, sensor: Rtl433Sensor, value: Any) -> bool:
+        """Return True if the write of value should be held back."""
+        if (policy := self._policy(sensor)) is None:
+            return False
+
+        now = time.monotonic()
+        due = sensor.last_write + policy.interval
+        if now >= due or (
+            policy.delta is not None and _moved(sensor.native_value, value, policy.delta)
+        ):
+            self._held.pop(sensor, None)
+            return False
+
+        if value == sensor.native_value:
+            # Back to what is already written, nothing to flush
+            self._held.pop(sensor, None)
+            sensor.pending_value = None
+            return True
+
+        sensor.pending_value = value
+        self._held[sensor] = due
+        if self._unsub_timer is None or due < self._next_flush:
+            self._async_schedule(due, now)
+        return True
+
+    @callback
+    def async_discard(self, sensor: Rtl433Sensor) -> None:
+        """Forget a sensor that is being removed."""
+        self._held.pop(sensor, None)
+
+    @callback
+    def _async_schedule(self, due: float, now: float) -> None:
+        """(Re)schedule the shared flush timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        self._next_flush = due
+        self._unsub_timer = async_call_later(self.hass, max(due - now, 0), self._async_flush_due)
+
+    @callback
+    def _async_flush_due(self, _now=None) -> None:
+        """Write all held values that are due."""
+        self._unsub_timer = None
+        now = time.monotonic()
+        next_due = None
+        for sensor, due in list(self._held.items()):
+            if due <= now:
+                del self._held[sensor]
+                sensor.async_flush()
+            elif next_due is None or due < next_due:
+                next_due = due
+        if next_due is not None:
+            self._async_schedule(next_due, now)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Write all held values and stop the timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        held, self._held = self._held, {}
+        for sensor in held:
+            sensor.async_flush()
+
+
+def _moved(old: Any, new: Any, delta: float) -> bool:
+    """Return True if a numeric value moved by more than delta."""
+    try:
+        return abs(float(new) - float(old)) > delta
+    except (TypeError, ValueError):
+        # Not numeric (or nothing written yet), any change counts
+        return old != new
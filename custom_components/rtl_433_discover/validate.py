@@ -0,0 +1,122 @@
+"""Plausibility checks of device readings, compiled from the field catalogue."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import math
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.core import callback
+
+from .fields import FieldSpec
+
+if TYPE_CHECKING:
+    from .device import Rtl433Device
+
+# Rates are applied over at least this many seconds, repeats of one transmission arrive ms apart
+MIN_ELAPSED = 60
+# A step or counter reset that was rejected is taken as real once this many packets in a row show it
+CONFIRM = 2
+
+
+class Rule(NamedTuple):
+    """Checks of one key, ready for the hot path."""
+
+    minimum: float
+    maximum: float
+    # Largest change per MIN_ELAPSED or longer, None if the key has no rate limit
+    max_rate: float | None
+    # Counters only go down when the device resets them
+    increasing: bool
+
+    @property
+    def stateful(self) -> bool:
+        """Return True if the rule compares against the previous reading."""
+        return self.max_rate is not None or self.increasing
+
+
+def _rule(spec: FieldSpec) -> Rule | None:
+    """Compile the limits of a field, None if it has none."""
+    increasing = spec.state_class == SensorStateClass.TOTAL_INCREASING
+    if spec.minimum is None and spec.maximum is None and spec.max_rate is None and not increasing:
+        return None
+    return Rule(
+        -math.inf if spec.minimum is None else spec.minimum,
+        math.inf if spec.maximum is None else spec.maximum,
+        None if spec.max_rate is None else spec.max_rate / 60,
+        increasing,
+    )
+
+
+class Validator:
+    """Drop readings a bad decode produced before they reach a sensor.
+
+    rtl_433 checksums are short, now and then a corrupted packet passes and
+    reports 200 °C or a rain counter that went backwards. Each reading is checked
+    against the range of its field, temperatures against a maximum rate of change
+    since the last accepted reading, and counters against going backwards. A step
+    or a counter reset is accepted once CONFIRM packets in a row agree, so a
+    device that really moved or got a new battery catches up after one packet.
+    """
+
+    def __init__(self, fields: Mapping[str, FieldSpec]) -> None:
+        """Initialize."""
+        self._rules: dict[str, Rule] = {
+            key: rule for key, spec in fields.items() if (rule := _rule(spec)) is not None
+        }
+
+    def __bool__(self) -> bool:
+        """Return True if any key is checked."""
+        return bool(self._rules)
+
+    @callback
+    def async_check(self, device: Rtl433Device, payload: dict[str, Any]) -> int:
+        """Remove implausible readings from a packet, return how many were removed."""
+        rules = self._rules
+        rejected = None
+        now = time.time()
+        for key, value in payload.items():
+            if (rule := rules.get(key)) is not None and not self._async_accept(device, key, value, rule, now):
+                if rejected is None:
+                    rejected = []
+                rejected.append(key)
+        if rejected is None:
+            return 0
+        for key in rejected:
+            del payload[key]
+        return len(rejected)
+
+    @callback
+    def async_check_value(self, device: Rtl433Device, key: str, value: Any) -> bool:
+        """Return True if a single reading is plausible."""
+        if (rule := self._rules.get(key)) is None:
+            return True
+        return self._async_accept(device, key, value, rule, time.time())
+
+    @callback
+    def _async_accept(self, device: Rtl433Device, key: str, value: Any, rule: Rule, now: float) -> bool:
+        """Check one reading and remember it if it is accepted."""
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return True
+        if not rule.minimum <= value <= rule.maximum:
+            return False
+        if not rule.stateful:
+            return True
+
+        readings = device.readings
+        if (last := readings.get(key)) is not None:
+            if rule.increasing:
+                suspect = value < last
+            else:
+                elapsed = now - device.last_seen if device.last_seen is not None else 0
+                suspect = abs(value - last) > rule.max_rate * max(elapsed, MIN_ELAPSED)
+            strikes = device.strikes
+            if suspect:
+                if (count := strikes.get(key, 0) + 1) < CONFIRM:
+                    strikes[key] = count
+                    return False
+            if strikes:
+                strikes.pop(key, None)
+        readings[key] = value
+        return True
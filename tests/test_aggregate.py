@@ -0,0 +1,124 @@
+"""Test the rolling window statistics."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.aggregate import (
+    KIND_DIRECTION,
+    KIND_MAX,
+    KIND_MEAN,
+    KIND_RATE,
+    RollingWindow,
+)
+from custom_components.rtl_433_discover.const import (
+    DOMAIN,
+    CONF_TOPIC_PREFIX,
+    CONF_KEYS,
+    CONF_AGGREGATE_WINDOW,
+)
+
+GUST = "sensor.bresser_7in1_43951_wind_gust"
+DIRECTION = "sensor.bresser_7in1_43951_wind_direction_mean"
+RAIN_RATE = "sensor.bresser_7in1_43951_rain_rate"
+
+def test_window_statistics() -> None:
+    """Test max, mean and the vector mean of directions."""
+    gust = RollingWindow(KIND_MAX, 300)
+    mean = RollingWindow(KIND_MEAN, 300)
+    direction = RollingWindow(KIND_DIRECTION, 300)
+    assert gust.value(0) is None
+    for now, value in ((10, 2.5), (50, 7.1), (200, 3.0)):
+        gust.add(value, now)
+        mean.add(value, now)
+    assert gust.value(200) == 7.1
+    assert mean.value(200) == pytest.approx(4.2)
+
+    # North, not south
+    direction.add(350, 10)
+    direction.add(10, 20)
+    assert direction.value(20) in (0.0, 360.0)
+
+def test_window_expiry() -> None:
+    """Test samples older than the window are dropped."""
+    gust = RollingWindow(KIND_MAX, 60)
+    gust.add(9.0, 0)
+    gust.add(2.0, 50)
+    assert gust.value(50) == 9.0
+    assert gust.value(70) == 2.0
+    assert gust.value(200) is None
+    # Buckets are reused
+    gust.add(4.0, 210)
+    assert gust.value(210) == 4.0
+
+def test_rain_rate_counter_reset() -> None:
+    """Test the rain rate only counts increases of the total."""
+    rate = RollingWindow(KIND_RATE, 3600)
+    rate.add(100.0, 0)
+    rate.add(101.5, 600)
+    # New battery, the counter starts over
+    rate.add(0.0, 1200)
+    rate.add(0.5, 1800)
+    assert rate.value(1800) == 2.0
+
+def _msg(wind_max, wind_dir, rain):
+    msg = MagicMock()
+    msg.topic = "rtl_433/attic/events"
+    msg.payload = (
+        '{"model":"Bresser-7in1","id":43951,"temperature_C":12.1,'
+        f'"wind_max_m_s":{wind_max},"wind_avg_m_s":1.0,"wind_dir_deg":{wind_dir},"rain_mm":{rain}}}'
+    )
+    return msg
+
+async def test_aggregate_sensors(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test derived sensors are created on the first packet and written by the timer."""
+    device_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Bresser-7in1-43951",
+        data={
+            "unique_id": "Bresser-7in1-43951",
+            "model": "Bresser-7in1",
+            CONF_KEYS: ["temperature_C", "wind_avg_m_s", "wind_dir_deg", "wind_max_m_s", "rain_mm"],
+        },
+    )
+    device_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(device_entry.entry_id)
+    bridge = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={CONF_AGGREGATE_WINDOW: 5},
+    )
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][bridge.entry_id]
+    assert manager.aggregator.window == 300
+
+    with patch("custom_components.rtl_433_discover.aggregate.time.monotonic") as mock_time:
+        mock_time.return_value = 1000.0
+        await manager.async_process_message(_msg(6.2, 350, 10.0))
+        mock_time.return_value = 1030.0
+        await manager.async_process_message(_msg(3.1, 10, 10.4))
+        await hass.async_block_till_done()
+        # Nothing is written before the timer fires
+        assert hass.states.get(GUST).state == "unknown"
+        manager.aggregator._async_write()
+
+    # Shown in km/h by the metric unit system
+    assert hass.states.get(GUST).state == "22.3"
+    assert float(hass.states.get(DIRECTION).state) in (0.0, 360.0)
+    # 0.4 mm in a 5 minute window
+    assert float(hass.states.get(RAIN_RATE).state) == pytest.approx(4.8)
+    # The raw readings still update, those feeding a statistic no more often than it is written
+    assert hass.states.get("sensor.bresser_7in1_43951_wind_avg").state == "3.6"
+    assert hass.states.get("sensor.bresser_7in1_43951_wind_max").state == "22.3"
+    assert hass.states.get("sensor.bresser_7in1_43951_wind_direction").state == "350"
+    assert len(manager.throttle._held) == 3
+
+    # Turning aggregation off clears the derived sensors
+    hass.config_entries.async_update_entry(bridge, options={CONF_AGGREGATE_WINDOW: 0})
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][bridge.entry_id]
+    assert not manager.aggregator
+    assert hass.states.get(GUST).state == "unknown"
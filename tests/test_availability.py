@@ -0,0 +1,72 @@
+"""Test the rtl_433 Discovery device availability."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.availability import AvailabilityTracker, parse_expiry_option
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_EXPIRE_AFTER, CONF_KEYS
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+
+TEMPERATURE = "sensor.nexus_th_1_temperature"
+
+def test_parse_expiry_option() -> None:
+    """Test parsing expiries and resolving them per model."""
+    expiries = parse_expiry_option("*=3600, Fineoffset-WH5*=900, Nexus-TH=120")
+    assert expiries == {"*": 3600, "Fineoffset-WH5*": 900, "Nexus-TH": 120}
+
+    tracker = AvailabilityTracker(MagicMock(), expiries)
+    assert tracker.expiry("Nexus-TH") == 120
+    assert tracker.expiry("Fineoffset-WH51") == 900
+    assert tracker.expiry("Acurite-Tower") == 3600
+    assert AvailabilityTracker(MagicMock(), {}).expiry("Nexus-TH") is None
+
+@pytest.mark.parametrize("value", ["3600", "=60", "Nexus-TH=abc", "*=0"])
+def test_parse_expiry_option_invalid(value) -> None:
+    """Test malformed expiries are rejected."""
+    with pytest.raises(ValueError):
+        parse_expiry_option(value)
+
+async def test_device_expires_and_recovers(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test a silent device goes unavailable in the sweep and comes back with a packet."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Nexus-TH-1",
+        data={"unique_id": "Nexus-TH-1", "model": "Nexus-TH", CONF_KEYS: ["temperature_C"]},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {CONF_EXPIRE_AFTER: "Nexus-*=120"}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+    tracker = manager.availability
+
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = '{"model":"Nexus-TH","id":1,"temperature_C":9.1}'
+
+    with patch("custom_components.rtl_433_discover.device.time.time", return_value=1000.0), \
+         patch("custom_components.rtl_433_discover.availability.time.time", return_value=1000.0) as mock_time:
+        await manager.async_process_message(msg)
+        await hass.async_block_till_done()
+        assert hass.states.get(TEMPERATURE).state == "9.1"
+
+        mock_time.return_value = 1100.0
+        tracker._async_sweep()
+        assert hass.states.get(TEMPERATURE).state == "9.1"
+
+        mock_time.return_value = 1121.0
+        tracker._async_sweep()
+        await hass.async_block_till_done()
+        assert hass.states.get(TEMPERATURE).state == STATE_UNAVAILABLE
+        assert tracker._heap == []
+
+    await manager.async_process_message(msg)
+    await hass.async_block_till_done()
+    assert hass.states.get(TEMPERATURE).state == "9.1"
+    assert len(tracker._heap) == 1
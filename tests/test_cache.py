@@ -0,0 +1,67 @@
+"""Test the rtl_433 Discovery device cache."""
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.rtl_433_discover.cache import SAVE_DELAY
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_KEYS, DATA_DEVICES
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+
+async def _setup_device(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Bresser-7in1-43951",
+        data={"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1", CONF_KEYS: ["rain_mm", "temperature_C"]},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+async def test_sensors_restore_cached_values(hass: HomeAssistant, hass_storage, mqtt_mock) -> None:
+    """Test sensors start from the cached value instead of unknown."""
+    hass_storage[f"{DOMAIN}.cache"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.cache",
+        "data": {
+            "devices": {
+                "Bresser-7in1-43951": {
+                    "last_seen": 1700000000.0,
+                    "keys": ["rain_mm", "temperature_C"],
+                    "values": {"rain_mm": 12.4},
+                }
+            }
+        },
+    }
+    await _setup_device(hass)
+
+    assert hass.states.get("sensor.bresser_7in1_43951_rain").state == "12.4"
+    assert hass.states.get("sensor.bresser_7in1_43951_temperature").state == "unknown"
+    assert hass.data[DATA_DEVICES]["Bresser-7in1-43951"].last_seen == 1700000000.0
+
+async def test_packets_saved_after_delay(hass: HomeAssistant, hass_storage, mqtt_mock) -> None:
+    """Test packets flag a debounced save of the live device state."""
+    await _setup_device(hass)
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    for temperature in (14.3, 14.5):
+        msg = MagicMock()
+        msg.topic = "rtl_433/events"
+        msg.payload = f'{{"model":"Bresser-7in1","id":43951,"temperature_C":{temperature},"rain_mm":3.2}}'
+        await manager.async_process_message(msg)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.cache" not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    cached = hass_storage[f"{DOMAIN}.cache"]["data"]["devices"]["Bresser-7in1-43951"]
+    assert cached["values"] == {"rain_mm": 3.2, "temperature_C": 14.5}
+    assert cached["keys"] == ["rain_mm", "temperature_C"]
+    assert cached["last_seen"] is not None
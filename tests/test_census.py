@@ -0,0 +1,84 @@
+"""Test the table of unknown devices and the sightings discovery waits for."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rtl_433_discover.const import CONF_DISCOVERY_SIGHTINGS, CONF_DISCOVERY_WINDOW
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+
+MONOTONIC = "custom_components.rtl_433_discover.discovery_manager.time.monotonic"
+
+def _msg(device_id, model="Schrader"):
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = f'{{"model":"{model}","id":"{device_id}","pressure_kPa":231.5}}'
+    return msg
+
+def _manager(hass, options):
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = options
+    return Rtl433DiscoveryManager(hass, mock_entry)
+
+async def test_flow_waits_for_sightings(hass: HomeAssistant) -> None:
+    """Test a device is only offered after enough transmissions within the window."""
+    manager = _manager(hass, {CONF_DISCOVERY_SIGHTINGS: 3, CONF_DISCOVERY_WINDOW: 10})
+
+    with patch(MONOTONIC) as mock_time, \
+         patch.object(hass.config_entries.flow, "async_init", return_value={"type": "form"}) as mock_flow:
+        # A passing car, repeats of one burst count once
+        for now in (100.0, 100.2, 100.4, 160.0):
+            mock_time.return_value = now
+            await manager.async_process_message(_msg("1a2b3c"))
+        assert mock_flow.call_count == 0
+        assert manager.counters["flows_deferred"] == 4
+
+        # A neighbour transmitting every minute, but too far apart
+        for now in (100.0, 500.0, 1000.0):
+            mock_time.return_value = now
+            await manager.async_process_message(_msg("4d5e6f"))
+        assert mock_flow.call_count == 0
+
+        # Third transmission within ten minutes
+        mock_time.return_value = 1060.0
+        await manager.async_process_message(_msg("4d5e6f"))
+        assert mock_flow.call_count == 1
+        assert mock_flow.call_args.kwargs["data"]["unique_id"] == "Schrader-4d5e6f"
+
+async def test_fast_transmitter_offered(hass: HomeAssistant) -> None:
+    """Test a device sending more often than the repeat gap still collects sightings."""
+    manager = _manager(hass, {CONF_DISCOVERY_SIGHTINGS: 3, CONF_DISCOVERY_WINDOW: 10})
+
+    with patch(MONOTONIC) as mock_time, \
+         patch.object(hass.config_entries.flow, "async_init", return_value={"type": "form"}) as mock_flow:
+        for packet in range(4):
+            mock_time.return_value = 1000.0 + packet * 4
+            await manager.async_process_message(_msg("7a8b9c"))
+        assert mock_flow.call_count == 0
+        assert list(manager.seen_devices["Schrader-7a8b9c"].sightings) == [1000.0, 1008.0]
+
+        mock_time.return_value = 1016.0
+        await manager.async_process_message(_msg("7a8b9c"))
+        assert mock_flow.call_count == 1
+
+async def test_unknown_devices_bounded(hass: HomeAssistant) -> None:
+    """Test the table keeps the recently heard devices within its bound."""
+    manager = _manager(hass, {CONF_DISCOVERY_SIGHTINGS: 2})
+
+    with patch("custom_components.rtl_433_discover.discovery_manager.MAX_SEEN_DEVICES", 3), \
+         patch.object(hass.config_entries.flow, "async_init", return_value={"type": "form"}):
+        await manager.async_process_message(_msg("neighbour"))
+        await manager.async_process_message(_msg("neighbour"))
+        for number in range(5):
+            await manager.async_process_message(_msg(f"car{number}"))
+            if number % 2:
+                # Still transmitting, stays in the table
+                await manager.async_process_message(_msg("neighbour"))
+
+    assert len(manager.seen_devices) == 3
+    assert "Schrader-neighbour" in manager.seen_devices
+    assert manager.counters["seen_evicted"] == 3
+    top = manager.top_seen_devices(2)
+    assert len(top) == 2
+    assert top[0][0] == "Schrader-neighbour"
+    assert top[0][1].packets == 4
@@ -1,10 +1,11 @@
 """Test the rtl_433 Discovery config flow."""
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX, DEFAULT_TOPIC_PREFIX, CONF_IGNORE_DEVICES
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX, DEFAULT_TOPIC_PREFIX, CONF_IGNORE_DEVICES, CONF_KEYS
 
 async def test_form(hass: HomeAssistant) -> None:
     """Test we get the form."""
@@ -31,10 +32,10 @@ async def test_form(hass: HomeAssistant) -> None:
     assert result2["data"] == {CONF_TOPIC_PREFIX: "test/topic"}
     assert len(mock_setup_entry.mock_calls) == 1
 
-async def test_options_flow(hass: HomeAssistant) -> None:
+async def test_options_flow(hass: HomeAssistant, mqtt_mock) -> None:
     """Test options flow."""
     # Create an entry
-    entry = config_entries.MockConfigEntry(
+    entry = MockConfigEntry(
         domain=DOMAIN,
         data={CONF_TOPIC_PREFIX: "test/topic"},
     )
@@ -46,13 +47,90 @@ async def test_options_flow(hass: HomeAssistant) -> None:
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
 
-    assert result["type"] == FlowResultType.FORM
+    assert result["type"] == FlowResultType.MENU
     assert result["step_id"] == "init"
 
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "settings"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "settings"
+
     result2 = await hass.config_entries.options.async_configure(
         result["flow_id"],
-        user_input={CONF_IGNORE_DEVICES: "123, 456"},
+        user_input={CONF_TOPIC_PREFIX: "test/topic", CONF_IGNORE_DEVICES: "123, 456"},
     )
 
     assert result2["type"] == FlowResultType.CREATE_ENTRY
-    assert result2["data"] == {CONF_IGNORE_DEVICES: "123, 456"}
+    assert result2["data"][CONF_TOPIC_PREFIX] == "test/topic"
+    assert result2["data"][CONF_IGNORE_DEVICES] == "123, 456"
+
+async def test_options_invalid_ignore(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test a regex entry that does not compile is refused by the settings step."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_TOPIC_PREFIX: "rtl_433/+/events"})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "settings"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_TOPIC_PREFIX: "rtl_433/+/events", CONF_IGNORE_DEVICES: "Acurite-*, re:LaCrosse-("},
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_IGNORE_DEVICES: "invalid_ignore"}
+
+async def test_options_bulk_adopt_and_ignore(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test discovered devices are adopted or ignored by filter in one step."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_TOPIC_PREFIX: "rtl_433/+/events"})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][entry.entry_id]
+
+    for payload in (
+        '{"model":"Nexus-TH","id":1,"temperature_C":14.3,"rssi":-8.1}',
+        '{"model":"Nexus-TH","id":1,"temperature_C":14.4,"rssi":-8.3}',
+        '{"model":"Nexus-TH","id":2,"temperature_C":9.1,"rssi":-25.0}',
+        '{"model":"Acurite-Tower","id":5,"humidity":40}',
+    ):
+        msg = MagicMock()
+        msg.topic = "rtl_433/attic/events"
+        msg.payload = payload
+        await manager.async_process_message(msg)
+    await hass.async_block_till_done()
+    assert len(hass.config_entries.flow.async_progress_by_handler(DOMAIN)) == 3
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.MENU
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "devices"}
+    )
+    assert result["step_id"] == "devices"
+    assert "Nexus-TH-1 | 2 |" in result["description_placeholders"]["devices"]
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "adopt", "model": "Nexus-*", "min_packets": 1, "min_rssi": -20}
+    )
+    await hass.async_block_till_done()
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    device_entry = hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "Nexus-TH-1")
+    assert device_entry.data[CONF_KEYS] == ["rssi", "temperature_C"]
+    assert device_entry.source == "adopt"
+    assert hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "Nexus-TH-2") is None
+    assert len(hass.config_entries.flow.async_progress_by_handler(DOMAIN)) == 2
+    assert "Nexus-TH-1" not in manager.seen_devices
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": "devices"}
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"action": "ignore", "model": "*", "min_packets": 1}
+    )
+    await hass.async_block_till_done()
+    assert entry.options[CONF_IGNORE_DEVICES] == "Nexus-TH-2, Acurite-Tower-5"
+    assert manager.seen_devices == {}
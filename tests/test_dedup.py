@@ -0,0 +1,85 @@
+"""Test the rtl_433 Discovery cross-receiver deduplication."""
+import json
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.rtl_433_discover.const import CONF_DEDUP_WINDOW, CONF_TOPIC_PREFIX
+from custom_components.rtl_433_discover.dedup import Deduplicator, topic_receiver
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+
+def _payload(temperature=14.3, rssi=-10.0, time="2025-12-14 13:28:51"):
+    return {
+        "time": time, "model": "Nexus-TH", "id": 1, "temperature_C": temperature,
+        "rssi": rssi, "snr": 20.0, "freq": 433.92,
+    }
+
+def test_topic_receiver() -> None:
+    """Test the receiver is the part of the topic matched by the wildcards."""
+    assert topic_receiver("rtl_433/+/events", "rtl_433/attic/events") == "attic"
+    assert topic_receiver("rtl_433/events", "rtl_433/events") == "rtl_433/events"
+    assert topic_receiver("rtl_433/+/events", "rtl_433") == "rtl_433"
+
+def test_copies_dropped_and_best_receiver_tracked() -> None:
+    """Test copies from other receivers are dropped and the best one is remembered."""
+    dedup = Deduplicator(2)
+    with patch("custom_components.rtl_433_discover.dedup.time.monotonic", return_value=1000.0) as mock_time:
+        assert not dedup.is_duplicate("Nexus-TH-1", _payload(rssi=-12.0), "attic")
+        # Receiver clock a second ahead, weaker signal
+        assert dedup.is_duplicate("Nexus-TH-1", _payload(rssi=-20.0, time="2025-12-14 13:28:52"), "garage")
+        assert dedup.receivers["Nexus-TH-1"] == "attic"
+        assert dedup.is_duplicate("Nexus-TH-1", _payload(rssi=-3.0), "shed")
+        assert dedup.receivers["Nexus-TH-1"] == "shed"
+
+        # A new reading is not a copy
+        assert not dedup.is_duplicate("Nexus-TH-1", _payload(temperature=14.5), "attic")
+
+        # Window expired, the same reading is processed again
+        mock_time.return_value = 1002.0
+        assert not dedup.is_duplicate("Nexus-TH-1", _payload(), "garage")
+        assert len(dedup._seen) == len(dedup._ring) == 1
+
+def test_copies_matched_across_rtl_433_versions() -> None:
+    """Test copies match regardless of key order and extra metadata fields."""
+    dedup = Deduplicator(2)
+    with patch("custom_components.rtl_433_discover.dedup.time.monotonic", return_value=1000.0):
+        assert not dedup.is_duplicate("Nexus-TH-1", {**_payload(), "channel": 1}, "attic")
+        reordered = dict(reversed(list(_payload().items())), channel=1, mic="CHECKSUM", mod="ASK")
+        assert dedup.is_duplicate("Nexus-TH-1", reordered, "garage")
+        # Same reading on another channel is another device
+        assert not dedup.is_duplicate("Nexus-TH-1", {**_payload(), "channel": 2}, "attic")
+
+        # Without catalogue readings the whole packet tells transmissions apart
+        assert not dedup.is_duplicate("Generic-Remote-1", {"model": "Generic-Remote", "id": 1, "cmd": 1}, "attic")
+        assert not dedup.is_duplicate("Generic-Remote-1", {"model": "Generic-Remote", "id": 1, "cmd": 2}, "attic")
+        assert dedup.is_duplicate("Generic-Remote-1", {"cmd": 2, "id": 1, "model": "Generic-Remote"}, "garage")
+
+def test_unhashable_payload_passes() -> None:
+    """Test payloads with list values are never treated as copies."""
+    dedup = Deduplicator(2)
+    payload = {"model": "Generic-Remote", "id": 1, "codes": [1, 2]}
+    assert not dedup.is_duplicate("Generic-Remote-1", payload, "attic")
+    assert not dedup.is_duplicate("Generic-Remote-1", payload, "attic")
+
+async def test_manager_drops_copies(hass: HomeAssistant) -> None:
+    """Test the manager processes one copy of a transmission heard twice."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.data = {CONF_TOPIC_PREFIX: "rtl_433/+/events"}
+    mock_entry.options = {CONF_DEDUP_WINDOW: 2}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    def _msg(host, rssi):
+        msg = MagicMock()
+        msg.topic = f"rtl_433/{host}/events"
+        msg.payload = json.dumps(_payload(rssi=rssi)).encode()
+        return msg
+
+    with patch.object(hass.config_entries.flow, "async_init", return_value={"type": "form"}) as mock_flow:
+        await manager.async_process_message(_msg("attic", -12.0))
+        await manager.async_process_message(_msg("garage", -5.0))
+
+    assert mock_flow.call_count == 1
+    assert manager.counters["duplicates"] == 1
+    assert manager.device_packets["Nexus-TH-1"] == 1
+    assert manager.dedup.receivers == {"Nexus-TH-1": "garage"}
@@ -0,0 +1,50 @@
+"""Test the rtl_433 Discovery bridge diagnostics."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import async_update_entity
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX, CONF_IGNORE_DEVICES
+from custom_components.rtl_433_discover.diagnostics import async_get_config_entry_diagnostics
+
+def _msg(payload):
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = payload
+    return msg
+
+async def test_bridge_diagnostics(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test the bridge counters, sensors and diagnostics dump."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="rtl_433 Bridge",
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={CONF_IGNORE_DEVICES: "Acurite-*"},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][entry.entry_id]
+
+    with patch.object(hass.config_entries.flow, "async_init", return_value={"type": "form"}):
+        await manager.async_process_message(_msg(b'{"model":"Nexus-TH","id":1}'))
+        await manager.async_process_message(_msg(b'{"model":"Nexus-TH","id":1}'))
+        await manager.async_process_message(_msg(b'{"model":"Acurite-Tower","id":5}'))
+        await manager.async_process_message(_msg(b'{"model":"Nexus'))
+
+    assert manager.counters["messages"] == 4
+    assert manager.counters["unknown"] == 2
+    assert manager.counters["flows_started"] == 1
+    assert manager.counters["flows_suppressed"] == 1
+    assert manager.processing_time_percentile(99) is not None
+
+    await async_update_entity(hass, "sensor.rtl_433_bridge_ignored_packets")
+    await async_update_entity(hass, "sensor.rtl_433_bridge_decode_failures")
+    assert hass.states.get("sensor.rtl_433_bridge_ignored_packets").state == "1"
+    assert hass.states.get("sensor.rtl_433_bridge_decode_failures").state == "1"
+    assert hass.states.get("sensor.rtl_433_bridge_message_rate") is not None
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["device_packets"] == {"Nexus-TH-1": 2}
+    assert diagnostics["counters"]["decode_failures"] == 1
@@ -3,10 +3,14 @@ import json
 from unittest.mock import MagicMock, patch
 import pytest
 
+from homeassistant.config_entries import ConfigEntryChange
 from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
 from custom_components.rtl_433_discover import DOMAIN
 from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
-from custom_components.rtl_433_discover.const import CONF_IGNORE_DEVICES
+from custom_components.rtl_433_discover.const import CONF_IGNORE_DEVICES, CONF_DISCOVERY_INTERVAL, CONF_KEYS
+from custom_components.rtl_433_discover.device import async_get_device
 
 SAMPLE_PAYLOAD = """
 {"time":"2025-12-14 13:28:51","model":"Bresser-7in1","id":43951,"temperature_C":14.3,"humidity":76,"wind_max_m_s":3.9,"wind_avg_m_s":3.8,"wind_dir_deg":54,"rain_mm":0,"light_klx":14.135,"light_lux":14135.0,"uv":0.6,"battery_ok":1,"mic":"CRC"}
@@ -102,3 +106,90 @@ async def test_ignore_logic_by_id_only(hass: HomeAssistant) -> None:
         await manager.async_process_message(msg)
         
         assert not mock_dr_get.called
+
+async def test_route_cache_invalidation(hass: HomeAssistant) -> None:
+    """Test routes are cached per device and dropped when its entry is added."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.payload = SAMPLE_PAYLOAD
+    msg.topic = "rtl_433/events"
+
+    sensor = MagicMock()
+    async_get_device(hass, "Bresser-7in1-43951", "Bresser-7in1").sensors["temperature_C"] = sensor
+
+    with patch.object(hass.config_entries.flow, "async_init") as mock_flow:
+        await manager.async_process_message(msg)
+        assert mock_flow.called
+        assert not sensor.async_set_value.called
+
+        device_entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id="Bresser-7in1-43951",
+            data={"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1"},
+        )
+        device_entry.add_to_hass(hass)
+        manager.async_config_entry_changed(ConfigEntryChange.ADDED, device_entry)
+
+        with patch.object(hass.config_entries, "async_entry_for_domain_unique_id") as mock_lookup:
+            await manager.async_process_message(msg)
+            mock_lookup.assert_called_once()
+
+            await manager.async_process_message(msg)
+            # Second packet is served from the route table
+            mock_lookup.assert_called_once()
+
+        assert sensor.async_set_value.call_count == 2
+        assert sensor.async_set_value.call_args[0][0] == 14.3
+
+async def test_discovery_debounce(hass: HomeAssistant) -> None:
+    """Test repeats of an unknown device start one flow per discovery interval."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {CONF_DISCOVERY_INTERVAL: 60}
+
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.payload = SAMPLE_PAYLOAD
+    msg.topic = "rtl_433/events"
+
+    with patch.object(hass.config_entries.flow, "async_init", return_value={"type": "form"}) as mock_flow, \
+         patch("custom_components.rtl_433_discover.discovery_manager.time.monotonic", return_value=1000.0) as mock_time:
+        for _ in range(5):
+            await manager.async_process_message(msg)
+        assert mock_flow.call_count == 1
+        assert mock_flow.call_args[1]["data"][CONF_KEYS] == [
+            "battery_ok", "humidity", "light_klx", "light_lux", "rain_mm",
+            "temperature_C", "uv", "wind_avg_m_s", "wind_dir_deg", "wind_max_m_s",
+        ]
+        assert manager.counters["flows_started"] == 1
+        assert manager.counters["flows_suppressed"] == 4
+
+        # Window expired, one new flow
+        mock_time.return_value = 1061.0
+        await manager.async_process_message(msg)
+        assert mock_flow.call_count == 2
+
+async def test_discovery_negative_cache(hass: HomeAssistant) -> None:
+    """Test an aborted flow holds back the device for longer."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {CONF_DISCOVERY_INTERVAL: 60}
+
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.payload = SAMPLE_PAYLOAD
+    msg.topic = "rtl_433/events"
+
+    with patch.object(hass.config_entries.flow, "async_init", return_value={"type": "abort"}) as mock_flow, \
+         patch("custom_components.rtl_433_discover.discovery_manager.time.monotonic", return_value=1000.0) as mock_time:
+        await manager.async_process_message(msg)
+        mock_time.return_value = 1061.0
+        await manager.async_process_message(msg)
+        assert mock_flow.call_count == 1
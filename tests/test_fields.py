@@ -0,0 +1,87 @@
+"""Test the rtl_433 Discovery field catalogue."""
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_FIELD_OVERRIDES, CONF_KEYS
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+from custom_components.rtl_433_discover.fields import FIELDS, build_fields, parse_field_overrides
+
+def test_catalogue_is_frozen() -> None:
+    """Test the compiled catalogue can't be changed at runtime."""
+    assert FIELDS["pressure_kPa"].device_class == SensorDeviceClass.PRESSURE
+    assert FIELDS["temperature_F"].unit == "°F"
+    with pytest.raises(TypeError):
+        FIELDS["pressure_kPa"] = FIELDS["temperature_C"]
+
+def test_catalogue_radio_and_light() -> None:
+    """Test reception details are diagnostic and klx is not passed off as illuminance."""
+    assert FIELDS["rssi"].diagnostic
+    assert FIELDS["snr"].diagnostic
+    assert not FIELDS["temperature_C"].diagnostic
+    assert FIELDS["light_klx"].device_class is None
+    assert FIELDS["light_lux"].device_class == SensorDeviceClass.ILLUMINANCE
+
+def test_parse_field_overrides() -> None:
+    """Test parsing field overrides."""
+    assert parse_field_overrides("") == {}
+    overrides = parse_field_overrides("depth_cm=distance|cm, light_klx=illuminance|lx||1000")
+    assert overrides["depth_cm"].name == "Depth Cm"
+    assert overrides["depth_cm"].device_class == SensorDeviceClass.DISTANCE
+    assert overrides["depth_cm"].state_class is None
+    assert overrides["light_klx"].name == "Light (k)"
+    assert overrides["light_klx"].convert(14.135) == pytest.approx(14135)
+
+    fields = build_fields(overrides)
+    assert fields["light_klx"].unit == "lx"
+    assert FIELDS["light_klx"].unit == "klx"
+
+def test_parse_field_overrides_limits() -> None:
+    """Test overrides keep the catalogue limits unless they set their own."""
+    overrides = parse_field_overrides(
+        "temperature_C=temperature|°C, temperature_1_C=temperature|°C||||500|none, depth_cm=||||0|400"
+    )
+    assert overrides["temperature_C"].maximum == 80
+    assert overrides["temperature_C"].max_rate == 10
+    assert overrides["temperature_1_C"].minimum == -60
+    assert overrides["temperature_1_C"].maximum == 500
+    assert overrides["temperature_1_C"].max_rate is None
+    assert (overrides["depth_cm"].minimum, overrides["depth_cm"].maximum) == (0, 400)
+
+@pytest.mark.parametrize("value", ["depth_cm", "=distance", "depth_cm=bogus", "depth_cm=||bogus", "x=|||abc", "x=||||low", "x=|||||nan"])
+def test_parse_field_overrides_invalid(value) -> None:
+    """Test malformed overrides are rejected."""
+    with pytest.raises(ValueError):
+        parse_field_overrides(value)
+
+async def test_catalogue_and_override_keys_get_sensors(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test keys from the catalogue and the overrides create sensors, others don't."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Schrader-1a2b3c",
+        data={"unique_id": "Schrader-1a2b3c", "model": "Schrader", CONF_KEYS: []},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {CONF_FIELD_OVERRIDES: "flags=||measurement"}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = '{"model":"Schrader","id":"1a2b3c","pressure_kPa":231.5,"temperature_C":21,"flags":3,"mic":"CRC"}'
+    await manager.async_process_message(msg)
+    await hass.async_block_till_done()
+
+    assert entry.data[CONF_KEYS] == ["flags", "pressure_kPa", "temperature_C"]
+    pressure = hass.states.get("sensor.schrader_1a2b3c_pressure")
+    assert pressure.state == "231.5"
+    assert pressure.attributes["device_class"] == SensorDeviceClass.PRESSURE
+    assert hass.states.get("sensor.schrader_1a2b3c_flags").attributes["state_class"] == SensorStateClass.MEASUREMENT
+    assert len(hass.states.async_entity_ids("sensor")) == 3
@@ -0,0 +1,128 @@
+"""Test devices hosted by the rtl_433 Discovery bridge."""
+from unittest.mock import MagicMock
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import (
+    DOMAIN,
+    CONF_TOPIC_PREFIX,
+    CONF_HOST_DEVICES,
+    CONF_KEYS,
+    DATA_CACHE,
+)
+
+TEMPERATURE = "sensor.bresser_7in1_43951_temperature"
+
+def _msg(payload):
+    msg = MagicMock()
+    msg.topic = "rtl_433/attic/events"
+    msg.payload = payload
+    return msg
+
+async def _setup_bridge(hass: HomeAssistant, host_devices: bool) -> MockConfigEntry:
+    """Set up a bridge entry."""
+    bridge = MockConfigEntry(
+        domain=DOMAIN,
+        title="rtl_433 Bridge",
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={CONF_HOST_DEVICES: host_devices},
+    )
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    return bridge
+
+async def test_migrate_keeps_cached_values(hass: HomeAssistant, hass_storage, mqtt_mock) -> None:
+    """Test the cached values of device entries survive the move into the bridge."""
+    hass_storage[f"{DOMAIN}.cache"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.cache",
+        "data": {
+            "devices": {
+                "Bresser-7in1-43951": {
+                    "last_seen": 1700000000.0,
+                    "keys": ["temperature_C"],
+                    "values": {"temperature_C": 11.1},
+                }
+            }
+        },
+    }
+    device_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Bresser-7in1-43951",
+        data={"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1", CONF_KEYS: ["temperature_C"]},
+    )
+    device_entry.add_to_hass(hass)
+    # Sets up the device entry too
+    bridge = await _setup_bridge(hass, host_devices=False)
+    assert hass.states.get(TEMPERATURE).state == "11.1"
+
+    hass.config_entries.async_update_entry(bridge, options={CONF_HOST_DEVICES: True})
+    await hass.async_block_till_done()
+    assert hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "Bresser-7in1-43951") is None
+    assert hass.data[DATA_CACHE].devices["Bresser-7in1-43951"]["values"] == {"temperature_C": 11.1}
+    assert hass.states.get(TEMPERATURE).state == "11.1"
+
+async def test_migrate_between_modes(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test device entries move into the bridge and back, keeping their entities."""
+    device_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Bresser-7in1-43951",
+        source=config_entries.SOURCE_DISCOVERY,
+        data={"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1", CONF_KEYS: ["temperature_C"]},
+    )
+    device_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(device_entry.entry_id)
+    await hass.async_block_till_done()
+    entity_registry = er.async_get(hass)
+    entity_registry.async_update_entity(TEMPERATURE, name="Attic temperature")
+
+    bridge = await _setup_bridge(hass, host_devices=True)
+    manager = hass.data[DOMAIN][bridge.entry_id]
+    assert hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "Bresser-7in1-43951") is None
+    assert manager.hosted.devices == {
+        "Bresser-7in1-43951": {"model": "Bresser-7in1", "keys": ["temperature_C"]}
+    }
+    assert entity_registry.async_get(TEMPERATURE).config_entry_id == bridge.entry_id
+    assert entity_registry.async_get(TEMPERATURE).name == "Attic temperature"
+
+    await manager.async_process_message(
+        _msg('{"model":"Bresser-7in1","id":43951,"temperature_C":14.3,"humidity":76}')
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(TEMPERATURE).state == "14.3"
+    assert hass.states.get("sensor.bresser_7in1_43951_humidity").state == "76"
+    assert manager.hosted.devices["Bresser-7in1-43951"]["keys"] == ["humidity", "temperature_C"]
+
+    hass.config_entries.async_update_entry(bridge, options={CONF_HOST_DEVICES: False})
+    await hass.async_block_till_done()
+    device_entry = hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "Bresser-7in1-43951")
+    assert device_entry.data[CONF_KEYS] == ["humidity", "temperature_C"]
+    assert entity_registry.async_get(TEMPERATURE).config_entry_id == device_entry.entry_id
+    assert entity_registry.async_get(TEMPERATURE).name == "Attic temperature"
+    assert hass.data[DOMAIN][bridge.entry_id].hosted.devices == {}
+
+async def test_confirm_adds_to_bridge(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test confirming a discovered device hosts it instead of creating an entry."""
+    bridge = await _setup_bridge(hass, host_devices=True)
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    await manager.async_process_message(_msg('{"model":"Nexus-TH","id":1,"temperature_C":9.1}'))
+    await hass.async_block_till_done()
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert len(flows) == 1
+
+    result = await hass.config_entries.flow.async_configure(flows[0]["flow_id"], {})
+    await hass.async_block_till_done()
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "added_to_bridge"
+    assert hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, "Nexus-TH-1") is None
+    assert hass.states.get("sensor.nexus_th_1_temperature") is not None
+
+    await manager.async_process_message(_msg('{"model":"Nexus-TH","id":1,"temperature_C":9.4}'))
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.nexus_th_1_temperature").state == "9.4"
@@ -0,0 +1,160 @@
+"""Test rebinding devices that change their id."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX, CONF_DEVICE_TOPIC, CONF_KEYS, CONF_ALIAS
+
+TEMPERATURE = "sensor.nexus_th_1_temperature"
+
+def _msg(device_id, temperature, channel=3):
+    msg = MagicMock()
+    msg.topic = "rtl_433/attic/events"
+    msg.payload = (
+        f'{{"model":"Nexus-TH","id":{device_id},"channel":{channel},'
+        f'"temperature_C":{temperature},"humidity":50}}'
+    )
+    return msg
+
+async def _setup(hass: HomeAssistant, options=None):
+    device_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Nexus-TH-1",
+        data={"unique_id": "Nexus-TH-1", "model": "Nexus-TH", CONF_KEYS: ["humidity", "temperature_C"]},
+    )
+    device_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(device_entry.entry_id)
+    bridge = MockConfigEntry(domain=DOMAIN, data={CONF_TOPIC_PREFIX: "rtl_433/+/events"}, options=options or {})
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    return device_entry, bridge
+
+async def test_new_id_rebinds_silent_device(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test a new id on the channel of a silent device takes over its entry."""
+    device_entry, bridge = await _setup(hass)
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    with patch("custom_components.rtl_433_discover.device.time.time", return_value=1000.0), \
+         patch("custom_components.rtl_433_discover.identity.time.time", return_value=1000.0) as mock_time, \
+         patch.object(hass.config_entries.flow, "async_init") as mock_flow:
+        await manager.async_process_message(_msg(1, 9.1))
+        assert hass.states.get(TEMPERATURE).state == "9.1"
+
+        # Another sensor on the same channel while ours is still transmitting
+        mock_time.return_value = 1030.0
+        await manager.async_process_message(_msg(88, 4.0))
+        assert mock_flow.call_count == 1
+        assert manager.counters["rebound"] == 0
+
+        # Battery changed, the device comes back with a new id
+        mock_time.return_value = 1400.0
+        await manager.async_process_message(_msg(77, 9.6))
+        await hass.async_block_till_done()
+
+    assert manager.counters["rebound"] == 1
+    assert hass.states.get(TEMPERATURE).state == "9.6"
+    assert device_entry.data[CONF_ALIAS] == "Nexus-TH-77"
+    assert hass.states.get("sensor.nexus_th_77_temperature") is None
+
+    # Routed straight away from now on, and after a reload of the bridge
+    await manager.async_process_message(_msg(77, 9.8))
+    await hass.async_block_till_done()
+    assert hass.states.get(TEMPERATURE).state == "9.8"
+
+    assert await hass.config_entries.async_reload(bridge.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][bridge.entry_id]
+    assert manager.identity.aliases == {"Nexus-TH-77": "Nexus-TH-1"}
+    await manager.async_process_message(_msg(77, 10.2))
+    await hass.async_block_till_done()
+    assert hass.states.get(TEMPERATURE).state == "10.2"
+
+async def test_neighbour_not_rebound(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test an id heard while the device still transmitted is never bound to it."""
+    device_entry, bridge = await _setup(hass)
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    with patch("custom_components.rtl_433_discover.identity.time.time", return_value=1000.0) as mock_time, \
+         patch.object(hass.config_entries.flow, "async_init"):
+        await manager.async_process_message(_msg(1, 21.0))
+        # A neighbour on the same channel, ours keeps transmitting after it showed up
+        mock_time.return_value = 1030.0
+        await manager.async_process_message(_msg(88, 4.0))
+        mock_time.return_value = 1060.0
+        await manager.async_process_message(_msg(1, 21.1))
+
+        # Ours went quiet for a while, the neighbour keeps going
+        mock_time.return_value = 1400.0
+        await manager.async_process_message(_msg(88, 4.1))
+        await hass.async_block_till_done()
+        assert manager.counters["rebound"] == 0
+        assert hass.states.get(TEMPERATURE).state == "21.1"
+
+async def test_alias_dropped_when_original_id_returns(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test a bound id is released when the device transmits with its own id again."""
+    device_entry, bridge = await _setup(hass)
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    with patch("custom_components.rtl_433_discover.identity.time.time", return_value=1000.0) as mock_time, \
+         patch.object(hass.config_entries.flow, "async_init"):
+        await manager.async_process_message(_msg(1, 21.0))
+        # Heard first after ours went quiet, so it is bound
+        mock_time.return_value = 1400.0
+        await manager.async_process_message(_msg(88, 4.1))
+        await hass.async_block_till_done()
+        assert manager.counters["rebound"] == 1
+        assert hass.states.get(TEMPERATURE).state == "4.1"
+
+        # Ours is back, the other id is a different device after all
+        mock_time.return_value = 1430.0
+        await manager.async_process_message(_msg(1, 21.1))
+        await hass.async_block_till_done()
+        assert manager.counters["unbound"] == 1
+        assert hass.states.get(TEMPERATURE).state == "21.1"
+        assert CONF_ALIAS not in device_entry.data
+        assert manager.identity.aliases == {}
+
+        await manager.async_process_message(_msg(88, 4.2))
+        await hass.async_block_till_done()
+        assert hass.states.get(TEMPERATURE).state == "21.1"
+
+async def test_no_rebind_for_other_keys(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test a new id sending keys the silent device never sent is discovered as usual."""
+    _, bridge = await _setup(hass)
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    with patch("custom_components.rtl_433_discover.device.time.time", return_value=1000.0), \
+         patch("custom_components.rtl_433_discover.identity.time.time", return_value=1400.0), \
+         patch.object(hass.config_entries.flow, "async_init") as mock_flow:
+        await manager.async_process_message(_msg(1, 9.1))
+        msg = _msg(77, 9.6)
+        msg.payload = msg.payload.replace('"humidity":50', '"wind_avg_m_s":1.2')
+        await manager.async_process_message(msg)
+        # Other channel
+        await manager.async_process_message(_msg(78, 9.6, channel=2))
+
+    assert manager.counters["rebound"] == 0
+    assert mock_flow.call_count == 2
+
+async def test_field_topics_record_slot(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test a device fed by its field topics can still be rebound from the events."""
+    device_entry, bridge = await _setup(hass, {CONF_DEVICE_TOPIC: "rtl_433/+/devices"})
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    with patch("custom_components.rtl_433_discover.identity.time.time", return_value=1000.0) as mock_time:
+        for key, value in (("temperature_C", b"9.1"), ("humidity", b"50")):
+            msg = MagicMock()
+            msg.topic = f"rtl_433/attic/devices/Nexus-TH/3/1/{key}"
+            msg.payload = value
+            manager.async_field_received(msg)
+        assert manager.identity.slots == {("Nexus-TH", 3, "attic"): "Nexus-TH-1"}
+
+        # Battery changed, the new id shows up in the events of the same receiver
+        mock_time.return_value = 1400.0
+        await manager.async_process_message(_msg(77, 9.6))
+        await hass.async_block_till_done()
+
+    assert manager.counters["rebound"] == 1
+    assert device_entry.data[CONF_ALIAS] == "Nexus-TH-77"
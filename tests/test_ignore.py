@@ -0,0 +1,60 @@
+"""Test the rtl_433 Discovery ignore matcher."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+from custom_components.rtl_433_discover.const import CONF_IGNORE_DEVICES
+from custom_components.rtl_433_discover.ignore import IgnoreMatcher
+
+def test_exact_and_bare_id() -> None:
+    """Test exact model-id and bare id entries."""
+    matcher = IgnoreMatcher.from_option("Bresser-7in1-43951, 99999")
+
+    assert matcher.is_ignored("Bresser-7in1-43951", 43951)
+    assert matcher.is_ignored("Nexus-TH-99999", 99999)
+    assert not matcher.is_ignored("Bresser-7in1-1", 1)
+
+def test_wildcards_and_regex() -> None:
+    """Test glob and regex entries."""
+    matcher = IgnoreMatcher.from_option("Acurite-*, *-1234*, re:^LaCrosse-TX\\d+-.*$")
+
+    assert matcher.is_ignored("Acurite-Tower-555", 555)
+    assert matcher.is_ignored("Nexus-TH-12345", 12345)
+    assert matcher.is_ignored("LaCrosse-TX141-7", 7)
+    assert not matcher.is_ignored("Bresser-7in1-43951", 43951)
+    # Decisions are cached per device
+    assert matcher.is_ignored("Acurite-Tower-555", 555)
+
+def test_invalid_regex() -> None:
+    """Test an invalid regex entry is skipped instead of failing the whole list."""
+    with pytest.raises(ValueError):
+        IgnoreMatcher(["re:LaCrosse-(", "Acurite-*"])
+
+    matcher = IgnoreMatcher.from_option("re:LaCrosse-(, Acurite-*")
+    assert matcher.entries == ("Acurite-*",)
+    assert matcher.is_ignored("Acurite-Tower-555", 555)
+
+def test_empty() -> None:
+    """Test an empty ignore list."""
+    matcher = IgnoreMatcher.from_option("")
+
+    assert not matcher
+    assert not matcher.is_ignored("Bresser-7in1-43951", 43951)
+
+async def test_options_update_rebuilds_matcher(hass: HomeAssistant) -> None:
+    """Test the matcher is only rebuilt when the options change."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+    assert not manager.matcher.is_ignored("Bresser-7in1-43951", 43951)
+
+    mock_entry.options = {CONF_IGNORE_DEVICES: "Bresser-*"}
+    assert not manager.matcher.is_ignored("Bresser-7in1-43951", 43951)
+
+    manager.async_update_options()
+    assert manager.matcher.is_ignored("Bresser-7in1-43951", 43951)
+    assert manager.ignored_devices == ["Bresser-*"]
@@ -0,0 +1,108 @@
+"""Test the rtl_433 Discovery bridge setup and teardown."""
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_mqtt_message
+
+from custom_components.rtl_433_discover.const import (
+    DOMAIN,
+    CONF_TOPIC_PREFIX,
+    CONF_DEVICE_TOPIC,
+    CONF_IGNORE_DEVICES,
+    CONF_KEYS,
+)
+
+PAYLOAD = '{"model":"Nexus-TH","id":1,"temperature_C":9.1}'
+
+async def test_topic_swapped_in_place(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test changing the topic moves the subscription without reloading the bridge."""
+    bridge = MockConfigEntry(domain=DOMAIN, data={CONF_TOPIC_PREFIX: "rtl_433/+/events"})
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    async_fire_mqtt_message(hass, "rtl_433/attic/events", PAYLOAD)
+    await hass.async_block_till_done()
+    assert manager.counters["messages"] == 1
+
+    hass.config_entries.async_update_entry(
+        bridge, options={CONF_TOPIC_PREFIX: "sdr/+/events", CONF_IGNORE_DEVICES: "Nexus-TH-*"}
+    )
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN][bridge.entry_id] is manager
+    assert manager.topic == "sdr/+/events"
+    assert manager.ignored_devices == ["Nexus-TH-*"]
+
+    async_fire_mqtt_message(hass, "rtl_433/attic/events", PAYLOAD)
+    async_fire_mqtt_message(hass, "sdr/attic/events", PAYLOAD)
+    await hass.async_block_till_done()
+    assert manager.counters["messages"] == 2
+    assert manager.counters["ignored"] == 1
+
+async def test_unload_unsubscribes(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test an unloaded bridge stops processing and a reload subscribes once."""
+    bridge = MockConfigEntry(domain=DOMAIN, data={CONF_TOPIC_PREFIX: "rtl_433/+/events"})
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    assert await hass.config_entries.async_reload(bridge.entry_id)
+    await hass.async_block_till_done()
+    reloaded = hass.data[DOMAIN][bridge.entry_id]
+    assert reloaded is not manager
+
+    async_fire_mqtt_message(hass, "rtl_433/attic/events", PAYLOAD)
+    await hass.async_block_till_done()
+    assert manager.counters["messages"] == 0
+    assert reloaded.counters["messages"] == 1
+
+    assert await hass.config_entries.async_unload(bridge.entry_id)
+    await hass.async_block_till_done()
+    assert bridge.entry_id not in hass.data[DOMAIN]
+
+    async_fire_mqtt_message(hass, "rtl_433/attic/events", PAYLOAD)
+    await hass.async_block_till_done()
+    assert reloaded.counters["messages"] == 1
+
+async def test_device_topic_routing(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test configured devices are updated from their field topics and skip their events."""
+    device_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Nexus-TH-1",
+        data={"unique_id": "Nexus-TH-1", "model": "Nexus-TH", CONF_KEYS: ["temperature_C"]},
+    )
+    device_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(device_entry.entry_id)
+    bridge = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_TOPIC_PREFIX: "rtl_433/+/events"},
+        options={CONF_DEVICE_TOPIC: "rtl_433/+/devices"},
+    )
+    bridge.add_to_hass(hass)
+    await hass.config_entries.async_setup(bridge.entry_id)
+    await hass.async_block_till_done()
+    manager = hass.data[DOMAIN][bridge.entry_id]
+
+    async_fire_mqtt_message(hass, "rtl_433/attic/devices/Nexus-TH/3/1/temperature_C", "9.4")
+    async_fire_mqtt_message(hass, "rtl_433/attic/devices/Nexus-TH/3/1/humidity", "52")
+    async_fire_mqtt_message(hass, "rtl_433/attic/devices/Nexus-TH/3/1/mic", "CRC")
+    async_fire_mqtt_message(hass, "rtl_433/attic/devices/Acurite-Tower/A/2/temperature_C", "3.0")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.nexus_th_1_temperature").state == "9.4"
+    assert hass.states.get("sensor.nexus_th_1_humidity").state == "52"
+    assert manager.counters["field_updates"] == 2
+
+    # The event of a device fed by its field topics is only peeked at
+    async_fire_mqtt_message(hass, "rtl_433/attic/events", PAYLOAD)
+    await hass.async_block_till_done()
+    assert manager.counters["topic_routed"] == 1
+    assert hass.states.get("sensor.nexus_th_1_temperature").state == "9.4"
+
+    # Without the option the events feed the device again
+    hass.config_entries.async_update_entry(bridge, options={})
+    await hass.async_block_till_done()
+    async_fire_mqtt_message(hass, "rtl_433/attic/devices/Nexus-TH/3/1/temperature_C", "9.8")
+    async_fire_mqtt_message(hass, "rtl_433/attic/events", PAYLOAD)
+    await hass.async_block_till_done()
+    assert manager.counters["field_updates"] == 2
+    assert hass.states.get("sensor.nexus_th_1_temperature").state == "9.1"
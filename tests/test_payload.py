@@ -0,0 +1,56 @@
+"""Test the rtl_433 Discovery payload decoding."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+from custom_components.rtl_433_discover.const import CONF_IGNORE_DEVICES, CONF_PREFILTER
+from custom_components.rtl_433_discover.payload import NO_DEVICE, parse_scalar, peek_device
+
+def test_peek_device() -> None:
+    """Test reading model and id from raw payloads."""
+    assert peek_device(b'{"time":"x","model":"Bresser-7in1","id":43951,"temperature_C":14.3}') == ("Bresser-7in1", "43951")
+    assert peek_device('{"model":"Toyota","type":"TPMS","id":"f4e3c2b1"}') == ("Toyota", "f4e3c2b1")
+    assert peek_device(b'{"model":"Nexus-TH","id":177}') == ("Nexus-TH", "177")
+    assert peek_device(b"rtl_433 version 23.11 starting") is NO_DEVICE
+    assert peek_device(b"") is NO_DEVICE
+    # Not compact, needs a full decode
+    assert peek_device(b'{"model": "Nexus-TH", "id": 177}') is None
+
+def test_parse_scalar() -> None:
+    """Test reading per-field topic values."""
+    assert parse_scalar(b"76") == 76
+    assert parse_scalar(b"14.3") == 14.3
+    assert parse_scalar("CRC") == "CRC"
+    assert parse_scalar(b"") == ""
+
+async def test_prefilter_skips_decode(hass: HomeAssistant) -> None:
+    """Test ignored and malformed packets are dropped before decoding."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {CONF_IGNORE_DEVICES: "Bresser-*", CONF_PREFILTER: True}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+
+    with patch("custom_components.rtl_433_discover.discovery_manager.json_loads") as mock_loads:
+        msg.payload = b'{"time":"x","model":"Bresser-7in1","id":43951,"temperature_C":14.3}'
+        await manager.async_process_message(msg)
+        msg.payload = b'{"time":"2025-12-14 13:29:0'
+        await manager.async_process_message(msg)
+        assert not mock_loads.called
+    assert manager.counters["ignored"] == 1
+    assert manager.counters["prefiltered"] == 1
+
+async def test_decode_failure_counted(hass: HomeAssistant) -> None:
+    """Test undecodable payloads are counted."""
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = b'{"model":"Bresser-7in1","id":4'
+    await manager.async_process_message(msg)
+    assert manager.counters["decode_failures"] == 1
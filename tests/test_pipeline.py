@@ -0,0 +1,89 @@
+"""Test the rtl_433 Discovery ingest queue."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_mqtt_message
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_TOPIC_PREFIX
+from custom_components.rtl_433_discover.pipeline import (
+    IngestQueue,
+    OVERFLOW_COALESCE,
+    OVERFLOW_DROP_OLDEST,
+)
+
+def _msg(device_id, temperature=14.3):
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = f'{{"model":"Nexus-TH","id":{device_id},"temperature_C":{temperature}}}'.encode()
+    return msg
+
+async def test_coalesce_by_device(hass: HomeAssistant) -> None:
+    """Test a queued device keeps one slot with its newest message once the queue fills up."""
+    process = AsyncMock()
+    queue = IngestQueue(process, 10, OVERFLOW_COALESCE)
+
+    # Plenty of room, back to back packets are all kept
+    kept = [_msg(1), _msg(1, 15.0), *(_msg(device_id) for device_id in range(2, 8))]
+    for msg in kept:
+        queue.async_put(msg)
+    assert queue.depth == 8
+    assert queue.coalesced == 0
+
+    # 80% full, the newest message of a device replaces its queued one
+    queue.async_put(_msg(1, 16.0))
+    newest = _msg(1, 17.0)
+    queue.async_put(newest)
+    assert queue.depth == 9
+    assert queue.coalesced == 1
+
+    task = asyncio.create_task(queue.async_run())
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert [call[0][0] for call in process.call_args_list] == [*kept, newest]
+
+async def test_drop_oldest(hass: HomeAssistant) -> None:
+    """Test the oldest message is dropped when the queue is full."""
+    process = AsyncMock()
+    queue = IngestQueue(process, 2, OVERFLOW_DROP_OLDEST)
+
+    messages = [_msg(1), _msg(1), _msg(2)]
+    for msg in messages:
+        queue.async_put(msg)
+    assert queue.depth == 2
+    assert queue.dropped == 1
+    assert queue.max_depth == 2
+
+    task = asyncio.create_task(queue.async_run())
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert [call[0][0] for call in process.call_args_list] == messages[1:]
+
+async def test_worker_survives_errors(hass: HomeAssistant) -> None:
+    """Test an error processing one message doesn't stop the worker."""
+    process = AsyncMock(side_effect=[ValueError("boom"), None])
+    queue = IngestQueue(process, 10, OVERFLOW_DROP_OLDEST)
+
+    task = asyncio.create_task(queue.async_run())
+    queue.async_put(_msg(1))
+    queue.async_put(_msg(2))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    task.cancel()
+
+    assert process.call_count == 2
+
+async def test_bridge_queues_mqtt_messages(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test the bridge hands MQTT messages to the ingest worker."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_TOPIC_PREFIX: "rtl_433/+/events"})
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    with patch.object(hass.config_entries.flow, "async_init") as mock_flow:
+        async_fire_mqtt_message(hass, "rtl_433/host/events", b'{"model":"Nexus-TH","id":1}')
+        await hass.async_block_till_done()
+        assert mock_flow.call_count == 1
+        assert mock_flow.call_args[1]["data"]["unique_id"] == "Nexus-TH-1"
@@ -0,0 +1,174 @@
+"""Test the rtl_433 Discovery sensors."""
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_THROTTLE, CONF_KEYS, DATA_DEVICES
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+from custom_components.rtl_433_discover.sensor import Rtl433Sensor
+
+SAMPLE_PAYLOAD = """
+{"time":"2025-12-14 13:28:51","model":"Bresser-7in1","id":43951,"temperature_C":14.3,"humidity":76,"wind_max_m_s":3.9,"wind_avg_m_s":3.8,"wind_dir_deg":54,"rain_mm":0,"light_klx":14.135,"light_lux":14135.0,"uv":0.6,"battery_ok":1,"mic":"CRC"}
+"""
+
+SAMPLE_KEYS = [
+    "temperature_C", "humidity", "wind_max_m_s", "wind_avg_m_s", "wind_dir_deg",
+    "rain_mm", "light_klx", "light_lux", "uv", "battery_ok",
+]
+
+async def _setup_device(hass: HomeAssistant, keys=SAMPLE_KEYS) -> MockConfigEntry:
+    """Set up a device entry for the sample payload."""
+    data = {"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1"}
+    if keys is not None:
+        data[CONF_KEYS] = list(keys)
+    entry = MockConfigEntry(domain=DOMAIN, unique_id="Bresser-7in1-43951", data=data)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+async def test_device_update(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test one packet updates all sensors of the device."""
+    await _setup_device(hass)
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.payload = SAMPLE_PAYLOAD
+    msg.topic = "rtl_433/events"
+    await manager.async_process_message(msg)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.bresser_7in1_43951_temperature").state == "14.3"
+    assert hass.states.get("sensor.bresser_7in1_43951_humidity").state == "76"
+
+async def test_sensors_created_for_seen_keys(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test only seen keys get an entity and new keys are added on first sight."""
+    entry = await _setup_device(hass, keys=["temperature_C"])
+    assert hass.states.get("sensor.bresser_7in1_43951_temperature") is not None
+    assert hass.states.get("sensor.bresser_7in1_43951_humidity") is None
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.payload = '{"model":"Bresser-7in1","id":43951,"temperature_C":14.3,"humidity":76,"mic":"CRC"}'
+    msg.topic = "rtl_433/events"
+    await manager.async_process_message(msg)
+    await manager.async_process_message(msg)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.bresser_7in1_43951_humidity").state == "76"
+    assert entry.data[CONF_KEYS] == ["humidity", "temperature_C"]
+    assert len(hass.states.async_entity_ids("sensor")) == 2
+
+async def test_sensors_share_device_record(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test sensors read ids and device info from the shared device record."""
+    await _setup_device(hass)
+    device = hass.data[DATA_DEVICES]["Bresser-7in1-43951"]
+    temperature, humidity = device.sensors["temperature_C"], device.sensors["humidity"]
+
+    assert temperature.device_info is humidity.device_info
+    assert temperature.device_info["name"] == "Bresser-7in1 43951"
+    assert temperature.unique_id == "Bresser-7in1-43951_temperature_C"
+    # Nothing of the device is copied onto the sensor
+    assert not {"_attr_unique_id", "_attr_device_info", "_attr_name"} & vars(temperature).keys()
+    entity = er.async_get(hass).async_get("sensor.bresser_7in1_43951_temperature")
+    assert entity.unique_id == temperature.unique_id
+
+async def test_signal_level_is_diagnostic(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test reception details get diagnostic sensors that start disabled."""
+    await _setup_device(hass, keys=["rssi", "temperature_C"])
+
+    entity_registry = er.async_get(hass)
+    rssi = entity_registry.async_get("sensor.bresser_7in1_43951_rssi")
+    assert rssi.entity_category == EntityCategory.DIAGNOSTIC
+    assert rssi.disabled_by == er.RegistryEntryDisabler.INTEGRATION
+    assert entity_registry.async_get("sensor.bresser_7in1_43951_temperature").disabled_by is None
+
+async def test_legacy_entry_keeps_registered_sensors(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test entries without recorded keys keep the entities they already have."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Bresser-7in1-43951",
+        data={"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1"},
+    )
+    entry.add_to_hass(hass)
+    for unique_id in ("Bresser-7in1-43951_rain_mm", "Bresser-7in1-43951_rain_mm_rate"):
+        er.async_get(hass).async_get_or_create("sensor", DOMAIN, unique_id, config_entry=entry)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.async_entity_ids("sensor") == ["sensor.rtl_433_discover_bresser_7in1_43951_rain_mm"]
+    # The rain rate is derived, not a key the device sends
+    assert hass.data[DATA_DEVICES]["Bresser-7in1-43951"].keys == {"rain_mm"}
+
+async def test_identical_reading_skips_write(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test repeated identical readings don't write state again."""
+    await _setup_device(hass)
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    msg = MagicMock()
+    msg.payload = SAMPLE_PAYLOAD
+    msg.topic = "rtl_433/events"
+
+    with patch.object(Rtl433Sensor, "async_write_ha_state") as mock_write:
+        await manager.async_process_message(msg)
+        assert mock_write.call_count == 10
+
+        await manager.async_process_message(msg)
+        await manager.async_process_message(msg)
+        assert mock_write.call_count == 10
+
+async def test_throttle_holds_and_flushes(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test throttled values are held and flushed by the shared timer."""
+    await _setup_device(hass)
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {CONF_THROTTLE: "temperature=60:1, battery_ok=0"}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    def _msg(temperature, battery_ok=1):
+        msg = MagicMock()
+        msg.topic = "rtl_433/events"
+        msg.payload = json.dumps(
+            {"model": "Bresser-7in1", "id": 43951, "temperature_C": temperature, "battery_ok": battery_ok}
+        )
+        return msg
+
+    # Patches time.monotonic itself, so the event loop clock moves along with it
+    with patch("custom_components.rtl_433_discover.throttle.time.monotonic", return_value=1000.0) as mock_time:
+        await manager.async_process_message(_msg(14.3))
+        # Small change inside the window is held, battery is never throttled
+        await manager.async_process_message(_msg(14.5, battery_ok=0))
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.bresser_7in1_43951_temperature").state == "14.3"
+        assert hass.states.get("sensor.bresser_7in1_43951_battery_ok").state == "0"
+
+        mock_time.return_value = 1010.0
+        # Change bigger than the delta is written straight away
+        await manager.async_process_message(_msg(16.0, battery_ok=0))
+        await manager.async_process_message(_msg(16.2, battery_ok=0))
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.bresser_7in1_43951_temperature").state == "16.0"
+
+        mock_time.return_value = 1071.0
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.bresser_7in1_43951_temperature").state == "16.2"
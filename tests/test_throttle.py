@@ -0,0 +1,19 @@
+"""Test the rtl_433 Discovery write throttle options."""
+import pytest
+
+from custom_components.rtl_433_discover.throttle import ThrottlePolicy, parse_throttle_option
+
+def test_parse_throttle_option() -> None:
+    """Test parsing throttle policies."""
+    assert parse_throttle_option("") == {}
+    assert parse_throttle_option("*=60:0.5, battery_ok=0, wind_speed=30") == {
+        "*": ThrottlePolicy(60, 0.5),
+        "battery_ok": ThrottlePolicy(0, None),
+        "wind_speed": ThrottlePolicy(30, None),
+    }
+
+@pytest.mark.parametrize("value", ["60", "=60", "temperature=abc", "humidity=-1"])
+def test_parse_throttle_option_invalid(value) -> None:
+    """Test malformed throttle policies are rejected."""
+    with pytest.raises(ValueError):
+        parse_throttle_option(value)
@@ -0,0 +1,99 @@
+"""Test the plausibility checks of device readings."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rtl_433_discover.const import DOMAIN, CONF_KEYS, CONF_VALIDATE
+from custom_components.rtl_433_discover.device import Rtl433Device
+from custom_components.rtl_433_discover.discovery_manager import Rtl433DiscoveryManager
+from custom_components.rtl_433_discover.fields import FIELDS, build_fields, parse_field_overrides
+from custom_components.rtl_433_discover.validate import Validator
+
+TEMPERATURE = "sensor.bresser_7in1_43951_temperature"
+RAIN = "sensor.bresser_7in1_43951_rain"
+
+def test_range_and_rate() -> None:
+    """Test out of range readings are dropped and steps need a second packet."""
+    validator = Validator(FIELDS)
+    device = Rtl433Device("Nexus-TH-1", "Nexus-TH")
+    device.last_seen = 1000.0
+
+    with patch("custom_components.rtl_433_discover.validate.time.time", return_value=1030.0):
+        payload = {"temperature_C": 21.5, "humidity": 140, "id": 1}
+        assert validator.async_check(device, payload) == 1
+        assert payload == {"temperature_C": 21.5, "id": 1}
+
+        # A glitch, the next packet is back to normal
+        assert validator.async_check(device, {"temperature_C": 64.0}) == 1
+        assert validator.async_check(device, {"temperature_C": 21.6}) == 0
+        # Moved indoors, taken once the next packet confirms it
+        assert not validator.async_check_value(device, "temperature_C", 36.0)
+        assert validator.async_check_value(device, "temperature_C", 36.1)
+        # Keys outside the catalogue and text are left alone
+        assert validator.async_check(device, {"flags": 9999, "temperature_C": "n/a"}) == 0
+
+    # Changes over a long silence are fine
+    with patch("custom_components.rtl_433_discover.validate.time.time", return_value=4600.0):
+        assert validator.async_check(device, {"temperature_C": 5.0}) == 0
+
+def test_counter_reset() -> None:
+    """Test a counter going backwards is dropped unless the next packet agrees."""
+    validator = Validator(FIELDS)
+    device = Rtl433Device("Bresser-7in1-43951", "Bresser-7in1")
+
+    assert validator.async_check_value(device, "rain_mm", 120.4)
+    assert not validator.async_check_value(device, "rain_mm", 3.2)
+    assert validator.async_check_value(device, "rain_mm", 120.4)
+    # New battery
+    assert not validator.async_check_value(device, "rain_mm", 0.0)
+    assert validator.async_check_value(device, "rain_mm", 0.0)
+    assert validator.async_check_value(device, "rain_mm", 0.3)
+
+def test_limits_from_overrides() -> None:
+    """Test field overrides widen the range and drop the rate limit of a key."""
+    validator = Validator(build_fields(parse_field_overrides("temperature_C=temperature|°C||||120|none")))
+    device = Rtl433Device("Nexus-TH-1", "Nexus-TH")
+
+    assert validator.async_check_value(device, "temperature_C", 21.5)
+    assert validator.async_check_value(device, "temperature_C", 95.0)
+    assert not validator.async_check_value(device, "temperature_C", 130.0)
+    # Other keys keep the catalogue limits
+    assert not validator.async_check_value(device, "humidity", 140)
+
+def _msg(temperature, rain):
+    msg = MagicMock()
+    msg.topic = "rtl_433/events"
+    msg.payload = f'{{"model":"Bresser-7in1","id":43951,"temperature_C":{temperature},"rain_mm":{rain}}}'
+    return msg
+
+async def test_rejected_readings_not_written(hass: HomeAssistant, mqtt_mock) -> None:
+    """Test rejected readings are counted and never reach the state machine."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="Bresser-7in1-43951",
+        data={"unique_id": "Bresser-7in1-43951", "model": "Bresser-7in1", CONF_KEYS: ["rain_mm", "temperature_C"]},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "test_entry"
+    mock_entry.options = {}
+    manager = Rtl433DiscoveryManager(hass, mock_entry)
+
+    await manager.async_process_message(_msg(12.1, 120.4))
+    await manager.async_process_message(_msg(212.1, 3.2))
+    await hass.async_block_till_done()
+    assert manager.counters["rejected"] == 2
+    assert hass.states.get(TEMPERATURE).state == "12.1"
+    assert hass.states.get(RAIN).state == "120.4"
+
+    # Turned off
+    mock_entry.options = {CONF_VALIDATE: False}
+    manager.async_update_options()
+    await manager.async_process_message(_msg(212.1, 3.2))
+    await hass.async_block_till_done()
+    assert manager.counters["rejected"] == 2
+    assert hass.states.get(TEMPERATURE).state == "212.1"